@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""CSV ingestion benchmark: csv.DictReader vs the mmap scanner (and optionally worker processes).
+
+Generates a synthetic export in which --populated of the rows already have a
+creator_group, then reads it through CSVDataSource.iter_issue_batches once
+per parser and reports rows/sec over all rows in the file.
+
+    python benchmarks/csv_parse_benchmark.py --rows 2000000 --populated 0.9 --quoted-every 0
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(BENCHMARK_DIR, '..', 'src'))
+
+def write_export(path: str, rows: int, populated: float, quoted_every: int) -> None:
+    """Rows are populated in a fixed pattern so every parser sees the same file"""
+    populated_per_100 = round(populated * 100)
+    with open(path, 'w', newline='') as f:
+        f.write("issue_id,title,creator_user_id,assigned_group,creator_group\n")
+        for i in range(rows):
+            if quoted_every and i % quoted_every == 0:
+                title = f'"Crash on save, ""{i}""\nsteps attached"'
+            else:
+                title = f"Issue {i}"
+            creator_group = f"GROUP-{i % 50}" if i % 100 < populated_per_100 else ""
+            f.write(f"ISSUE-{i},{title},USER-{i % 5000},GROUP-{i % 7},{creator_group}\n")
+
+def run(config, label: str, rows: int) -> list:
+    from data_source import CSVDataSource
+    start = time.perf_counter()
+    issue_ids = [issue_id for batch in CSVDataSource(config).iter_issue_batches(1000) for issue_id in batch.issue_ids]
+    elapsed = time.perf_counter() - start
+    print(f"{label:<16}{rows:>10}{len(issue_ids):>11}{elapsed:>9.2f}{rows / elapsed:>13.0f}")
+    return issue_ids
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--populated', type=float, default=0.9,
+                        help='Fraction of rows that already have a creator_group (default: 0.9)')
+    parser.add_argument('--quoted-every', type=int, default=0,
+                        help='Give every Nth row a quoted multi-line title (default: 0, none)')
+    parser.add_argument('--workers', type=int, default=0,
+                        help='Also run the mmap scanner on this many processes (default: off)')
+    args = parser.parse_args()
+
+    from config import Config
+    with tempfile.TemporaryDirectory() as tmp:
+        config = Config()
+        config.csv_input_path = os.path.join(tmp, 'export.csv')
+        write_export(config.csv_input_path, args.rows, args.populated, args.quoted_every)
+        size_mb = os.path.getsize(config.csv_input_path) / 1e6
+        print(f"export: {args.rows} rows, {size_mb:.0f} MB, {args.populated:.0%} populated")
+        print(f"{'parser':<16}{'rows':>10}{'missing':>11}{'seconds':>9}{'rows/s':>13}")
+
+        config.csv_parser = 'dictreader'
+        baseline = run(config, 'dictreader', args.rows)
+        config.csv_parser = 'mmap'
+        results = {'mmap': run(config, 'mmap', args.rows)}
+        if args.workers > 1:
+            config.csv_workers = args.workers
+            results[f'mmap x{args.workers}'] = run(config, f'mmap x{args.workers}', args.rows)
+
+    mismatched = [label for label, issue_ids in results.items() if issue_ids != baseline]
+    if mismatched:
+        print(f"MISMATCH against dictreader: {', '.join(mismatched)}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
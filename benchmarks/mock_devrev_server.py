@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""Local stand-in for the DevRev API endpoints used by the backfill.
+
+Implements users.self, users.list, works.update, works.list, health and rate_limit with
+configurable latency, x-ratelimit-* headers and error injection, so the
+backfill can be benchmarked without touching production.
+
+    python benchmarks/mock_devrev_server.py --port 8080 --latency lognormal:0.02:0.5 --rate-limit 500
+"""
+
+import argparse
+import asyncio
+import math
+import random
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Callable, Dict
+from aiohttp import web
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """Build a latency sampler (seconds) from 'fixed:S', 'uniform:LO:HI' or 'lognormal:MEDIAN:SIGMA'"""
+    kind, *params = spec.split(':')
+    values = [float(p) for p in params]
+    if kind == 'fixed' and len(values) == 1:
+        return lambda rng: values[0]
+    if kind == 'uniform' and len(values) == 2:
+        return lambda rng: rng.uniform(values[0], values[1])
+    if kind == 'lognormal' and len(values) == 2:
+        mu = math.log(values[0]) if values[0] > 0 else 0.0
+        return lambda rng: rng.lognormvariate(mu, values[1]) if values[0] > 0 else 0.0
+    raise ValueError(f"Invalid latency spec: {spec}")
+
+@dataclass
+class MockServerConfig:
+    latency: str = 'fixed:0.01'
+    rate_limit: int = 0          # requests per window, 0 disables throttling
+    rate_window: float = 1.0     # seconds
+    error_rate: float = 0.0      # fraction of requests answered with HTTP 500
+    throttle_rate: float = 0.0   # fraction of requests answered with a spurious 429
+    groupless_rate: float = 0.0  # fraction of users returned without group_refs
+    seed: int = 0
+
+class MockDevRevServer:
+    def __init__(self, config: MockServerConfig):
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.sample_latency = parse_latency(config.latency)
+        self.window_start = time.time()
+        self.window_count = 0
+        self.updated: Dict[str, str] = {}
+        self.stats = {'requests': 0, 'throttled': 0, 'errors': 0, 'updates': 0}
+
+    def group_for(self, user_id: str) -> str:
+        """Deterministic group per user so reruns resolve identically"""
+        checksum = zlib.crc32(user_id.encode())
+        if (checksum % 1000) / 1000 < self.config.groupless_rate:
+            return ''
+        return f"GROUP-{checksum % 100}"
+
+    def _rate_limit_headers(self) -> Dict[str, str]:
+        now = time.time()
+        if now - self.window_start >= self.config.rate_window:
+            self.window_start = now
+            self.window_count = 0
+        limit = self.config.rate_limit
+        reset = max(self.window_start + self.config.rate_window - now, 0.0)
+        return {
+            'x-ratelimit-limit': str(limit),
+            'x-ratelimit-remaining': str(max(limit - self.window_count, 0)),
+            'x-ratelimit-reset': f"{reset:.3f}"
+        }
+
+    @web.middleware
+    async def middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        """Apply latency, rate limiting and error injection to every API endpoint"""
+        if request.path == '/_stats':
+            return await handler(request)
+        self.stats['requests'] += 1
+        await asyncio.sleep(self.sample_latency(self.rng))
+
+        headers = {}
+        if self.config.rate_limit:
+            headers = self._rate_limit_headers()
+            if self.window_count >= self.config.rate_limit:
+                self.stats['throttled'] += 1
+                headers['Retry-After'] = headers['x-ratelimit-reset']
+                return web.json_response({'message': 'rate limited'}, status=429, headers=headers)
+            self.window_count += 1
+            headers['x-ratelimit-remaining'] = str(self.config.rate_limit - self.window_count)
+
+        if self.rng.random() < self.config.throttle_rate:
+            self.stats['throttled'] += 1
+            return web.json_response({'message': 'rate limited'}, status=429, headers={**headers, 'Retry-After': '0.1'})
+        if self.rng.random() < self.config.error_rate:
+            self.stats['errors'] += 1
+            return web.json_response({'message': 'internal error'}, status=500, headers=headers)
+
+        response = await handler(request)
+        response.headers.update(headers)
+        return response
+
+    async def users_self(self, request: web.Request) -> web.Response:
+        return web.json_response({'dev_user': {'id': 'DEVU-benchmark'}})
+
+    async def users_list(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        users = []
+        for user_id in body.get('ids', []):
+            group = self.group_for(user_id)
+            users.append({'id': user_id, 'group_refs': [group] if group else []})
+        return web.json_response({'users': users})
+
+    async def works_update(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        self.updated[body['id']] = body['creator_group']['id']
+        self.stats['updates'] += 1
+        return web.json_response({'work': {'id': body['id'], 'creator_group': body['creator_group']}})
+
+    async def works_list(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        works = []
+        for work_id in body.get('ids', []):
+            group = self.updated.get(work_id)
+            works.append({'id': work_id, 'creator_group': {'id': group} if group else None})
+        return web.json_response({'works': works})
+
+    async def health(self, request: web.Request) -> web.Response:
+        return web.json_response({'status': 'ok'})
+
+    async def rate_limit(self, request: web.Request) -> web.Response:
+        return web.json_response({'status': 'ok'})
+
+    async def get_stats(self, request: web.Request) -> web.Response:
+        return web.json_response(self.stats)
+
+    def build_app(self) -> web.Application:
+        app = web.Application(middlewares=[self.middleware])
+        app.router.add_get('/users.self', self.users_self)
+        app.router.add_post('/users.list', self.users_list)
+        app.router.add_post('/works.update', self.works_update)
+        app.router.add_post('/works.list', self.works_list)
+        app.router.add_get('/health', self.health)
+        app.router.add_get('/rate_limit', self.rate_limit)
+        # Not part of the DevRev API; read by the benchmark harness
+        app.router.add_get('/_stats', self.get_stats)
+        return app
+
+def main():
+    parser = argparse.ArgumentParser(description='Run a local mock DevRev API server')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--latency', default='fixed:0.01',
+                       help="fixed:S, uniform:LO:HI or lognormal:MEDIAN:SIGMA in seconds (default: fixed:0.01)")
+    parser.add_argument('--rate-limit', type=int, default=0,
+                       help='Requests allowed per window, 0 disables (default: 0)')
+    parser.add_argument('--rate-window', type=float, default=1.0,
+                       help='Rate limit window in seconds (default: 1.0)')
+    parser.add_argument('--error-rate', type=float, default=0.0,
+                       help='Fraction of requests that return HTTP 500')
+    parser.add_argument('--throttle-rate', type=float, default=0.0,
+                       help='Fraction of requests that return a spurious 429')
+    parser.add_argument('--groupless-rate', type=float, default=0.0,
+                       help='Fraction of users returned without group_refs')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    server = MockDevRevServer(MockServerConfig(
+        latency=args.latency,
+        rate_limit=args.rate_limit,
+        rate_window=args.rate_window,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        groupless_rate=args.groupless_rate,
+        seed=args.seed
+    ))
+    web.run_app(server.build_app(), host=args.host, port=args.port, print=None)
+
+if __name__ == "__main__":
+    main()
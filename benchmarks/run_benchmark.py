@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""End-to-end throughput benchmark for the backfill against the local mock server.
+
+Starts benchmarks/mock_devrev_server.py, generates a synthetic CSV export and
+drives BackfillProcessor over it once per mode, each in a fresh process so
+peak RSS is measured per run. Reports issues/sec, request latency p50/p99
+and peak RSS.
+
+    python benchmarks/run_benchmark.py --issues 20000 --modes sync,async --latency fixed:0.02
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import resource
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Tuple
+
+import requests
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(BENCHMARK_DIR, '..', 'src'))
+
+def write_issues_csv(path: str, issues: int, users: int) -> None:
+    with open(path, 'w') as f:
+        f.write("issue_id,creator_user_id,assigned_group,creator_group\n")
+        for i in range(issues):
+            f.write(f"ISSUE-{i},USER-{i % users},GROUP-{i % 7},\n")
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+def start_mock_server(args: argparse.Namespace) -> Tuple[subprocess.Popen, str]:
+    port = free_port()
+    server = subprocess.Popen([
+        sys.executable, os.path.join(BENCHMARK_DIR, 'mock_devrev_server.py'),
+        '--port', str(port),
+        '--latency', args.latency,
+        '--rate-limit', str(args.rate_limit),
+        '--error-rate', str(args.error_rate),
+        '--throttle-rate', str(args.throttle_rate)
+    ])
+    base_url = f"http://127.0.0.1:{port}/"
+    deadline = time.time() + 15
+    while time.time() < deadline:
+        try:
+            requests.get(f"{base_url}_stats", timeout=1)
+            return server, base_url
+        except requests.exceptions.ConnectionError:
+            time.sleep(0.1)
+    server.kill()
+    raise RuntimeError("Mock DevRev server did not start")
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+def record_latencies(client, latencies: List[float]) -> None:
+    """Wrap a client's _make_request (sync or async) to time every API call"""
+    make_request = client._make_request
+    if asyncio.iscoroutinefunction(make_request):
+        async def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return await make_request(*args, **kwargs)
+            finally:
+                latencies.append(time.perf_counter() - start)
+    else:
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return make_request(*args, **kwargs)
+            finally:
+                latencies.append(time.perf_counter() - start)
+    client._make_request = timed
+
+def run_single(args: argparse.Namespace) -> Dict[str, object]:
+    """Run one backfill against an already running mock server"""
+    from config import Config
+    from data_source import CSVDataSource
+    from main import BackfillProcessor
+
+    config = Config()
+    config.devrev_api_token = 'benchmark'
+    config.devrev_base_url = args.base_url
+    config.csv_input_path = args.csv
+    config.batch_size = args.batch_size
+    config.max_in_flight_batches = args.concurrent_batches
+    config.max_in_flight_requests = args.max_in_flight
+    config.api_rate_limit = args.client_rate
+    config.api_rate_burst = args.client_rate
+    config.adaptive_concurrency = args.adaptive_concurrency
+    config.verify_updates = args.verify
+    config.user_group_cache_path = ''
+    config.checkpoint_path = ''
+
+    processor = BackfillProcessor(config, use_async=args.mode == 'async')
+    processor.logger.logger.setLevel(logging.WARNING)
+    latencies: List[float] = []
+    record_latencies(processor.devrev_client, latencies)
+    if processor.async_client is not None:
+        record_latencies(processor.async_client, latencies)
+
+    start = time.perf_counter()
+    result = processor.process_issue_batches(CSVDataSource(config).iter_issue_batches(config.batch_size))
+    elapsed = time.perf_counter() - start
+
+    return {
+        'mode': args.mode,
+        'issues': result.total_processed,
+        'successful': result.successful_updates,
+        'failed': result.failed_updates,
+        'seconds': round(elapsed, 3),
+        'issues_per_sec': round(result.total_processed / elapsed, 1) if elapsed else 0.0,
+        'latency_p50_ms': round(percentile(latencies, 50) * 1000, 2),
+        'latency_p99_ms': round(percentile(latencies, 99) * 1000, 2),
+        'api_requests': len(latencies),
+        # ru_maxrss is reported in kilobytes on Linux
+        'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the backfill against a local mock DevRev server')
+    parser.add_argument('--issues', type=int, default=5000)
+    parser.add_argument('--users', type=int, default=500)
+    parser.add_argument('--modes', default='sync,async', help='Comma-separated modes to run (sync, async)')
+    parser.add_argument('--batch-size', type=int, default=100)
+    parser.add_argument('--concurrent-batches', type=int, default=1)
+    parser.add_argument('--max-in-flight', type=int, default=100)
+    parser.add_argument('--adaptive-concurrency', action='store_true',
+                       help='Use the AIMD concurrency controller, capped by --max-in-flight')
+    parser.add_argument('--verify', action='store_true',
+                       help='Also read every batch back with works.list (VERIFY_UPDATES)')
+    parser.add_argument('--client-rate', type=float, default=10000,
+                       help='Initial client rate limit in requests/sec (default: 10000)')
+    parser.add_argument('--latency', default='fixed:0.01', help='Mock server latency spec')
+    parser.add_argument('--rate-limit', type=int, default=0, help='Mock server requests per second, 0 disables')
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--throttle-rate', type=float, default=0.0)
+    parser.add_argument('--output', help='Also append JSON results to this file')
+    # Internal: run one mode in this process against an existing server
+    parser.add_argument('--single', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--mode', help=argparse.SUPPRESS)
+    parser.add_argument('--base-url', help=argparse.SUPPRESS)
+    parser.add_argument('--csv', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        logging.basicConfig(level=logging.WARNING)
+        print(json.dumps(run_single(args)))
+        return 0
+
+    server, base_url = start_mock_server(args)
+    results = []
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_path = os.path.join(tmp, 'issues.csv')
+            write_issues_csv(csv_path, args.issues, args.users)
+            for mode in args.modes.split(','):
+                child = subprocess.run(
+                    [sys.executable, __file__, '--single', '--mode', mode, '--base-url', base_url,
+                     '--csv', csv_path, '--batch-size', str(args.batch_size),
+                     '--concurrent-batches', str(args.concurrent_batches),
+                     '--max-in-flight', str(args.max_in_flight),
+                     '--client-rate', str(args.client_rate)]
+                    + (['--adaptive-concurrency'] if args.adaptive_concurrency else [])
+                    + (['--verify'] if args.verify else []),
+                    stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, check=True
+                )
+                results.append(json.loads(child.stdout.strip().splitlines()[-1]))
+        server_stats = requests.get(f"{base_url}_stats", timeout=5).json()
+    finally:
+        server.terminate()
+        server.wait()
+
+    print(f"{'mode':<8}{'issues':>8}{'issues/s':>11}{'p50 ms':>9}{'p99 ms':>9}{'rss MB':>9}{'failed':>8}")
+    for r in results:
+        print(f"{r['mode']:<8}{r['issues']:>8}{r['issues_per_sec']:>11}{r['latency_p50_ms']:>9}"
+              f"{r['latency_p99_ms']:>9}{r['peak_rss_mb']:>9}{r['failed']:>8}")
+    print(f"server: {json.dumps(server_stats)}")
+
+    if args.output:
+        with open(args.output, 'a') as f:
+            for r in results:
+                f.write(json.dumps({**r, 'params': {k: v for k, v in vars(args).items() if v is not None}}) + '\n')
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
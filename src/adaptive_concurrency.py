@@ -0,0 +1,116 @@
+import asyncio
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+class AIMDConcurrencyController:
+    """Additive-increase / multiplicative-decrease limit on in-flight API requests.
+
+    Every completed request reports its latency and outcome. While requests
+    succeed without latency inflation the limit grows by roughly one slot per
+    limit's worth of successes (one "round trip"); a 429, a 5xx/transport
+    error or a smoothed latency above latency_tolerance times the baseline
+    shrinks it by decrease_factor, at most once per smoothed round trip.
+    """
+
+    def __init__(
+        self,
+        initial_limit: float,
+        min_limit: float = 1,
+        max_limit: float = 1000,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        smoothing: float = 0.1,
+        on_change: Optional[Callable[[int], None]] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self._limit = float(min(max(initial_limit, min_limit), max_limit))
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+        self.on_change = on_change
+        self.latency_ewma: Optional[float] = None
+        self.baseline_latency: Optional[float] = None
+        self.in_flight = 0
+        self._clock = clock
+        self._last_decrease = float('-inf')
+        self._lock = threading.Lock()
+        self._slot_freed = threading.Condition(self._lock)
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    def record(self, latency: float, success: bool = True, throttled: bool = False) -> None:
+        """Feed one request outcome into the controller"""
+        with self._lock:
+            previous = self.limit
+            if success and not throttled:
+                self._observe_latency(latency)
+
+            if throttled or not success or self._latency_inflated():
+                now = self._clock()
+                # One decrease per round trip, so a burst of failures counts once
+                if now - self._last_decrease >= (self.latency_ewma or latency):
+                    self._limit = max(self.min_limit, self._limit * self.decrease_factor)
+                    self._last_decrease = now
+            else:
+                self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+
+            changed = self.limit != previous
+            if self.limit > previous:
+                self._slot_freed.notify(self.limit - previous)
+        if changed and self.on_change is not None:
+            self.on_change(self.limit)
+
+    def _observe_latency(self, latency: float) -> None:
+        if self.latency_ewma is None:
+            self.latency_ewma = self.baseline_latency = latency
+            return
+        self.latency_ewma += self.smoothing * (latency - self.latency_ewma)
+        # Track the best smoothed latency, letting it drift up slowly if the service gets slower
+        if self.latency_ewma < self.baseline_latency:
+            self.baseline_latency = self.latency_ewma
+        else:
+            self.baseline_latency += 0.01 * (self.latency_ewma - self.baseline_latency)
+
+    def _latency_inflated(self) -> bool:
+        return (
+            self.baseline_latency is not None
+            and self.latency_ewma > self.baseline_latency * self.latency_tolerance
+        )
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Block the calling thread until a request may be in flight"""
+        with self._slot_freed:
+            self._slot_freed.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+        try:
+            yield
+        finally:
+            with self._slot_freed:
+                self.in_flight -= 1
+                self._slot_freed.notify()
+
+class AsyncConcurrencyGate:
+    """asyncio counterpart of AIMDConcurrencyController.slot() for one event loop"""
+
+    def __init__(self, controller: AIMDConcurrencyController):
+        self.controller = controller
+        self.in_flight = 0
+        self._condition = asyncio.Condition()
+
+    async def __aenter__(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < self.controller.limit)
+            self.in_flight += 1
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        async with self._condition:
+            self.in_flight -= 1
+            # The limit may have grown since the last release, so wake every free slot
+            self._condition.notify(max(1, self.controller.limit - self.in_flight))
@@ -0,0 +1,219 @@
+import asyncio
+import logging
+import time
+import aiohttp
+from typing import Callable, List, Optional, Tuple
+from tenacity import retry, stop_after_attempt, wait_none, retry_if_exception_type
+from models import UserGroup
+from config import Config
+from devrev_client import (
+    DevRevAPIError, RateLimitError, AuthenticationError, CircuitOpenError, parse_user_groups
+)
+from rate_limiter import TokenBucketRateLimiter
+from adaptive_concurrency import AIMDConcurrencyController, AsyncConcurrencyGate
+from circuit_breaker import CircuitBreakerRegistry
+
+class AsyncDevRevClient:
+    """Asyncio client for the DevRev API with a bounded number of in-flight requests"""
+
+    def __init__(
+        self,
+        config: Config,
+        max_in_flight: Optional[int] = None,
+        rate_limiter: Optional[TokenBucketRateLimiter] = None,
+        concurrency: Optional[AIMDConcurrencyController] = None,
+        circuit_breakers: Optional[CircuitBreakerRegistry] = None
+    ):
+        self.config = config
+        self.logger = logging.getLogger(__name__)
+        self.circuit_breakers = circuit_breakers or CircuitBreakerRegistry(
+            failure_threshold=config.circuit_failure_threshold,
+            recovery_timeout=config.circuit_recovery_timeout,
+            half_open_max_calls=config.circuit_half_open_probes
+        )
+        # Called with (endpoint, status, seconds) after every API response or transport error
+        self.on_request: Optional[Callable[[str, str, float], None]] = None
+        # With an adaptive controller, max_in_flight only caps the connection pool
+        self.concurrency = concurrency
+        self.rate_limiter = rate_limiter or TokenBucketRateLimiter(
+            rate=config.api_rate_limit,
+            capacity=config.api_rate_burst
+        )
+        self.max_in_flight = max_in_flight or config.max_in_flight_requests
+        if self.max_in_flight <= 0:
+            raise ValueError("max_in_flight must be positive")
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore = None
+
+    async def __aenter__(self) -> 'AsyncDevRevClient':
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Lazily create the HTTP session inside the running event loop"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers={
+                    'Authorization': f'Bearer {self.config.devrev_api_token}',
+                    'Content-Type': 'application/json'
+                },
+                connector=aiohttp.TCPConnector(limit=self.max_in_flight)
+            )
+            self._semaphore = (
+                AsyncConcurrencyGate(self.concurrency) if self.concurrency
+                else asyncio.Semaphore(self.max_in_flight)
+            )
+        return self._session
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _make_request(self, method: str, endpoint: str, **kwargs) -> dict:
+        """Make a request to the DevRev API with error handling"""
+        url = f"{self.config.devrev_base_url.rstrip('/')}/{endpoint.lstrip('/')}"
+        session = self._get_session()
+        breaker = self.circuit_breakers.get(endpoint)
+
+        try:
+            # Wait on the limiter before taking a slot so paced requests don't hold connections
+            await self.rate_limiter.acquire_async()
+            if not breaker.allow_request():
+                raise CircuitOpenError(f"Circuit breaker open for {endpoint}", breaker.retry_after())
+            async with self._semaphore:
+                start = time.monotonic()
+                # Everything up to the full body counts as the transport: a body cut off mid-read
+                # (or a cancelled probe) must still report an outcome or the breaker stays half-open
+                try:
+                    response = await session.request(method, url, **kwargs)
+                    async with response:
+                        body = await response.text()
+                except BaseException:
+                    latency = time.monotonic() - start
+                    breaker.record_failure()
+                    if self.concurrency:
+                        self.concurrency.record(latency, success=False)
+                    if self.on_request:
+                        self.on_request(endpoint, 'error', latency)
+                    raise
+                latency = time.monotonic() - start
+                if response.status >= 500:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+                if self.on_request:
+                    self.on_request(endpoint, str(response.status), latency)
+                if self.concurrency:
+                    self.concurrency.record(
+                        latency,
+                        success=response.status < 500,
+                        throttled=response.status == 429
+                    )
+                self.rate_limiter.update_from_headers(response.headers)
+
+                # Handle specific error cases
+                if response.status == 429:
+                    self.rate_limiter.penalize(response.headers.get('Retry-After'))
+                    raise RateLimitError("API rate limit exceeded", response.status, body)
+                elif response.status == 401:
+                    raise AuthenticationError("Authentication failed", response.status, body)
+                elif response.status >= 400:
+                    error_msg = f"HTTP {response.status}: {body}"
+                    self.logger.error(f"API request failed: {error_msg}")
+                    raise DevRevAPIError(error_msg, response.status, body)
+
+                return await response.json(content_type=None)
+
+        except aiohttp.ClientError as e:
+            self.logger.error(f"Request failed: {str(e)}")
+            raise DevRevAPIError(f"Request failed: {str(e)}")
+        except asyncio.TimeoutError:
+            self.logger.error("Request timed out")
+            raise DevRevAPIError("Request timed out")
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_none(),  # the rate limiter already delays the retry per Retry-After
+        retry=retry_if_exception_type(RateLimitError)
+    )
+    async def get_user_groups(self, user_ids: List[str]) -> List[UserGroup]:
+        """Fetch group memberships for given users from DevRev API"""
+        if not user_ids:
+            return []
+
+        self.logger.info(f"Fetching group information for {len(user_ids)} users")
+
+        try:
+            response = await self._make_request(
+                'POST',
+                'users.list',
+                json={'ids': user_ids}
+            )
+
+            user_groups = parse_user_groups(response.get('users', []), self.logger)
+
+            self.logger.info(f"Successfully fetched groups for {len(user_groups)} users")
+            return user_groups
+
+        except DevRevAPIError as e:
+            self.logger.error(f"Error fetching user groups: {str(e)}")
+            raise
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_none(),  # the rate limiter already delays the retry per Retry-After
+        retry=retry_if_exception_type(RateLimitError)
+    )
+    async def update_issue_creator_group(self, issue_id: str, group_id: str) -> bool:
+        """Update an issue's creator group via DevRev API"""
+        try:
+            await self._make_request(
+                'POST',
+                'works.update',
+                json={
+                    'id': issue_id,
+                    'creator_group': {
+                        'id': group_id
+                    }
+                }
+            )
+            self.logger.debug(f"Successfully updated creator group for issue {issue_id}")
+            return True
+
+        except (RateLimitError, CircuitOpenError):
+            raise
+        except DevRevAPIError as e:
+            if e.status_code == 404:
+                self.logger.error(f"Issue {issue_id} not found")
+            elif e.status_code == 403:
+                self.logger.error(f"Permission denied updating issue {issue_id}")
+            else:
+                self.logger.error(f"Error updating issue {issue_id}: {str(e)}")
+            return False
+
+    async def update_issues_creator_group(self, updates: List[Tuple[str, str]]) -> List[object]:
+        """Run (issue_id, group_id) updates concurrently; results keep input order and
+        contain the raised exception for any update that failed after retries"""
+        return await asyncio.gather(
+            *(self.update_issue_creator_group(issue_id, group_id) for issue_id, group_id in updates),
+            return_exceptions=True
+        )
+
+    async def test_connection(self) -> bool:
+        """Test the API connection and credentials"""
+        try:
+            # Test connection by getting current user info
+            await self._make_request('GET', 'users.self')
+            self.logger.info("Successfully connected to DevRev API")
+            return True
+
+        except AuthenticationError:
+            self.logger.error("Authentication failed - please check your API token")
+            return False
+        except DevRevAPIError as e:
+            self.logger.error(f"DevRev API connection test failed: {str(e)}")
+            return False
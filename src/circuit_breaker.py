@@ -0,0 +1,136 @@
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+class CircuitBreaker:
+    """Closed / open / half-open breaker for a single API endpoint.
+
+    After failure_threshold consecutive failures the breaker opens and rejects
+    calls outright. Once recovery_timeout has passed it lets up to
+    half_open_max_calls probe requests through; a successful probe closes it
+    again and a failed one re-opens it for another recovery_timeout.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 10.0,
+        half_open_max_calls: int = 1,
+        on_state_change: Optional[Callable[[str, str], None]] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.on_state_change = on_state_change
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def _transition(self, state: str) -> Optional[str]:
+        if state == self.state:
+            return None
+        self.state = state
+        if state == self.OPEN:
+            self._opened_at = self._clock()
+        self._probes_in_flight = 0
+        return state
+
+    def _notify(self, state: Optional[str]) -> None:
+        if state is not None and self.on_state_change is not None:
+            self.on_state_change(self.name, state)
+
+    def allow_request(self) -> bool:
+        """Return whether a call may go out now; every allowed call must report its outcome"""
+        with self._lock:
+            changed = None
+            if self.state == self.OPEN and self._clock() - self._opened_at >= self.recovery_timeout:
+                changed = self._transition(self.HALF_OPEN)
+
+            if self.state == self.CLOSED:
+                allowed = True
+            elif self.state == self.HALF_OPEN and self._probes_in_flight < self.half_open_max_calls:
+                self._probes_in_flight += 1
+                allowed = True
+            else:
+                allowed = False
+        self._notify(changed)
+        return allowed
+
+    def retry_after(self) -> float:
+        """Seconds a rejected caller should wait before asking again"""
+        with self._lock:
+            if self.state == self.OPEN:
+                return max(self._opened_at + self.recovery_timeout - self._clock(), 0.0)
+            if self.state == self.HALF_OPEN and self._probes_in_flight >= self.half_open_max_calls:
+                # The probe's outcome decides; poll for it well within one recovery period
+                return min(self.recovery_timeout / 10, 1.0)
+            return 0.0
+
+    def record_success(self) -> None:
+        with self._lock:
+            changed = None
+            # Stragglers sent before the breaker opened don't close it; only probes do
+            if self.state != self.OPEN:
+                self.consecutive_failures = 0
+                changed = self._transition(self.CLOSED)
+        self._notify(changed)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.consecutive_failures += 1
+            changed = None
+            if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                changed = self._transition(self.OPEN)
+                if changed is None:
+                    # A straggler failing while already open restarts the recovery clock
+                    self._opened_at = self._clock()
+        self._notify(changed)
+
+class CircuitBreakerRegistry:
+    """Creates one CircuitBreaker per endpoint on first use, all with the same settings"""
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 10.0,
+        half_open_max_calls: int = 1,
+        on_state_change: Optional[Callable[[str, str], None]] = None
+    ):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.on_state_change = on_state_change
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, endpoint: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(endpoint)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    endpoint,
+                    failure_threshold=self.failure_threshold,
+                    recovery_timeout=self.recovery_timeout,
+                    half_open_max_calls=self.half_open_max_calls,
+                    on_state_change=self._state_changed
+                )
+                self._breakers[endpoint] = breaker
+            return breaker
+
+    def _state_changed(self, endpoint: str, state: str) -> None:
+        if self.on_state_change is not None:
+            self.on_state_change(endpoint, state)
+
+    def states(self) -> Dict[str, str]:
+        with self._lock:
+            return {endpoint: breaker.state for endpoint, breaker in self._breakers.items()}
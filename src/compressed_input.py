@@ -0,0 +1,119 @@
+import gzip
+import io
+import queue
+import threading
+from typing import BinaryIO, Iterable, Iterator, List, Optional
+
+GZIP_MAGIC = b'\x1f\x8b'
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+CHUNK_SIZE = 1024 * 1024
+
+def detect_compression(path: str) -> Optional[str]:
+    """Return 'gzip', 'zstd' or None from the file extension, falling back to its magic bytes"""
+    lowered = path.lower()
+    if lowered.endswith(('.gz', '.gzip')):
+        return 'gzip'
+    if lowered.endswith(('.zst', '.zstd')):
+        return 'zstd'
+    with open(path, 'rb') as f:
+        magic = f.read(4)
+    if magic.startswith(GZIP_MAGIC):
+        return 'gzip'
+    if magic == ZSTD_MAGIC:
+        return 'zstd'
+    return None
+
+def open_decompressed(path: str, compression: str) -> BinaryIO:
+    """Open path as a stream of decompressed bytes"""
+    if compression == 'gzip':
+        return gzip.open(path, 'rb')
+    if compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            raise ValueError("Reading .zst input requires zstandard; install it with `pip install zstandard`")
+        return io.BufferedReader(
+            zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), closefd=True),
+            buffer_size=CHUNK_SIZE
+        )
+    raise ValueError(f"Unknown compression: {compression}")
+
+def iter_decompressed_chunks(
+    path: str,
+    compression: str,
+    chunk_size: int = CHUNK_SIZE,
+    max_buffered: int = 4
+) -> Iterator[bytes]:
+    """Decompress path on a background thread and yield chunks of about chunk_size bytes.
+
+    zlib and zstandard release the GIL while inflating, so decompression
+    overlaps with whatever the caller does with the previous chunk. At most
+    max_buffered chunks wait in the queue.
+    """
+    chunks: queue.Queue = queue.Queue(maxsize=max_buffered)
+    stop = threading.Event()
+
+    def put(item) -> None:
+        while not stop.is_set():
+            try:
+                chunks.put(item, timeout=0.5)
+                return
+            except queue.Full:
+                continue
+
+    def decompress() -> None:
+        try:
+            with open_decompressed(path, compression) as stream:
+                while not stop.is_set():
+                    chunk = stream.read(chunk_size)
+                    if not chunk:
+                        break
+                    put(chunk)
+        except Exception as e:
+            put(e)
+        finally:
+            put(None)
+
+    threading.Thread(target=decompress, name="csv-decompress", daemon=True).start()
+    try:
+        while True:
+            chunk = chunks.get()
+            if chunk is None:
+                return
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+    finally:
+        stop.set()
+
+def iter_record_blocks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Regroup a byte stream into blocks that each end on a CSV record boundary.
+
+    A newline only ends a record when an even number of quotes precede it in
+    the stream, so quoted fields containing newlines are never split. The
+    quote parity is carried from chunk to chunk, so every byte is counted
+    once; a record spanning several chunks is only joined when it ends.
+    """
+    pending: List[bytes] = []
+    # Whether the stream read so far ends inside a quoted field
+    quoted = False
+    for chunk in chunks:
+        quoted ^= chunk.count(b'"') % 2 == 1
+        # Walk newlines back from the end of the chunk, undoing the quotes after each one
+        in_quotes, end = quoted, len(chunk)
+        boundary = chunk.rfind(b'\n')
+        while boundary != -1:
+            in_quotes ^= chunk.count(b'"', boundary, end) % 2 == 1
+            if not in_quotes:
+                break
+            end = boundary
+            boundary = chunk.rfind(b'\n', 0, boundary)
+        if boundary == -1:
+            pending.append(chunk)
+            continue
+        pending.append(chunk[:boundary + 1])
+        yield b''.join(pending)
+        pending = [chunk[boundary + 1:]]
+    rest = b''.join(pending)
+    if rest:
+        yield rest
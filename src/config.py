@@ -20,12 +20,93 @@ class Config:
     snowflake_warehouse: Optional[str] = os.getenv('SNOWFLAKE_WAREHOUSE', '')
     snowflake_database: Optional[str] = os.getenv('SNOWFLAKE_DATABASE', '')
     snowflake_schema: Optional[str] = os.getenv('SNOWFLAKE_SCHEMA', '')
+    # Stream results as Arrow batches (requires snowflake-connector-python[pandas])
+    snowflake_arrow_batches: bool = os.getenv('SNOWFLAKE_ARROW_BATCHES', 'false').lower() == 'true'
+    # Partitioned extraction: N hash partitions read concurrently with keyset pages;
+    # start keys are JSON like {"3": "ISSUE-123"} to restart single partitions
+    snowflake_partitions: int = int(os.getenv('SNOWFLAKE_PARTITIONS', '1'))
+    snowflake_page_size: int = int(os.getenv('SNOWFLAKE_PAGE_SIZE', '10000'))
+    snowflake_partition_start_keys: Optional[str] = os.getenv('SNOWFLAKE_PARTITION_START_KEYS', '')
     
     
     csv_input_path: Optional[str] = os.getenv('CSV_INPUT_PATH', 'input_data.csv')
+    # A Parquet file or a directory of *.parquet files, for --source parquet
+    parquet_input_path: Optional[str] = os.getenv('PARQUET_INPUT_PATH', 'input_data.parquet')
+    # 'mmap' filters rows on raw bytes and needs UTF-8; 'dictreader' is the csv.DictReader path
+    csv_parser: str = os.getenv('CSV_PARSER', 'mmap')
+    # 'auto' detects .gz/.zst from the extension or magic bytes and decompresses while parsing
+    csv_compression: str = os.getenv('CSV_COMPRESSION', 'auto')
+    # CSV_WORKERS > 1 parses byte ranges of CSV_CHUNK_BYTES on that many processes;
+    # with CSV_PRESERVE_ORDER=false ranges stream back as soon as they are parsed
+    csv_workers: int = int(os.getenv('CSV_WORKERS', '1'))
+    csv_chunk_bytes: int = int(os.getenv('CSV_CHUNK_BYTES', str(64 * 1024 * 1024)))
+    csv_preserve_order: bool = os.getenv('CSV_PRESERVE_ORDER', 'true').lower() == 'true'
     
 
     batch_size: int = int(os.getenv('BATCH_SIZE', '1000'))
+    max_batch_failures: int = int(os.getenv('MAX_BATCH_FAILURES', '5'))
+    
+    # Batches processed concurrently; results are yielded in input order unless disabled
+    max_in_flight_batches: int = int(os.getenv('MAX_IN_FLIGHT_BATCHES', '1'))
+    preserve_batch_order: bool = os.getenv('PRESERVE_BATCH_ORDER', 'true').lower() == 'true'
+    
+    # Async API client: upper bound on concurrent in-flight requests
+    max_in_flight_requests: int = int(os.getenv('MAX_IN_FLIGHT_REQUESTS', '100'))
+    # AIMD concurrency control: start here and adapt up to max_in_flight_requests
+    adaptive_concurrency: bool = os.getenv('ADAPTIVE_CONCURRENCY', 'false').lower() == 'true'
+    adaptive_initial_concurrency: int = int(os.getenv('ADAPTIVE_INITIAL_CONCURRENCY', '8'))
+    # Per-endpoint circuit breaker: open after N consecutive 5xx/transport failures,
+    # probe again after the recovery timeout (seconds)
+    circuit_failure_threshold: int = int(os.getenv('CIRCUIT_FAILURE_THRESHOLD', '5'))
+    circuit_recovery_timeout: float = float(os.getenv('CIRCUIT_RECOVERY_TIMEOUT', '10.0'))
+    circuit_half_open_probes: int = int(os.getenv('CIRCUIT_HALF_OPEN_PROBES', '1'))
+    # Longest an update waits for an open breaker to recover before its batch fails (seconds)
+    circuit_max_wait: float = float(os.getenv('CIRCUIT_MAX_WAIT', '300'))
+    
+    # Initial request pacing; adjusted at runtime from x-ratelimit-* response headers
+    api_rate_limit: float = float(os.getenv('API_RATE_LIMIT', '25'))
+    api_rate_burst: float = float(os.getenv('API_RATE_BURST', '25'))
+    
+    # users.list resolution: ids per request and concurrent requests
+    user_lookup_chunk_size: int = int(os.getenv('USER_LOOKUP_CHUNK_SIZE', '100'))
+    user_lookup_workers: int = int(os.getenv('USER_LOOKUP_WORKERS', '4'))
+    
+    # Post-update verification reads issues back with works.list, chunked and in parallel
+    verify_updates: bool = os.getenv('VERIFY_UPDATES', 'true').lower() == 'true'
+    verify_chunk_size: int = int(os.getenv('VERIFY_CHUNK_SIZE', '25'))
+    verify_workers: int = int(os.getenv('VERIFY_WORKERS', '4'))
+    # 'full' reads back every updated issue; 'sample' reads a sample sized for the
+    # confidence / error bound, stratified by creator group, and escalates on a mismatch
+    verify_mode: str = os.getenv('VERIFY_MODE', 'full')
+    verify_confidence: float = float(os.getenv('VERIFY_CONFIDENCE', '0.95'))
+    verify_error_bound: float = float(os.getenv('VERIFY_ERROR_BOUND', '0.01'))
+    verify_min_per_group: int = int(os.getenv('VERIFY_MIN_PER_GROUP', '5'))
+    
+    # Persistent user -> group cache; set USER_GROUP_CACHE_PATH empty to disable
+    user_group_cache_path: Optional[str] = os.getenv('USER_GROUP_CACHE_PATH', '.user_group_cache.sqlite')
+    user_group_cache_ttl: float = float(os.getenv('USER_GROUP_CACHE_TTL', str(7 * 24 * 3600)))
+    user_group_cache_negative_ttl: float = float(os.getenv('USER_GROUP_CACHE_NEGATIVE_TTL', str(24 * 3600)))
+    user_group_cache_max_entries: int = int(os.getenv('USER_GROUP_CACHE_MAX_ENTRIES', '1000000'))
+    
+    # Progress display: 'bar' (tqdm), 'log' (periodic structured log lines) or 'auto' (bar on a TTY)
+    progress_mode: str = os.getenv('PROGRESS_MODE', 'auto')
+    progress_refresh_rate: float = float(os.getenv('PROGRESS_REFRESH_RATE', '2.0'))
+    progress_log_interval: float = float(os.getenv('PROGRESS_LOG_INTERVAL', '30.0'))
+    
+    # Startup health probes run concurrently; healthy results are reused for the TTL (seconds)
+    health_check_timeout: float = float(os.getenv('HEALTH_CHECK_TIMEOUT', '5.0'))
+    health_check_cache_ttl: float = float(os.getenv('HEALTH_CHECK_CACHE_TTL', '30.0'))
+    
+    # Port for the Prometheus scrape endpoint, 0 disables it
+    metrics_port: int = int(os.getenv('METRICS_PORT', '0'))
+    
+    # JSONL plan written by --dry-run (empty disables); one in N planned operations is logged
+    dry_run_plan_path: Optional[str] = os.getenv('DRY_RUN_PLAN_PATH', 'dry_run_plan.jsonl')
+    dry_run_log_sample_every: int = int(os.getenv('DRY_RUN_LOG_SAMPLE_EVERY', '1000'))
+    
+    # Checkpoint journal used by --resume; fsyncs are grouped per sync interval (seconds)
+    checkpoint_path: Optional[str] = os.getenv('CHECKPOINT_PATH', '.backfill_checkpoint.jsonl')
+    checkpoint_sync_interval: float = float(os.getenv('CHECKPOINT_SYNC_INTERVAL', '1.0'))
     
     def validate(self) -> bool:
         """Validate required configuration"""
@@ -33,4 +114,28 @@ class Config:
             raise ValueError("DevRev API token is required")
         if not self.devrev_base_url:
             raise ValueError("DevRev base URL is required")
+        if self.csv_parser not in ('mmap', 'dictreader'):
+            raise ValueError("csv_parser must be mmap or dictreader")
+        if self.csv_compression not in ('auto', 'none', 'gzip', 'zstd'):
+            raise ValueError("csv_compression must be one of auto, none, gzip, zstd")
+        if self.csv_workers <= 0 or self.csv_chunk_bytes <= 0:
+            raise ValueError("csv_workers and csv_chunk_bytes must be positive")
+        if self.max_in_flight_batches <= 0:
+            raise ValueError("max_in_flight_batches must be positive")
+        if self.max_in_flight_requests <= 0:
+            raise ValueError("max_in_flight_requests must be positive")
+        if self.api_rate_limit <= 0:
+            raise ValueError("api_rate_limit must be positive")
+        if self.user_lookup_chunk_size <= 0 or self.user_lookup_workers <= 0:
+            raise ValueError("user_lookup_chunk_size and user_lookup_workers must be positive")
+        if self.verify_chunk_size <= 0 or self.verify_workers <= 0:
+            raise ValueError("verify_chunk_size and verify_workers must be positive")
+        if self.verify_mode not in ('full', 'sample'):
+            raise ValueError("verify_mode must be full or sample")
+        if not 0 < self.verify_confidence < 1 or not 0 < self.verify_error_bound < 1:
+            raise ValueError("verify_confidence and verify_error_bound must be between 0 and 1")
+        if self.circuit_failure_threshold <= 0 or self.circuit_half_open_probes <= 0:
+            raise ValueError("circuit_failure_threshold and circuit_half_open_probes must be positive")
+        if self.progress_mode not in ('auto', 'bar', 'log'):
+            raise ValueError("progress_mode must be one of auto, bar, log")
         return True
\ No newline at end of file
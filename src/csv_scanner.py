@@ -0,0 +1,141 @@
+import csv
+import io
+from typing import Callable, Iterator, Optional, Tuple
+
+REQUIRED_COLUMNS = ('issue_id', 'creator_user_id', 'assigned_group')
+# Bytes scanned per step; blocks with quotes go through csv.reader, the rest are split by hand
+BLOCK_SIZE = 1024 * 1024
+
+# (issue_id, creator_user_id, assigned_group, creator_group) column positions
+Columns = Tuple[int, int, int, Optional[int]]
+
+def record_boundary(f, offset: int, in_quotes: bool) -> int:
+    """Offset just past the first newline at or after offset that is outside a quoted field.
+
+    in_quotes is the quoting state at offset. Doubled quotes inside a quoted
+    field toggle the state twice, so the quote parity is all that is needed.
+    """
+    f.seek(offset)
+    position = offset
+    while True:
+        block = f.read(64 * 1024)
+        if not block:
+            return position
+        index = 0
+        while True:
+            newline = block.find(b'\n', index)
+            quote = block.find(b'"', index)
+            if quote != -1 and (newline == -1 or quote < newline):
+                in_quotes = not in_quotes
+                index = quote + 1
+            elif newline != -1:
+                if not in_quotes:
+                    return position + newline + 1
+                index = newline + 1
+            else:
+                break
+        position += len(block)
+
+def read_header(path: str) -> Tuple[Columns, int]:
+    """Resolve the column positions from the header and return them with the offset of the first record"""
+    with open(path, 'rb') as f:
+        header_end = record_boundary(f, 0, False)
+        f.seek(0)
+        return parse_header(f.read(header_end))
+
+def parse_header(buffer) -> Tuple[Columns, int]:
+    """Like read_header, for a buffer that starts with the header record"""
+    header_end = _record_end(buffer, 0, len(buffer), False)
+    header = buffer[:header_end].decode('utf-8-sig')
+    names = next(csv.reader(io.StringIO(header, newline='')), [])
+    missing = set(REQUIRED_COLUMNS) - set(names)
+    if missing:
+        raise ValueError(f"Missing required fields in CSV: {missing}")
+    positions = {name: index for index, name in enumerate(names)}
+    columns = (
+        positions['issue_id'],
+        positions['creator_user_id'],
+        positions['assigned_group'],
+        positions.get('creator_group')
+    )
+    return columns, header_end
+
+def _is_missing(value: str) -> bool:
+    value = value.strip()
+    return not value or value.lower() in ('null', 'none')
+
+def scan_missing_rows(
+    buffer,
+    start: int,
+    end: int,
+    columns: Columns,
+    on_error: Optional[Callable[[str], None]] = None,
+    block_size: int = BLOCK_SIZE
+) -> Iterator[Tuple[str, str, str]]:
+    """Yield (issue_id, creator_user_id, assigned_group) for records in buffer[start:end] missing creator_group.
+
+    buffer is usually an mmap and start must be a record boundary. The range
+    is walked in record-aligned blocks of about block_size bytes. A block
+    without quotes is split into lines and fields as raw bytes, and rows whose
+    creator_group is set are dropped there, so only the survivors are ever
+    decoded. Blocks containing quotes, whose records may span lines, go
+    through csv.reader instead.
+    """
+    id_col, creator_col, group_col, creator_group_col = columns
+    width = max(id_col, creator_col, group_col) + 1
+
+    position = start
+    while position < end:
+        block_end = min(position + block_size, end)
+        if block_end < end:
+            in_quotes = buffer[position:block_end].count(b'"') % 2 == 1
+            block_end = _record_end(buffer, block_end, end, in_quotes)
+
+        if buffer.find(b'"', position, block_end) == -1:
+            for line in buffer[position:block_end].split(b'\n'):
+                if not line or line == b'\r':
+                    continue
+                fields = line.rstrip(b'\r').split(b',')
+                if creator_group_col is not None and creator_group_col < len(fields):
+                    value = fields[creator_group_col].strip()
+                    if value and value.lower() not in (b'null', b'none'):
+                        continue
+                if len(fields) < width:
+                    if on_error is not None:
+                        on_error(f"record in bytes {position}-{block_end}: expected at least {width} fields, got {len(fields)}")
+                    continue
+                yield (
+                    fields[id_col].decode('utf-8').strip(),
+                    fields[creator_col].decode('utf-8').strip(),
+                    fields[group_col].decode('utf-8').strip()
+                )
+        else:
+            text = buffer[position:block_end].decode('utf-8')
+            for record_num, row in enumerate(csv.reader(io.StringIO(text, newline='')), 1):
+                if not row:
+                    continue
+                try:
+                    if creator_group_col is not None and creator_group_col < len(row) and not _is_missing(row[creator_group_col]):
+                        continue
+                    yield row[id_col].strip(), row[creator_col].strip(), row[group_col].strip()
+                except Exception as e:
+                    if on_error is not None:
+                        on_error(f"record {record_num} of bytes {position}-{block_end}: {str(e)}")
+        position = block_end
+
+def _record_end(buffer, offset: int, end: int, in_quotes: bool) -> int:
+    """Offset just past the first newline at or after offset that is outside a quoted field"""
+    index = offset
+    while index < end:
+        newline = buffer.find(b'\n', index, end)
+        quote = buffer.find(b'"', index, end)
+        if quote != -1 and (newline == -1 or quote < newline):
+            in_quotes = not in_quotes
+            index = quote + 1
+        elif newline != -1:
+            if not in_quotes:
+                return newline + 1
+            index = newline + 1
+        else:
+            break
+    return end
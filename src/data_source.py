@@ -1,11 +1,19 @@
 import csv
+import io
+import json
 import logging
+import mmap
+import os
+import queue
+import threading
 from abc import ABC, abstractmethod
-import snowflake.connector
-from snowflake.connector.errors import ProgrammingError, DatabaseError
-from typing import List, Optional
-from models import Issue
+from collections import deque
+from itertools import islice
+from typing import IO, Any, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+from models import Issue, IssueBatch
 from config import Config
+from csv_scanner import parse_header, read_header, scan_missing_rows
+from compressed_input import detect_compression, iter_decompressed_chunks, iter_record_blocks, open_decompressed
 
 class DataSourceError(Exception):
     """Base exception for data source errors"""
@@ -27,6 +35,51 @@ class DataSource(ABC):
         """Retrieve issues that have missing creator group information"""
         pass
 
+    @abstractmethod
+    def iter_issues_missing_creator_group(self) -> Iterator[Issue]:
+        """Lazily yield issues that have missing creator group information"""
+        pass
+
+    def iter_issue_chunks(self, chunk_size: int) -> Iterator[List[Issue]]:
+        """Yield issues with missing creator group in lists of at most chunk_size"""
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        issues = self.iter_issues_missing_creator_group()
+        while True:
+            chunk = list(islice(issues, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    def iter_issue_batches(self, batch_size: int) -> Iterator[IssueBatch]:
+        """Yield issues with missing creator group as columnar batches of at most batch_size"""
+        for chunk in self.iter_issue_chunks(batch_size):
+            yield IssueBatch.from_issues(chunk)
+
+    def count_issues_missing_creator_group(self) -> Optional[int]:
+        """Number of issues missing creator group if metadata gives it away, else None.
+
+        Only cheap counts belong here: this runs before the first update is
+        sent, so sources that would have to scan their input return None.
+        """
+        return None
+
+    def track_resume_positions(self, positions: Optional[Dict[str, Any]] = None) -> bool:
+        """Track how far the input is finished, continuing after positions a checkpoint saved.
+
+        Returns False for sources that can't start part-way; a resumed run of
+        those re-reads the input and relies on the completed ids alone.
+        """
+        return False
+
+    def acknowledge(self, issue_ids: Iterable[str]) -> None:
+        """Mark issues as finished so the tracked positions can move past them"""
+        pass
+
+    def resume_positions(self) -> Optional[Dict[str, Any]]:
+        """Positions before which every issue has been acknowledged, for the checkpoint"""
+        return None
+
     @abstractmethod
     def test_connection(self) -> bool:
         """Test the connection to the data source"""
@@ -42,7 +95,7 @@ class CSVDataSource(DataSource):
     def test_connection(self) -> bool:
         """Test if the CSV file is accessible and has the required format"""
         try:
-            with open(self.config.csv_input_path, 'r') as f:
+            with self._open_text() as f:
                 reader = csv.DictReader(f)
                 required_fields = {'issue_id', 'creator_user_id', 'assigned_group'}
                 header_fields = set(reader.fieldnames or [])
@@ -72,9 +125,130 @@ class CSVDataSource(DataSource):
 
     def get_issues_missing_creator_group(self) -> List[Issue]:
         """Read issues from CSV file where creator_group is missing"""
+        issues = list(self.iter_issues_missing_creator_group())
+        self.logger.info(f"Found {len(issues)} issues with missing creator group in CSV")
+        return issues
+
+    def iter_issues_missing_creator_group(self) -> Iterator[Issue]:
+        """Stream issues from CSV file where creator_group is missing, one row at a time"""
+        if self._use_workers():
+            for batch in self._iter_parallel_batches():
+                yield from batch
+            return
+
+        for issue_id, creator_user_id, assigned_group in self._iter_missing_rows():
+            yield Issue(
+                issue_id=issue_id,
+                creator_user_id=creator_user_id,
+                assigned_group=assigned_group,
+                creator_group=None
+            )
+
+    def iter_issue_batches(self, batch_size: int) -> Iterator[IssueBatch]:
+        """Stream rows missing creator_group straight into columnar batches"""
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        if self._use_workers():
+            for chunk in self._iter_parallel_batches():
+                yield from chunk.split(batch_size)
+            return
+
+        batch = IssueBatch()
+        for issue_id, creator_user_id, assigned_group in self._iter_missing_rows():
+            batch.append(issue_id, creator_user_id, assigned_group)
+            if len(batch) == batch_size:
+                yield batch
+                batch = IssueBatch()
+        if len(batch):
+            yield batch
+
+    def _compression(self) -> Optional[str]:
+        if self.config.csv_compression == 'auto':
+            return detect_compression(self.config.csv_input_path)
+        return None if self.config.csv_compression == 'none' else self.config.csv_compression
+
+    def _open_text(self) -> IO[str]:
+        """Open the input as text, decompressing it on the fly if needed"""
+        compression = self._compression()
+        if compression is None:
+            return open(self.config.csv_input_path, 'r')
+        return io.TextIOWrapper(open_decompressed(self.config.csv_input_path, compression))
+
+    def _use_workers(self) -> bool:
+        if self.config.csv_workers <= 1:
+            return False
+        if self._compression() is not None:
+            # A compressed stream has no byte offsets to split on
+            self.logger.warning("CSV_WORKERS is ignored for compressed input; decompressing on one stream")
+            return False
+        return True
+
+    def _iter_parallel_batches(self) -> Iterator[IssueBatch]:
+        """Parse the file on csv_workers processes, one batch per record-aligned byte range"""
+        # Process pools are only needed for parallel runs; keep them out of startup
+        from parallel_csv import iter_csv_ranges
         try:
-            issues = []
-            with open(self.config.csv_input_path, 'r') as f:
+            yield from iter_csv_ranges(
+                self.config.csv_input_path,
+                workers=self.config.csv_workers,
+                chunk_bytes=self.config.csv_chunk_bytes,
+                preserve_order=self.config.csv_preserve_order
+            )
+        except Exception as e:
+            raise DataSourceError(f"Error reading CSV file: {str(e)}")
+
+    def _iter_missing_rows(self) -> Iterator[Tuple[str, str, str]]:
+        """Yield (issue_id, creator_user_id, assigned_group) for rows with an empty creator_group"""
+        if self.config.csv_parser == 'dictreader':
+            return self._iter_dictreader_rows()
+        return self._iter_scanned_rows()
+
+    def _iter_scanned_rows(self) -> Iterator[Tuple[str, str, str]]:
+        """Memory-map the file and drop rows with a creator_group before decoding them"""
+        compression = self._compression()
+        if compression is not None:
+            yield from self._iter_decompressed_rows(compression)
+            return
+
+        try:
+            columns, header_end = read_header(self.config.csv_input_path)
+            with open(self.config.csv_input_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size <= header_end:
+                    return
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    yield from scan_missing_rows(
+                        buffer,
+                        header_end,
+                        len(buffer),
+                        columns,
+                        on_error=lambda error: self.logger.error(f"Error processing {error}")
+                    )
+        except Exception as e:
+            raise DataSourceError(f"Error reading CSV file: {str(e)}")
+
+    def _iter_decompressed_rows(self, compression: str) -> Iterator[Tuple[str, str, str]]:
+        """Scan compressed input block by block while a background thread decompresses the next one"""
+        try:
+            columns = None
+            chunks = iter_decompressed_chunks(self.config.csv_input_path, compression)
+            for block in iter_record_blocks(chunks):
+                start = 0
+                if columns is None:
+                    columns, start = parse_header(block)
+                yield from scan_missing_rows(
+                    block,
+                    start,
+                    len(block),
+                    columns,
+                    on_error=lambda error: self.logger.error(f"Error processing {error}")
+                )
+        except Exception as e:
+            raise DataSourceError(f"Error reading CSV file: {str(e)}")
+
+    def _iter_dictreader_rows(self) -> Iterator[Tuple[str, str, str]]:
+        """Parse every row with csv.DictReader and keep those with an empty creator_group"""
+        try:
+            with self._open_text() as f:
                 reader = csv.DictReader(f)
                 row_num = 0
                 
@@ -82,15 +256,15 @@ class CSVDataSource(DataSource):
                     row_num += 1
                     try:
                         # Only include issues where creator_group is empty or null
-                        creator_group = row.get('creator_group', '').strip()
+                        creator_group = (row.get('creator_group') or '').strip()
                         if not creator_group or creator_group.lower() in ('null', 'none', ''):
-                            issue = Issue(
-                                issue_id=row['issue_id'].strip(),
-                                creator_user_id=row['creator_user_id'].strip(),
-                                assigned_group=row['assigned_group'].strip(),
-                                creator_group=None
+                            fields = (
+                                row['issue_id'].strip(),
+                                row['creator_user_id'].strip(),
+                                row['assigned_group'].strip()
                             )
-                            issues.append(issue)
+                        else:
+                            continue
                             
                     except KeyError as e:
                         self.logger.error(f"Missing required field in row {row_num}: {str(e)}")
@@ -98,25 +272,70 @@ class CSVDataSource(DataSource):
                     except Exception as e:
                         self.logger.error(f"Error processing row {row_num}: {str(e)}")
                         continue
-            
-            self.logger.info(f"Found {len(issues)} issues with missing creator group in CSV")
-            return issues
+
+                    yield fields
             
         except Exception as e:
             raise DataSourceError(f"Error reading CSV file: {str(e)}")
 
+class _PartitionPage:
+    """A keyset page of one partition whose issues are not all acknowledged yet"""
+    __slots__ = ('partition', 'last_key', 'pending')
+
+    def __init__(self, partition: int, last_key: Any):
+        self.partition = partition
+        self.last_key = last_key
+        self.pending = 0
+
 class SnowflakeDataSource(DataSource):
     """Handles reading issue data from Snowflake"""
     
+    MISSING_CREATOR_GROUP_QUERY = """
+        SELECT 
+            issue_id,
+            creator_user_id,
+            assigned_group,
+            creator_group
+        FROM issues 
+        WHERE creator_group IS NULL
+        ORDER BY issue_id
+        """
+    
+    # One keyset page of one hash partition of the key space
+    PARTITION_PAGE_QUERY = """
+        SELECT 
+            issue_id,
+            creator_user_id,
+            assigned_group,
+            creator_group
+        FROM issues 
+        WHERE creator_group IS NULL
+          AND MOD(ABS(HASH(issue_id)), %(partitions)s) = %(partition)s
+          AND (%(last_key)s IS NULL OR issue_id > %(last_key)s)
+        ORDER BY issue_id
+        LIMIT %(page_size)s
+        """
+    
     def __init__(self, config: Config):
         self.config = config
         self.logger = logging.getLogger(__name__)
         self._connection = None
+        # Key per partition that it can restart after: the end of its last page that was fully
+        # handed out or, while tracking resume positions, fully acknowledged
+        self.partition_positions: Dict[int, Any] = {}
+        self._resume_keys: Dict[int, Any] = {}
+        # Set by track_resume_positions(): each partition's unfinished pages in key order
+        self._open_pages: Optional[Dict[int, Deque[_PartitionPage]]] = None
+        self._page_of: Dict[str, _PartitionPage] = {}
+        self._positions_lock = threading.Lock()
 
     @property
     def connection(self):
         """Lazy connection to Snowflake"""
         if self._connection is None:
+            # The connector takes hundreds of milliseconds to import; only pay for it here
+            import snowflake.connector
+            from snowflake.connector.errors import DatabaseError
             try:
                 self._connection = snowflake.connector.connect(
                     account=self.config.snowflake_account,
@@ -154,48 +373,472 @@ class SnowflakeDataSource(DataSource):
 
     def get_issues_missing_creator_group(self) -> List[Issue]:
         """Query Snowflake for issues with missing creator group"""
-        query = """
-        SELECT 
-            issue_id,
-            creator_user_id,
-            assigned_group,
-            creator_group
-        FROM issues 
-        WHERE creator_group IS NULL
-        ORDER BY issue_id
+        issues = list(self.iter_issues_missing_creator_group())
+        self.logger.info(f"Found {len(issues)} issues with missing creator group in Snowflake")
+        return issues
+
+    def _rows_to_issues(self, rows: List[tuple]) -> List[Issue]:
+        issues = []
+        for row in rows:
+            try:
+                issues.append(Issue(
+                    issue_id=str(row[0]),
+                    creator_user_id=str(row[1]),
+                    assigned_group=str(row[2]),
+                    creator_group=row[3]
+                ))
+            except Exception as e:
+                self.logger.error(f"Error processing Snowflake row {row}: {str(e)}")
+        return issues
+
+    def _rows_to_batch(self, rows: List[tuple]) -> IssueBatch:
+        batch = IssueBatch()
+        for row in rows:
+            try:
+                batch.append(str(row[0]), str(row[1]), str(row[2]), row[3])
+            except Exception as e:
+                self.logger.error(f"Error processing Snowflake row {row}: {str(e)}")
+        return batch
+
+    def iter_issue_batches(self, batch_size: int) -> Iterator[IssueBatch]:
+        """Stream columnar batches from Arrow result batches or fetchmany pages.
+
+        Partitioned reads fall back to chunking the merged issue stream.
         """
-        
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        if self.config.snowflake_partitions > 1:
+            yield from super().iter_issue_batches(batch_size)
+            return
+
+        if self.config.snowflake_arrow_batches:
+            for chunk in self.iter_arrow_issue_chunks():
+                yield from chunk.split(batch_size)
+            return
+
+        from snowflake.connector.errors import ProgrammingError
         try:
             with self.connection.cursor() as cursor:
-                cursor.execute(query)
-                results = cursor.fetchall()
+                cursor.execute(self.MISSING_CREATOR_GROUP_QUERY)
                 
-                issues = []
-                for row in results:
-                    try:
-                        issue = Issue(
-                            issue_id=str(row[0]),
-                            creator_user_id=str(row[1]),
-                            assigned_group=str(row[2]),
-                            creator_group=row[3]
-                        )
-                        issues.append(issue)
-                    except Exception as e:
-                        self.logger.error(f"Error processing Snowflake row {row}: {str(e)}")
-                        continue
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    
+                    batch = self._rows_to_batch(rows)
+                    if len(batch):
+                        yield batch
+                
+        except ProgrammingError as e:
+            raise QueryError(f"Snowflake query failed: {str(e)}")
+        except Exception as e:
+            raise DataSourceError(f"Error retrieving data from Snowflake: {str(e)}")
+
+    def iter_issues_missing_creator_group(self) -> Iterator[Issue]:
+        """Stream issues with missing creator group, fetching batch_size rows at a time"""
+        if self.config.snowflake_partitions > 1:
+            start_keys = json.loads(self.config.snowflake_partition_start_keys or '{}')
+            start_keys = {int(p): key for p, key in start_keys.items()}
+            # A checkpoint knows what was finished, which a restart hint from an error message may not
+            start_keys.update(self._resume_keys)
+            yield from self.iter_partitioned_issues(self.config.snowflake_partitions, start_keys=start_keys)
+            return
+
+        if self.config.snowflake_arrow_batches:
+            for chunk in self.iter_arrow_issue_chunks():
+                yield from chunk
+            return
+
+        from snowflake.connector.errors import ProgrammingError
+        try:
+            with self.connection.cursor() as cursor:
+                cursor.execute(self.MISSING_CREATOR_GROUP_QUERY)
+                
+                while True:
+                    rows = cursor.fetchmany(self.config.batch_size)
+                    if not rows:
+                        break
+                    
+                    yield from self._rows_to_issues(rows)
+                
+        except ProgrammingError as e:
+            raise QueryError(f"Snowflake query failed: {str(e)}")
+        except Exception as e:
+            raise DataSourceError(f"Error retrieving data from Snowflake: {str(e)}")
+
+    def iter_arrow_issue_chunks(self) -> Iterator[IssueBatch]:
+        """Yield one IssueBatch per Arrow result batch as the connector downloads it.
+
+        Columns are cast to strings with Arrow compute kernels and converted a
+        whole column at a time, avoiding per-row str() calls on Python tuples
+        and per-row Issue objects.
+        Requires pyarrow (snowflake-connector-python[pandas]).
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.compute as pc
+        except ImportError:
+            raise DataSourceError(
+                "Arrow batch streaming requires pyarrow; "
+                "install snowflake-connector-python[pandas]"
+            )
+        from snowflake.connector.errors import ProgrammingError
+
+        try:
+            with self.connection.cursor() as cursor:
+                cursor.execute(self.MISSING_CREATOR_GROUP_QUERY)
                 
-                self.logger.info(f"Found {len(issues)} issues with missing creator group in Snowflake")
-                return issues
+                for table in cursor.fetch_arrow_batches():
+                    ids, creators, groups, creator_groups = (
+                        pc.cast(table.column(i), pa.string()).to_pylist()
+                        for i in range(4)
+                    )
+                    yield IssueBatch.from_columns(ids, creators, groups, creator_groups)
                 
         except ProgrammingError as e:
             raise QueryError(f"Snowflake query failed: {str(e)}")
         except Exception as e:
             raise DataSourceError(f"Error retrieving data from Snowflake: {str(e)}")
 
+    def iter_partitioned_issues(
+        self,
+        partitions: int,
+        start_keys: Optional[Dict[int, Any]] = None
+    ) -> Iterator[Issue]:
+        """Read HASH(issue_id) partitions concurrently, each with keyset pagination.
+
+        Every partition runs on its own thread and cursor, issuing
+        `issue_id > last_key ... LIMIT page_size` queries, and hands pages to
+        the caller through a bounded queue. start_keys resumes individual
+        partitions after the given issue_id; a failing partition reports the
+        key to restart it from.
+
+        partition_positions only moves past a page once all of it has been
+        handed out or, after track_resume_positions(), acknowledged.
+        """
+        start_keys = start_keys or {}
+        self.partition_positions.update(start_keys)
+        page_size = self.config.snowflake_page_size
+        pages: queue.Queue = queue.Queue(maxsize=partitions * 2)
+        stop = threading.Event()
+
+        def put(item: tuple) -> None:
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.5)
+                    return
+                except queue.Full:
+                    continue
+
+        def read_partition(partition: int) -> None:
+            last_key = start_keys.get(partition)
+            try:
+                with self.connection.cursor() as cursor:
+                    while not stop.is_set():
+                        cursor.execute(self.PARTITION_PAGE_QUERY, {
+                            'partitions': partitions,
+                            'partition': partition,
+                            'last_key': last_key,
+                            'page_size': page_size
+                        })
+                        rows = cursor.fetchall()
+                        if not rows:
+                            break
+                        last_key = rows[-1][0]
+                        put((partition, last_key, self._rows_to_issues(rows)))
+                        if len(rows) < page_size:
+                            break
+            except Exception as e:
+                put((partition, last_key, e))
+            finally:
+                put((partition, last_key, None))
+
+        workers = [
+            threading.Thread(target=read_partition, args=(partition,), daemon=True)
+            for partition in range(partitions)
+        ]
+        for worker in workers:
+            worker.start()
+
+        try:
+            remaining = partitions
+            while remaining:
+                partition, last_key, page = pages.get()
+                if page is None:
+                    remaining -= 1
+                    self.logger.info(f"Snowflake partition {partition} finished at key {last_key!r}")
+                elif isinstance(page, Exception):
+                    raise QueryError(
+                        f"Snowflake partition {partition} failed after key {last_key!r} "
+                        f"(restart with start key {{{partition}: {last_key!r}}}): {str(page)}"
+                    )
+                elif self._open_pages is not None:
+                    self._open_page(partition, last_key, page)
+                    yield from page
+                else:
+                    yield from page
+                    self.partition_positions[partition] = last_key
+        finally:
+            stop.set()
+
+    def track_resume_positions(self, positions: Optional[Dict[str, Any]] = None) -> bool:
+        """Track partition keys for partitioned reads, restarting each partition after a saved key"""
+        if self.config.snowflake_partitions <= 1:
+            return False
+        with self._positions_lock:
+            self._open_pages = {}
+            self._page_of = {}
+        if positions:
+            if positions.get('partitions') != self.config.snowflake_partitions:
+                self.logger.warning(
+                    f"Checkpoint partition keys are for {positions.get('partitions')} partitions, "
+                    f"not {self.config.snowflake_partitions}; reading every partition from the start"
+                )
+            else:
+                self._resume_keys = {int(p): key for p, key in positions['keys'].items()}
+                self.logger.info(f"Resuming Snowflake partitions after keys {self._resume_keys}")
+        return True
+
+    def _open_page(self, partition: int, last_key: Any, issues: List[Issue]) -> None:
+        page = _PartitionPage(partition, last_key)
+        with self._positions_lock:
+            for issue in issues:
+                self._page_of[issue.issue_id] = page
+                page.pending += 1
+            self._open_pages.setdefault(partition, deque()).append(page)
+            self._close_finished_pages(partition)
+
+    def _close_finished_pages(self, partition: int) -> None:
+        """Move the partition's position past its leading fully acknowledged pages (lock must be held)"""
+        pages = self._open_pages[partition]
+        while pages and pages[0].pending == 0:
+            self.partition_positions[partition] = pages.popleft().last_key
+
+    def acknowledge(self, issue_ids: Iterable[str]) -> None:
+        """Count issues as finished; a page is closed once all of its issues and earlier pages are"""
+        if self._open_pages is None:
+            return
+        with self._positions_lock:
+            partitions = set()
+            for issue_id in issue_ids:
+                page = self._page_of.pop(issue_id, None)
+                if page is not None:
+                    page.pending -= 1
+                    partitions.add(page.partition)
+            for partition in partitions:
+                self._close_finished_pages(partition)
+
+    def resume_positions(self) -> Optional[Dict[str, Any]]:
+        """The partition count and, per partition, the key it can restart after"""
+        if self._open_pages is None:
+            return None
+        with self._positions_lock:
+            if not self.partition_positions:
+                return None
+            return {
+                'partitions': self.config.snowflake_partitions,
+                'keys': {str(partition): key for partition, key in sorted(self.partition_positions.items())}
+            }
+
     def __del__(self):
         """Clean up Snowflake connection"""
         if self._connection:
             try:
                 self._connection.close()
             except Exception as e:
-                self.logger.error(f"Error closing Snowflake connection: {str(e)}")
\ No newline at end of file
+                self.logger.error(f"Error closing Snowflake connection: {str(e)}")
+
+class ParquetDataSource(DataSource):
+    """Reads issues from Parquet exports: one file or a directory of *.parquet files.
+
+    Only the issue columns are read. A creator_group is missing when it is
+    null or, as in CSV input, blank or 'null'/'none' in any case. Row groups
+    whose statistics rule that out are skipped without being read; the rest
+    are filtered with Arrow compute and streamed as IssueBatches.
+    """
+
+    REQUIRED_COLUMNS = ('issue_id', 'creator_user_id', 'assigned_group')
+
+    def __init__(self, config: Config):
+        self.config = config
+        self.logger = logging.getLogger(__name__)
+        self.row_groups_read = 0
+        self.row_groups_skipped = 0
+
+    def _paths(self) -> List[str]:
+        path = self.config.parquet_input_path
+        if os.path.isdir(path):
+            return sorted(
+                os.path.join(path, name) for name in os.listdir(path)
+                if name.endswith('.parquet')
+            )
+        return [path]
+
+    @staticmethod
+    def _import_pyarrow():
+        try:
+            import pyarrow as pa
+            import pyarrow.compute as pc
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise DataSourceError("Parquet input requires pyarrow; install it with `pip install pyarrow`")
+        return pa, pc, pq
+
+    def test_connection(self) -> bool:
+        """Test that every input file is readable Parquet with the required columns"""
+        try:
+            _, _, pq = self._import_pyarrow()
+            paths = self._paths()
+            if not paths:
+                self.logger.error(f"No Parquet files found in {self.config.parquet_input_path}")
+                return False
+            for path in paths:
+                missing = set(self.REQUIRED_COLUMNS) - set(pq.ParquetFile(path).schema_arrow.names)
+                if missing:
+                    self.logger.error(f"Missing required fields in {path}: {missing}")
+                    return False
+            return True
+        except FileNotFoundError:
+            self.logger.error(f"Parquet input not found: {self.config.parquet_input_path}")
+            return False
+        except Exception as e:
+            self.logger.error(f"Error testing Parquet input: {str(e)}")
+            return False
+
+    def get_issues_missing_creator_group(self) -> List[Issue]:
+        """Read issues with missing creator group from the Parquet input"""
+        issues = list(self.iter_issues_missing_creator_group())
+        self.logger.info(f"Found {len(issues)} issues with missing creator group in Parquet input")
+        return issues
+
+    def iter_issues_missing_creator_group(self) -> Iterator[Issue]:
+        """Stream issues with missing creator group, decoded one batch at a time"""
+        for batch in self.iter_issue_batches(self.config.batch_size):
+            yield from batch
+
+    @staticmethod
+    def _may_have_missing_groups(statistics) -> bool:
+        """False only when row group statistics prove creator_group is never null, blank, 'null' or 'none'"""
+        if statistics is None or not statistics.has_null_count or statistics.null_count > 0:
+            return True
+        if not statistics.has_min_max or not isinstance(statistics.min, str) or not statistics.min:
+            return True
+        low, high = statistics.min, statistics.max
+        # Blank values start with ASCII whitespace (sorting at or below ' ') or non-ASCII whitespace
+        if low[0] <= ' ' or high[0] >= '\x80':
+            return True
+        # 'null' and 'none' in any case start with 'N' or 'n'
+        return any(low < chr(ord(initial) + 1) and high >= initial for initial in 'Nn')
+
+    @staticmethod
+    def _missing_group_mask(pa, pc, creator_group):
+        """True where creator_group is null, blank or 'null'/'none' in any case, like the CSV scanner"""
+        normalized = pc.utf8_lower(pc.utf8_trim_whitespace(pc.cast(creator_group, pa.string())))
+        return pc.or_(
+            pc.is_null(creator_group),
+            pc.fill_null(pc.is_in(normalized, value_set=pa.array(['', 'null', 'none'])), False)
+        )
+
+    @staticmethod
+    def _creator_group_column(metadata) -> Optional[int]:
+        return next(
+            (i for i in range(metadata.num_columns) if metadata.schema.column(i).path == 'creator_group'),
+            None
+        )
+
+    def _candidate_row_groups(self, metadata) -> List[int]:
+        """Row groups whose statistics don't rule out a missing creator_group"""
+        column = self._creator_group_column(metadata)
+        # Without a creator_group column every issue is missing one
+        return [
+            row_group for row_group in range(metadata.num_row_groups)
+            if column is None
+            or self._may_have_missing_groups(metadata.row_group(row_group).column(column).statistics)
+        ]
+
+    def _row_groups_to_read(self, parquet_file, path: str) -> List[int]:
+        metadata = parquet_file.metadata
+        row_groups = self._candidate_row_groups(metadata)
+        skipped = metadata.num_row_groups - len(row_groups)
+        self.row_groups_read += len(row_groups)
+        self.row_groups_skipped += skipped
+        self.logger.info(f"{path}: reading {len(row_groups)} of {metadata.num_row_groups} row groups")
+        return row_groups
+
+    def count_issues_missing_creator_group(self) -> Optional[int]:
+        """Count from footer metadata alone; None once a row group's statistics can't decide"""
+        _, _, pq = self._import_pyarrow()
+        total = 0
+        try:
+            for path in self._paths():
+                metadata = pq.ParquetFile(path).metadata
+                column = self._creator_group_column(metadata)
+                for row_group in self._candidate_row_groups(metadata):
+                    num_rows = metadata.row_group(row_group).num_rows
+                    statistics = None if column is None else metadata.row_group(row_group).column(column).statistics
+                    # Without the column every row is missing a group; with it, only an all-null group is certain
+                    if column is not None and (
+                        statistics is None or not statistics.has_null_count or statistics.null_count != num_rows
+                    ):
+                        return None
+                    total += num_rows
+        except Exception as e:
+            self.logger.warning(f"Could not count Parquet rows missing creator group: {str(e)}")
+            return None
+        return total
+
+    def iter_issue_batches(self, batch_size: int) -> Iterator[IssueBatch]:
+        """Stream filtered record batches, regrouped into IssueBatches of batch_size rows"""
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        pa, pc, pq = self._import_pyarrow()
+
+        def to_issue_batch(table) -> IssueBatch:
+            ids, creators, groups = (table.column(name).to_pylist() for name in self.REQUIRED_COLUMNS)
+            return IssueBatch.from_columns(ids, creators, groups, [None] * table.num_rows)
+
+        pending: list = []
+        pending_rows = 0
+        try:
+            for path in self._paths():
+                parquet_file = pq.ParquetFile(path)
+                has_creator_group = 'creator_group' in parquet_file.schema_arrow.names
+                row_groups = self._row_groups_to_read(parquet_file, path)
+                if not row_groups:
+                    continue
+
+                columns = list(self.REQUIRED_COLUMNS) + (['creator_group'] if has_creator_group else [])
+                for record_batch in parquet_file.iter_batches(
+                    batch_size=batch_size,
+                    row_groups=row_groups,
+                    columns=columns
+                ):
+                    if has_creator_group:
+                        record_batch = record_batch.filter(
+                            self._missing_group_mask(pa, pc, record_batch.column('creator_group'))
+                        )
+                    if not record_batch.num_rows:
+                        continue
+                    # Files may disagree on types (e.g. integer ids); buffer everything as strings
+                    pending.append(pa.RecordBatch.from_arrays(
+                        [pc.cast(record_batch.column(name), pa.string()) for name in self.REQUIRED_COLUMNS],
+                        names=list(self.REQUIRED_COLUMNS)
+                    ))
+                    pending_rows += record_batch.num_rows
+                    if pending_rows < batch_size:
+                        continue
+
+                    table = pa.Table.from_batches(pending)
+                    full = pending_rows - pending_rows % batch_size
+                    for offset in range(0, full, batch_size):
+                        yield to_issue_batch(table.slice(offset, batch_size))
+                    rest = table.slice(full)
+                    pending, pending_rows = rest.to_batches(), rest.num_rows
+
+            if pending_rows:
+                yield to_issue_batch(pa.Table.from_batches(pending))
+        except DataSourceError:
+            raise
+        except Exception as e:
+            raise DataSourceError(f"Error reading Parquet input: {str(e)}")
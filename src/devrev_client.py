@@ -1,9 +1,20 @@
 import logging
+import time
 import requests
-from typing import List, Dict, Optional
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, List, Dict, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from tenacity import (
+    retry, stop_after_attempt, wait_none, wait_exponential,
+    retry_if_exception, retry_if_exception_type
+)
 from models import UserGroup
 from config import Config
+from rate_limiter import TokenBucketRateLimiter
+from user_group_cache import UserGroupCache
+from adaptive_concurrency import AIMDConcurrencyController
+from circuit_breaker import CircuitBreakerRegistry
 
 class DevRevAPIError(Exception):
     """Base exception for DevRev API errors"""
@@ -20,13 +31,83 @@ class AuthenticationError(DevRevAPIError):
     """Raised when authentication fails"""
     pass
 
+class CircuitOpenError(DevRevAPIError):
+    """Raised without calling the API while an endpoint's circuit breaker is open"""
+    def __init__(self, message: str, retry_after: float = 0.0):
+        # Seconds until the breaker may let a probe through
+        self.retry_after = retry_after
+        super().__init__(message)
+
+class UserLookupError(DevRevAPIError):
+    """Raised when some users.list chunks still fail after retries"""
+    def __init__(self, message: str, user_groups: List[UserGroup], failed_user_ids: List[str]):
+        self.user_groups = user_groups
+        self.failed_user_ids = failed_user_ids
+        super().__init__(message)
+
+def is_retryable_error(error: BaseException) -> bool:
+    """Rate limits, transport failures and 5xx responses are worth retrying"""
+    if isinstance(error, RateLimitError):
+        return True
+    if isinstance(error, (AuthenticationError, CircuitOpenError)) or not isinstance(error, DevRevAPIError):
+        return False
+    return error.status_code is None or error.status_code >= 500
+
+def parse_user_groups(users: List[dict], logger: logging.Logger) -> List[UserGroup]:
+    """Build UserGroup entries from a users.list response, using each user's first group"""
+    user_groups = []
+    for user in users:
+        # Get the primary group for the user
+        group_refs = user.get('group_refs', [])
+        if group_refs:
+            user_groups.append(UserGroup(
+                user_id=user['id'],
+                group_id=group_refs[0],  # Using first group as primary
+                group_name=None  # Can be populated if needed
+            ))
+        else:
+            logger.warning(f"No group found for user {user['id']}")
+    return user_groups
+
 class DevRevClient:
     """Client for interacting with the DevRev API"""
     
-    def __init__(self, config: Config):
+    def __init__(
+        self,
+        config: Config,
+        rate_limiter: Optional[TokenBucketRateLimiter] = None,
+        user_group_cache: Optional[UserGroupCache] = None,
+        concurrency: Optional[AIMDConcurrencyController] = None,
+        circuit_breakers: Optional[CircuitBreakerRegistry] = None
+    ):
         self.config = config
         self.logger = logging.getLogger(__name__)
+        self.concurrency = concurrency
+        self.circuit_breakers = circuit_breakers or CircuitBreakerRegistry(
+            failure_threshold=config.circuit_failure_threshold,
+            recovery_timeout=config.circuit_recovery_timeout,
+            half_open_max_calls=config.circuit_half_open_probes
+        )
+        # Called with (endpoint, status, seconds) after every API response or transport error
+        self.on_request: Optional[Callable[[str, str, float], None]] = None
+        if user_group_cache is None and config.user_group_cache_path:
+            user_group_cache = UserGroupCache(
+                config.user_group_cache_path,
+                namespace=config.devrev_base_url.rstrip('/'),
+                ttl_seconds=config.user_group_cache_ttl,
+                negative_ttl_seconds=config.user_group_cache_negative_ttl,
+                max_entries=config.user_group_cache_max_entries
+            )
+        self.user_group_cache = user_group_cache
+        self.rate_limiter = rate_limiter or TokenBucketRateLimiter(
+            rate=config.api_rate_limit,
+            capacity=config.api_rate_burst
+        )
         self.session = requests.Session()
+        # Size the connection pool for concurrent users.list / works.list chunk requests
+        adapter = HTTPAdapter(pool_maxsize=max(10, config.user_lookup_workers, config.verify_workers))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.session.headers.update({
             'Authorization': f'Bearer {config.devrev_api_token}',
             'Content-Type': 'application/json'
@@ -36,11 +117,42 @@ class DevRevClient:
         """Make a request to the DevRev API with error handling"""
         url = f"{self.config.devrev_base_url.rstrip('/')}/{endpoint.lstrip('/')}"
         
+        breaker = self.circuit_breakers.get(endpoint)
+        
         try:
-            response = self.session.request(method, url, **kwargs)
+            self.rate_limiter.acquire()
+            if not breaker.allow_request():
+                raise CircuitOpenError(f"Circuit breaker open for {endpoint}", breaker.retry_after())
+            with self.concurrency.slot() if self.concurrency else nullcontext():
+                start = time.monotonic()
+                try:
+                    response = self.session.request(method, url, **kwargs)
+                except requests.exceptions.RequestException:
+                    latency = time.monotonic() - start
+                    breaker.record_failure()
+                    if self.concurrency:
+                        self.concurrency.record(latency, success=False)
+                    if self.on_request:
+                        self.on_request(endpoint, 'error', latency)
+                    raise
+                latency = time.monotonic() - start
+                if response.status_code >= 500:
+                    breaker.record_failure()
+                else:
+                    breaker.record_success()
+                if self.on_request:
+                    self.on_request(endpoint, str(response.status_code), latency)
+                if self.concurrency:
+                    self.concurrency.record(
+                        latency,
+                        success=response.status_code < 500,
+                        throttled=response.status_code == 429
+                    )
+            self.rate_limiter.update_from_headers(response.headers)
             
             # Handle specific error cases
             if response.status_code == 429:
+                self.rate_limiter.penalize(response.headers.get('Retry-After'))
                 raise RateLimitError("API rate limit exceeded", response.status_code, response.text)
             elif response.status_code == 401:
                 raise AuthenticationError("Authentication failed", response.status_code, response.text)
@@ -58,47 +170,138 @@ class DevRevClient:
 
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
-        retry=retry_if_exception_type(RateLimitError)
+        wait=wait_exponential(multiplier=0.5, max=8),
+        retry=retry_if_exception(is_retryable_error),
+        reraise=True  # surface the DevRevAPIError so the chunk is reported as failed
     )
+    def _fetch_user_chunk(self, user_ids: List[str]) -> List[UserGroup]:
+        """Resolve groups for one chunk of users with a single users.list call"""
+        response = self._make_request(
+            'POST',
+            'users.list',
+            json={'ids': user_ids}
+        )
+        return parse_user_groups(response.get('users', []), self.logger)
+
     def get_user_groups(self, user_ids: List[str]) -> List[UserGroup]:
-        """Fetch group memberships for given users from DevRev API"""
+        """Fetch group memberships for given users, consulting the on-disk cache first.
+
+        Cache misses are resolved by _fetch_user_groups. If any chunk still
+        fails, UserLookupError carries the groups that were resolved.
+        """
         if not user_ids:
             return []
-            
-        self.logger.info(f"Fetching group information for {len(user_ids)} users")
         
-        try:
-            # DevRev API endpoint for fetching user information
-            response = self._make_request(
-                'POST',
-                'users.list',
-                json={'ids': user_ids}
-            )
-            
-            user_groups = []
-            for user in response.get('users', []):
-                # Get the primary group for the user
-                group_refs = user.get('group_refs', [])
-                if group_refs:
-                    user_groups.append(UserGroup(
-                        user_id=user['id'],
-                        group_id=group_refs[0],  # Using first group as primary
-                        group_name=None  # Can be populated if needed
-                    ))
-                else:
-                    self.logger.warning(f"No group found for user {user['id']}")
-            
-            self.logger.info(f"Successfully fetched groups for {len(user_groups)} users")
+        cached: Dict[str, Optional[str]] = {}
+        if self.user_group_cache is not None:
+            cached, user_ids = self.user_group_cache.get_many(user_ids)
+            if cached:
+                self.logger.info(f"Resolved {len(cached)} users from the user group cache")
+        
+        user_groups = [
+            UserGroup(user_id=user_id, group_id=group_id)
+            for user_id, group_id in cached.items()
+            if group_id is not None
+        ]
+        if not user_ids:
             return user_groups
-            
-        except DevRevAPIError as e:
-            self.logger.error(f"Error fetching user groups: {str(e)}")
-            raise
+        
+        fetched, failed_user_ids = self._fetch_user_groups(user_ids)
+        user_groups.extend(fetched.values())
+        
+        if self.user_group_cache is not None:
+            failed = set(failed_user_ids)
+            # Users the API answered for but without a group become negative entries
+            self.user_group_cache.put_many({
+                user_id: fetched[user_id].group_id if user_id in fetched else None
+                for user_id in user_ids
+                if user_id not in failed
+            })
+        
+        if failed_user_ids:
+            raise UserLookupError(
+                f"Failed to fetch groups for {len(failed_user_ids)} of {len(user_ids)} users",
+                user_groups,
+                failed_user_ids
+            )
+        
+        self.logger.info(f"Successfully fetched groups for {len(fetched)} users")
+        return user_groups
+
+    def _fetch_user_groups(self, user_ids: List[str]) -> Tuple[Dict[str, UserGroup], List[str]]:
+        """Resolve users via users.list, returning (groups by user id, ids that failed).
+
+        Ids are split into chunks of user_lookup_chunk_size that are fetched on
+        user_lookup_workers threads, and each chunk is retried on its own.
+        """
+        chunk_size = self.config.user_lookup_chunk_size
+        chunks = [user_ids[i:i + chunk_size] for i in range(0, len(user_ids), chunk_size)]
+        self.logger.info(f"Fetching group information for {len(user_ids)} users in {len(chunks)} chunks")
+        
+        user_groups: Dict[str, UserGroup] = {}
+        failed_user_ids: List[str] = []
+        workers = min(self.config.user_lookup_workers, len(chunks))
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(self._fetch_user_chunk, chunk): chunk for chunk in chunks}
+            for future in as_completed(futures):
+                try:
+                    for user_group in future.result():
+                        user_groups[user_group.user_id] = user_group
+                except DevRevAPIError as e:
+                    self.logger.error(f"Error fetching user groups for chunk of {len(futures[future])} users: {str(e)}")
+                    failed_user_ids.extend(futures[future])
+        
+        return user_groups, failed_user_ids
 
     @retry(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=10),
+        wait=wait_exponential(multiplier=0.5, max=8),
+        retry=retry_if_exception(is_retryable_error),
+        reraise=True  # surface the DevRevAPIError so the chunk is reported as failed
+    )
+    def _fetch_work_chunk(self, issue_ids: List[str]) -> Dict[str, Optional[str]]:
+        """Read the current creator group of one chunk of issues with a single works.list call"""
+        response = self._make_request(
+            'POST',
+            'works.list',
+            json={'ids': issue_ids, 'limit': len(issue_ids)}
+        )
+        return {
+            work['id']: (work.get('creator_group') or {}).get('id')
+            for work in response.get('works', [])
+        }
+
+    def get_issue_creator_groups(self, issue_ids: List[str]) -> Tuple[Dict[str, Optional[str]], List[str]]:
+        """Read back creator groups as (group by issue id, ids that failed).
+
+        Ids are split into chunks of verify_chunk_size that are fetched on
+        verify_workers threads. Issues the API doesn't return are absent from
+        the result without being counted as failed.
+        """
+        if not issue_ids:
+            return {}, []
+        chunk_size = self.config.verify_chunk_size
+        chunks = [issue_ids[i:i + chunk_size] for i in range(0, len(issue_ids), chunk_size)]
+        
+        creator_groups: Dict[str, Optional[str]] = {}
+        failed_issue_ids: List[str] = []
+        workers = min(self.config.verify_workers, len(chunks))
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(self._fetch_work_chunk, chunk): chunk for chunk in chunks}
+            for future in as_completed(futures):
+                try:
+                    creator_groups.update(future.result())
+                except DevRevAPIError as e:
+                    self.logger.error(f"Error reading back chunk of {len(futures[future])} issues: {str(e)}")
+                    failed_issue_ids.extend(futures[future])
+        
+        return creator_groups, failed_issue_ids
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_none(),  # the rate limiter already delays the retry per Retry-After
         retry=retry_if_exception_type(RateLimitError)
     )
     def update_issue_creator_group(self, issue_id: str, group_id: str) -> bool:
@@ -117,6 +320,8 @@ class DevRevClient:
             self.logger.info(f"Successfully updated creator group for issue {issue_id}")
             return True
             
+        except (RateLimitError, CircuitOpenError):
+            raise
         except DevRevAPIError as e:
             if e.status_code == 404:
                 self.logger.error(f"Issue {issue_id} not found")
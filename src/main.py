@@ -1,55 +1,145 @@
 import argparse
+import asyncio
 import logging
+import os
+import threading
+import time
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import Iterable, Iterator, List, Dict, Optional, Sequence, Set, Tuple, TypeVar, Union
 
 from config import Config
-from models import Issue, ProcessingResult
+from models import Issue, IssueBatch, ProcessingResult
 from core.logging import ContextLogger
 from core.validation import DataValidator
 from processing.batch import BatchProcessor
 from processing.progress import ProgressTracker
 from processing.integrity import DataIntegrityChecker
 from processing.dry_run import DryRunProcessor
+from processing.checkpoint import CheckpointJournal
+from processing.plan import PlanEntry, read_plan
 from monitoring.metrics import MetricsCollector
 from monitoring.health_check import ServiceHealth
-from data_source import CSVDataSource, SnowflakeDataSource
-from devrev_client import DevRevClient
+from data_source import DataSource, CSVDataSource, ParquetDataSource, SnowflakeDataSource
+from devrev_client import DevRevClient, UserLookupError, CircuitOpenError
+from adaptive_concurrency import AIMDConcurrencyController
+from circuit_breaker import CircuitBreakerRegistry
+
+# Anything with an issue_id: source issues or replayed plan entries
+T = TypeVar('T', Issue, PlanEntry)
+# Issues as the batch processor hands them around: plain lists or columnar batches
+Issues = Union[List[Issue], IssueBatch]
+
+def _issue_ids(issues: Sequence[Issue]) -> List[str]:
+    """Issue ids of a batch, read from the id column when it is an IssueBatch"""
+    if isinstance(issues, IssueBatch):
+        return issues.issue_ids
+    return [issue.issue_id for issue in issues]
 
 class BackfillProcessor:
     def __init__(
         self,
         config: Config,
         dry_run: bool = False,
-        logger: Optional[ContextLogger] = None
+        logger: Optional[ContextLogger] = None,
+        use_async: bool = False,
+        checkpoint: Optional[CheckpointJournal] = None
     ):
         self.config = config
         self.dry_run = dry_run
+        self.checkpoint = checkpoint
+        self.resumed_skips = 0
         self.logger = logger or ContextLogger(__name__)
+        # Ids whose update failed in a batch the run loop hasn't journaled yet; they hold back source positions
+        self._failed_update_ids: Set[str] = set()
+        self._failed_update_lock = threading.Lock()
         
     
         self.metrics = MetricsCollector()
         self.health_checker = ServiceHealth(config, self.logger)
         self.data_validator = DataValidator()
-        self.integrity_checker = DataIntegrityChecker(self.logger)
-        self.dry_run_processor = DryRunProcessor(self.logger)
+        self.integrity_checker = DataIntegrityChecker(
+            self.logger,
+            mode=config.verify_mode,
+            confidence=config.verify_confidence,
+            error_bound=config.verify_error_bound,
+            min_per_stratum=config.verify_min_per_group
+        )
+        self.dry_run_processor = DryRunProcessor(
+            self.logger,
+            plan_path=config.dry_run_plan_path if dry_run else None,
+            log_sample_every=config.dry_run_log_sample_every
+        )
         
        
-        self.devrev_client = DevRevClient(config)
+        # AIMD controller shared by both clients; its limit is exported as a gauge
+        self.concurrency = None
+        if config.adaptive_concurrency:
+            self.concurrency = AIMDConcurrencyController(
+                initial_limit=config.adaptive_initial_concurrency,
+                max_limit=config.max_in_flight_requests,
+                on_change=self.metrics.record_concurrency_limit
+            )
+            self.metrics.record_concurrency_limit(self.concurrency.limit)
+
+        # One breaker per endpoint, shared by both clients so either path trips it
+        self.circuit_breakers = CircuitBreakerRegistry(
+            failure_threshold=config.circuit_failure_threshold,
+            recovery_timeout=config.circuit_recovery_timeout,
+            half_open_max_calls=config.circuit_half_open_probes,
+            on_state_change=self.metrics.record_circuit_state
+        )
+
+        self.devrev_client = DevRevClient(
+            config,
+            concurrency=self.concurrency,
+            circuit_breakers=self.circuit_breakers
+        )
+        self.devrev_client.rate_limiter.on_wait = self.metrics.record_rate_limit_wait
+        self.devrev_client.on_request = self.metrics.record_request
+        if self.devrev_client.user_group_cache is not None:
+            self.devrev_client.user_group_cache.on_lookup = self.metrics.record_cache_lookup
+        # Async client keeps up to config.max_in_flight_requests updates in flight;
+        # it runs on a dedicated loop thread so its session survives across batches
+        # and concurrent batch workers can all submit to it.
+        # Both clients share one limiter so pacing is client-wide.
+        self.async_client = None
+        self._loop = None
+        if use_async:
+            # Imported here: aiohttp is slow to import and only the async path needs it
+            from async_devrev_client import AsyncDevRevClient
+            self.async_client = AsyncDevRevClient(
+                config,
+                rate_limiter=self.devrev_client.rate_limiter,
+                concurrency=self.concurrency,
+                circuit_breakers=self.circuit_breakers
+            )
+            self.async_client.on_request = self.metrics.record_request
+            self._loop = asyncio.new_event_loop()
+            threading.Thread(target=self._loop.run_forever, daemon=True).start()
         
         
         self.batch_processor = BatchProcessor(
             batch_size=config.batch_size,
             max_consecutive_failures=config.max_batch_failures,
-            logger=self.logger
+            logger=self.logger,
+            max_in_flight_batches=config.max_in_flight_batches,
+            preserve_order=config.preserve_batch_order
         )
 
-    def initialize(self) -> bool:
-        """Initialize and check health of all components"""
+    def close(self) -> None:
+        """Close the async client and stop its loop thread, if this processor has them"""
+        if self._loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.async_client.close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._loop = None
+
+    def initialize(self, data_source: Optional[DataSource] = None) -> bool:
+        """Check health of the services this run needs; Snowflake only when reading from it"""
         self.logger.info("Starting initialization and health checks")
         
        
-        health_status = self.health_checker.check_all()
+        health_status = self.health_checker.check_all(data_source)
         if not health_status["overall"]:
             self.logger.error("Health checks failed", status=health_status)
             return False
@@ -59,133 +149,623 @@ class BackfillProcessor:
 
     def process_issues(self, issues: List[Issue]) -> ProcessingResult:
         """Main processing logic"""
-        self.metrics.record_process_start(len(issues))
-        progress = ProgressTracker(len(issues), "Processing issues")
+        return self.process_issue_stream(issues, total=len(issues))
+
+    def process_issue_stream(
+        self,
+        issues: Iterable[Issue],
+        total: Optional[int] = None
+    ) -> ProcessingResult:
+        """Process issues batch by batch as the data source yields them"""
+        return self.process_issue_batches(self.batch_processor.batches(issues), total)
+
+    def process_issue_batches(
+        self,
+        batches: Iterable[Issues],
+        total: Optional[int] = None,
+        source: Optional[DataSource] = None
+    ) -> ProcessingResult:
+        """Process batches as the data source builds them, e.g. from DataSource.iter_issue_batches.
+
+        With a checkpoint and the source the batches come from, finished issues
+        are acknowledged to the source and its resume positions are journaled
+        alongside them. An issue whose update failed is never acknowledged, so
+        a resumed run reads it again.
+        """
+        self.metrics.record_process_start(total or 0)
+        self.integrity_checker.begin(total)
+        progress = ProgressTracker(
+            total,
+            "Processing issues",
+            refresh_rate=self.config.progress_refresh_rate,
+            mode=self.config.progress_mode,
+            log_interval=self.config.progress_log_interval,
+            logger=self.logger
+        )
+        # Only grows with distinct creators, not with the number of issues
+        user_group_map: Dict[str, Optional[str]] = {}
+        integrity_mismatches: List[str] = []
+        total_processed = 0
 
+        if self.checkpoint is not None and self.checkpoint.state.completed_ids:
+            batches = self._skip_completed_batches(batches, source)
+        recorded_positions = self.checkpoint.state.positions if self.checkpoint is not None else None
+        # Issues handed to the batch processor whose batch has not been yielded yet
+        submitted = [0]
+
+        def count_submitted(batches: Iterable[Issues]) -> Iterator[Issues]:
+            for batch in batches:
+                submitted[0] += len(batch)
+                yield batch
+
+        # Only a run that got through every batch may publish its dry-run plan
+        completed = False
         try:
-            # Get user group mapping
-            user_ids = list({issue.creator_user_id for issue in issues})
-            user_groups = self.devrev_client.get_user_groups(user_ids)
-            user_group_map = {ug.user_id: ug.group_id for ug in user_groups}
-
-            # Process in batches
-            for batch_result in self.batch_processor.process_batch(
-                issues,
-                lambda batch: self._process_batch(batch, user_group_map)
+            for batch_result in self.batch_processor.process_batches(
+                count_submitted(batches),
+                lambda batch: self._run_batch(batch, user_group_map)
             ):
-                for item in batch_result.input_items:
-                    if batch_result.success:
-                        progress.update("success")
-                        self.metrics.record_issue_processed(True)
-                    else:
-                        progress.update("failed")
-                        self.metrics.record_issue_processed(False)
+                total_processed += len(batch_result.input_items)
+                if self.checkpoint is not None and not self.dry_run:
+                    positions = None
+                    if source is not None:
+                        finished = self._finished_ids(batch_result.input_items)
+                        if batch_result.success:
+                            source.acknowledge(finished)
+                        positions = source.resume_positions()
+                        if positions == recorded_positions:
+                            positions = None
+                        else:
+                            recorded_positions = positions
+                    # Positions share the record with the ids that moved them, so neither is durable without the other
+                    self.checkpoint.record_batch(_issue_ids(batch_result.output_items), positions=positions)
+                for _ in range(len(batch_result.input_items)):
+                    self.metrics.record_issue_processed(batch_result.success)
+                progress.set_in_flight(submitted[0] - total_processed)
+                self.metrics.record_issues_in_flight(submitted[0] - total_processed)
+                progress.update(
+                    "success" if batch_result.success else "failed",
+                    count=len(batch_result.input_items)
+                )
 
-        
-            if not self.dry_run:
-                integrity_result = self.integrity_checker.verify_updates(
-                    issues,
-                    self._fetch_updated_issues(issues)
+                if not self.dry_run and self.config.verify_updates:
+                    # Runs here while later batches are still updating on the batch pool
+                    integrity_mismatches.extend(self._verify_issues(
+                        self.integrity_checker.select_for_verification(batch_result.output_items)
+                    ))
+
+            # Without a total upfront the sample was held back until every issue had been seen
+            integrity_mismatches.extend(self._verify_issues(self.integrity_checker.take_reservoir()))
+
+            if integrity_mismatches:
+                self.logger.warning(
+                    "Integrity check failed",
+                    mismatches=integrity_mismatches
                 )
-                if not integrity_result.passed:
-                    self.logger.warning(
-                        "Integrity check failed",
-                        mismatches=integrity_result.mismatches
-                    )
+            if self.integrity_checker.mode == "sample" and not self.dry_run and self.config.verify_updates:
+                self.logger.info("Sampled verification estimate", **self.integrity_checker.sampling_report())
 
+            completed = True
             return ProcessingResult(
-                total_processed=len(issues),
+                total_processed=total_processed + self.resumed_skips,
                 successful_updates=self.metrics.successful_updates,
                 failed_updates=self.metrics.failed_updates,
-                skipped_updates=0
+                skipped_updates=self.resumed_skips
             )
 
         finally:
             progress.close()
+            self.integrity_checker.close()
+            if self.checkpoint is not None:
+                self.checkpoint.sync()
+            if self.dry_run:
+                self.dry_run_processor.close(complete=completed)
+            if self._loop is not None:
+                asyncio.run_coroutine_threadsafe(self.async_client.close(), self._loop).result()
+            self.metrics.record_process_complete()
             final_metrics = self.metrics.get_current_metrics()
             self.logger.info("Processing completed", metrics=final_metrics)
 
+    def _skip_completed(self, issues: Iterable[T]) -> Iterable[T]:
+        """Drop issues that the checkpoint journal records as already updated"""
+        for issue in issues:
+            if self.checkpoint.is_completed(issue.issue_id):
+                self.resumed_skips += 1
+                continue
+            yield issue
+
+    def _skip_completed_batches(
+        self,
+        batches: Iterable[Issues],
+        source: Optional[DataSource] = None
+    ) -> Iterator[Issues]:
+        """Drop issues recorded as completed from each batch, keeping columnar batches columnar.
+
+        The dropped issues are acknowledged to source, since an earlier run finished them.
+        """
+        for batch in batches:
+            keep = []
+            completed = []
+            for index, issue_id in enumerate(_issue_ids(batch)):
+                if self.checkpoint.is_completed(issue_id):
+                    completed.append(issue_id)
+                else:
+                    keep.append(index)
+            self.resumed_skips += len(completed)
+            if source is not None and completed:
+                source.acknowledge(completed)
+            if len(keep) == len(batch):
+                yield batch
+            elif keep:
+                yield batch.take(keep) if isinstance(batch, IssueBatch) else [batch[index] for index in keep]
+
+    def _note_failed_updates(self, issue_ids: Iterable[str]) -> None:
+        if self.checkpoint is not None:
+            with self._failed_update_lock:
+                self._failed_update_ids.update(issue_ids)
+
+    def _finished_ids(self, batch: Issues) -> List[str]:
+        """Ids in batch whose update did not fail, whether they were updated or needed no update"""
+        issue_ids = _issue_ids(batch)
+        with self._failed_update_lock:
+            failed = self._failed_update_ids
+            finished = [issue_id for issue_id in issue_ids if issue_id not in failed]
+            failed.difference_update(issue_ids)
+        return finished
+
+    def _resolve_user_groups(
+        self,
+        batch: Issues,
+        user_group_map: Dict[str, Optional[str]]
+    ) -> Dict[str, Optional[str]]:
+        """Fetch groups for creators in this batch that earlier batches have not resolved"""
+        if isinstance(batch, IssueBatch):
+            creators = set(batch.unique_creator_user_ids())
+        else:
+            creators = {issue.creator_user_id for issue in batch}
+        unresolved = list(creators - user_group_map.keys())
+        if not unresolved:
+            return user_group_map
+
+        failed_user_ids: set = set()
+        try:
+            user_groups = self.devrev_client.get_user_groups(unresolved)
+        except UserLookupError as e:
+            # Keep what resolved; failed users stay unknown so a later batch retries them
+            self.logger.error(
+                "User group lookup partially failed",
+                failed_users=len(e.failed_user_ids),
+                error=str(e)
+            )
+            user_groups = e.user_groups
+            failed_user_ids = set(e.failed_user_ids)
+
+        for user_group in user_groups:
+            user_group_map[user_group.user_id] = user_group.group_id
+        # Remember users without a group so they are not looked up again
+        for user_id in unresolved:
+            if user_id not in failed_user_ids:
+                user_group_map.setdefault(user_id, None)
+        return user_group_map
+
+    def _run_batch(
+        self,
+        batch: Issues,
+        user_group_map: Dict[str, Optional[str]]
+    ) -> Issues:
+        """Resolve groups for a batch and dispatch it to the sync or async update path"""
+        self.metrics.record_batch_start()
+        start = time.monotonic()
+        try:
+            user_group_map = self._resolve_user_groups(batch, user_group_map)
+            resolved = time.monotonic()
+            self.metrics.record_batch_stage("user_lookup", resolved - start)
+
+            if self.async_client is not None and not self.dry_run:
+                processed = asyncio.run_coroutine_threadsafe(
+                    self._process_batch_async(batch, user_group_map),
+                    self._loop
+                ).result()
+            else:
+                processed = self._process_batch(batch, user_group_map)
+            self.metrics.record_batch_stage("update", time.monotonic() - resolved)
+            return processed
+        finally:
+            self.metrics.record_batch_stage("total", time.monotonic() - start)
+            self.metrics.record_batch_complete()
+
+    def _plan_update(
+        self,
+        issue: Issue,
+        user_group_map: Dict[str, Optional[str]]
+    ) -> Optional[str]:
+        """Validate an issue and return the group it should be assigned, if any"""
+        validation_result = self.data_validator.validate_issue(issue)
+        if not validation_result.is_valid:
+            self.logger.warning(
+                "Issue validation failed",
+                issue_id=issue.issue_id,
+                errors=validation_result.errors
+            )
+            return None
+
+        group_id = user_group_map.get(issue.creator_user_id)
+        if not group_id:
+            self.logger.warning(
+                "No group found for user",
+                user_id=issue.creator_user_id
+            )
+            return None
+
+        return group_id
+
+    def _plan_updates(
+        self,
+        batch: Issues,
+        user_group_map: Dict[str, Optional[str]]
+    ) -> Iterator[Tuple[int, Issue, str]]:
+        """Yield (index, issue, group_id) for each row of batch that should be updated.
+
+        An IssueBatch is walked column by column and each row is loaded into
+        one reused Issue for validation, so no object is built per row. The
+        yielded issue is only valid until the next row is requested.
+        """
+        if not isinstance(batch, IssueBatch):
+            for index, issue in enumerate(batch):
+                group_id = self._plan_update(issue, user_group_map)
+                if group_id:
+                    yield index, issue, group_id
+            return
+
+        row = Issue(issue_id='', creator_user_id='', assigned_group='')
+        columns = zip(batch.issue_ids, batch.creator_user_ids, batch.assigned_groups, batch.creator_groups)
+        for index, (issue_id, creator_user_id, assigned_group, creator_group) in enumerate(columns):
+            row.issue_id = issue_id
+            row.creator_user_id = creator_user_id
+            row.assigned_group = assigned_group
+            row.creator_group = creator_group
+            group_id = self._plan_update(row, user_group_map)
+            if group_id:
+                yield index, row, group_id
+
     def _process_batch(
         self,
-        batch: List[Issue],
-        user_group_map: Dict[str, str]
-    ) -> List[Issue]:
+        batch: Issues,
+        user_group_map: Dict[str, Optional[str]]
+    ) -> Issues:
         """Process a single batch of issues"""
-        processed_issues = []
-        
-        for issue in batch:
-            # Validate issue
-            validation_result = self.data_validator.validate_issue(issue)
-            if not validation_result.is_valid:
-                self.logger.warning(
-                    "Issue validation failed",
-                    issue_id=issue.issue_id,
-                    errors=validation_result.errors
-                )
-                continue
-
-            # Get group ID
-            group_id = user_group_map.get(issue.creator_user_id)
-            if not group_id:
-                self.logger.warning(
-                    "No group found for user",
-                    user_id=issue.creator_user_id
-                )
-                continue
+        updated: List[Tuple[int, Optional[str]]] = []
 
+        for index, issue, group_id in self._plan_updates(batch, user_group_map):
             if self.dry_run:
                 self.dry_run_processor.record_operation(
                     operation="update",
                     target=f"issue/{issue.issue_id}",
                     params={"creator_group": group_id}
                 )
-                processed_issues.append(issue)
+                # Nothing was written, so the issue keeps the creator group it had
+                updated.append((index, issue.creator_group))
+            elif self._send_update(issue.issue_id, group_id):
+                updated.append((index, group_id))
             else:
-                # Update issue
-                try:
-                    success = self.devrev_client.update_issue_creator_group(
-                        issue.issue_id,
-                        group_id
-                    )
-                    if success:
-                        processed_issues.append(issue)
-                        self.metrics.record_api_call()
-                    else:
-                        self.logger.error(
-                            "Failed to update issue",
-                            issue_id=issue.issue_id
-                        )
-                except Exception as e:
-                    self.logger.error(
-                        "Error updating issue",
-                        issue_id=issue.issue_id,
-                        error=str(e)
-                    )
+                self._note_failed_updates([issue.issue_id])
 
+        return self._updated_issues(batch, updated)
+
+    def _updated_issues(self, batch: Issues, updated: List[Tuple[int, Optional[str]]]) -> Issues:
+        """The rows of batch at the given indices, each with its creator group set, in the batch's own form"""
+        if isinstance(batch, IssueBatch):
+            updated_batch = batch.take(index for index, _ in updated)
+            for row, (_, group_id) in enumerate(updated):
+                updated_batch.creator_groups[row] = group_id
+            return updated_batch
+
+        processed_issues = []
+        for index, group_id in updated:
+            issue = batch[index]
+            issue.creator_group = group_id
+            processed_issues.append(issue)
         return processed_issues
 
-    def _fetch_updated_issues(self, original_issues: List[Issue]) -> List[Issue]:
-        """Fetch the updated issues to verify changes"""
+    def _circuit_wait(self, error: CircuitOpenError, waited: float) -> float:
+        """Delay before retrying an update the breaker rejected, given how long it has waited so far.
+
+        Raises the error once config.circuit_max_wait is used up, failing the
+        whole batch rather than rejecting the rest of it one by one.
+        """
+        if waited >= self.config.circuit_max_wait:
+            raise error
+        if waited == 0:
+            self.logger.debug("Waiting for circuit breaker to recover", retry_after=round(error.retry_after, 2))
+        # Never spin: a breaker that just turned half-open reports 0 for the callers that lost the probe race
+        return min(max(error.retry_after, 0.05), self.config.circuit_max_wait - waited)
 
-        return original_issues
+    def _send_update(self, issue_id: str, group_id: str) -> bool:
+        """Update one issue's creator group, logging rather than raising on failure.
+
+        While the works.update breaker is open the update waits for it to let
+        a probe through and is then retried, so a short outage doesn't fail
+        batches and count towards max_batch_failures.
+        """
+        waited = 0.0
+        while True:
+            try:
+                success = self.devrev_client.update_issue_creator_group(issue_id, group_id)
+                break
+            except CircuitOpenError as e:
+                delay = self._circuit_wait(e, waited)
+                time.sleep(delay)
+                waited += delay
+            except Exception as e:
+                self.logger.error(
+                    "Error updating issue",
+                    issue_id=issue_id,
+                    error=str(e)
+                )
+                return False
+
+        if success:
+            self.metrics.record_api_call()
+        else:
+            self.logger.error(
+                "Failed to update issue",
+                issue_id=issue_id
+            )
+        return success
+
+    async def _process_batch_async(
+        self,
+        batch: Issues,
+        user_group_map: Dict[str, Optional[str]]
+    ) -> Issues:
+        """Process a single batch of issues with all of its updates issued concurrently"""
+        planned = [
+            (index, issue.issue_id, group_id)
+            for index, issue, group_id in self._plan_updates(batch, user_group_map)
+        ]
+        succeeded = await self._send_updates_async([(issue_id, group_id) for _, issue_id, group_id in planned])
+        if len(succeeded) < len(planned):
+            succeeded_positions = set(succeeded)
+            self._note_failed_updates(
+                issue_id for position, (_, issue_id, _) in enumerate(planned) if position not in succeeded_positions
+            )
+        return self._updated_issues(batch, [(planned[i][0], planned[i][2]) for i in succeeded])
+
+    async def _send_updates_async(self, updates: List[Tuple[str, str]]) -> List[int]:
+        """Send one update per (issue_id, group_id) pair concurrently and return the positions that succeeded"""
+        outcomes = await self.async_client.update_issues_creator_group(updates)
+
+        # Updates the open breaker rejected wait for it to recover and go out again, like _send_update
+        waited = 0.0
+        rejected = [index for index, outcome in enumerate(outcomes) if isinstance(outcome, CircuitOpenError)]
+        while rejected:
+            delay = self._circuit_wait(outcomes[rejected[0]], waited)
+            await asyncio.sleep(delay)
+            waited += delay
+            retried = await self.async_client.update_issues_creator_group(
+                [updates[index] for index in rejected]
+            )
+            for index, outcome in zip(rejected, retried):
+                outcomes[index] = outcome
+            rejected = [index for index, outcome in zip(rejected, retried) if isinstance(outcome, CircuitOpenError)]
+
+        succeeded = []
+        for position, ((issue_id, _), outcome) in enumerate(zip(updates, outcomes)):
+            if isinstance(outcome, Exception):
+                self.logger.error(
+                    "Error updating issue",
+                    issue_id=issue_id,
+                    error=str(outcome)
+                )
+            elif outcome:
+                succeeded.append(position)
+                self.metrics.record_api_call()
+            else:
+                self.logger.error(
+                    "Failed to update issue",
+                    issue_id=issue_id
+                )
+
+        return succeeded
+
+    def apply_plan(self, plan_path: str) -> ProcessingResult:
+        """Replay the updates in a dry-run plan without querying the source or resolving groups.
+
+        With a checkpoint, the journal cursor is the plan byte offset below which
+        every update succeeded; a resumed run seeks there and skips any later
+        entries already recorded as completed.
+        """
+        start_offset = 0
+        if self.checkpoint is not None and self.checkpoint.state.cursor is not None:
+            start_offset = int(self.checkpoint.state.cursor)
+        entries: Iterable[PlanEntry] = read_plan(plan_path, start_offset)
+        if self.checkpoint is not None and self.checkpoint.state.completed_ids:
+            entries = self._skip_completed(entries)
+
+        self.metrics.record_process_start(0)
+        progress = ProgressTracker(
+            None,
+            "Applying plan",
+            refresh_rate=self.config.progress_refresh_rate,
+            mode=self.config.progress_mode,
+            log_interval=self.config.progress_log_interval,
+            logger=self.logger
+        )
+        low_water_offset = start_offset
+        # The offset can only advance while batches complete in plan order without failures
+        offset_stalled = not self.batch_processor.preserve_order
+        total_processed = 0
+
+        try:
+            for batch_result in self.batch_processor.process_stream(entries, self._apply_batch):
+                total_processed += len(batch_result.input_items)
+                if len(batch_result.output_items) < len(batch_result.input_items):
+                    offset_stalled = True
+                elif not offset_stalled:
+                    low_water_offset = batch_result.input_items[-1].offset
+                if self.checkpoint is not None:
+                    self.checkpoint.record_batch(
+                        [entry.issue_id for entry in batch_result.output_items],
+                        cursor=str(low_water_offset)
+                    )
+                for entry in batch_result.input_items:
+                    self.metrics.record_issue_processed(batch_result.success)
+                progress.update(
+                    "success" if batch_result.success else "failed",
+                    count=len(batch_result.input_items)
+                )
+
+            return ProcessingResult(
+                total_processed=total_processed + self.resumed_skips,
+                successful_updates=self.metrics.successful_updates,
+                failed_updates=self.metrics.failed_updates,
+                skipped_updates=self.resumed_skips
+            )
+
+        finally:
+            progress.close()
+            if self.checkpoint is not None:
+                self.checkpoint.sync()
+            if self._loop is not None:
+                asyncio.run_coroutine_threadsafe(self.async_client.close(), self._loop).result()
+            self.metrics.record_process_complete()
+            self.logger.info("Plan replay completed", metrics=self.metrics.get_current_metrics())
+
+    def _apply_batch(self, batch: List[PlanEntry]) -> List[PlanEntry]:
+        """Send the planned updates for one batch of plan entries"""
+        self.metrics.record_batch_start()
+        start = time.monotonic()
+        try:
+            if self.async_client is not None:
+                succeeded = asyncio.run_coroutine_threadsafe(
+                    self._send_updates_async([(entry.issue_id, entry.group_id) for entry in batch]),
+                    self._loop
+                ).result()
+                return [batch[position] for position in succeeded]
+            return [entry for entry in batch if self._send_update(entry.issue_id, entry.group_id)]
+        finally:
+            self.metrics.record_batch_stage("update", time.monotonic() - start)
+            self.metrics.record_batch_complete()
+
+    def _verify_issues(self, issues: Sequence[Issue]) -> List[str]:
+        """Read issues back and check them, re-verifying earlier unsampled updates if this escalates"""
+        if not issues:
+            return []
+        escalated = self.integrity_checker.escalated
+        updated_issues, unverified_ids = self._fetch_updated_issues(issues)
+        mismatches = list(self.integrity_checker.verify_batch(issues, updated_issues, unverified_ids).mismatches)
+        if self.integrity_checker.escalated and not escalated:
+            for chunk in self.integrity_checker.take_spilled(self.config.batch_size):
+                updated_issues, unverified_ids = self._fetch_updated_issues(chunk)
+                mismatches.extend(self.integrity_checker.verify_batch(chunk, updated_issues, unverified_ids).mismatches)
+        return mismatches
+
+    def _fetch_updated_issues(self, original_issues: Sequence[Issue]) -> Tuple[List[Issue], List[str]]:
+        """Read the issues back from the API, returning (current issues, ids that could not be read)"""
+        creator_groups, failed_ids = self.devrev_client.get_issue_creator_groups(
+            _issue_ids(original_issues)
+        )
+        if failed_ids:
+            self.logger.warning("Could not read back issues for verification", issues=len(failed_ids))
+
+        updated_issues = [
+            Issue(
+                issue_id=issue.issue_id,
+                creator_user_id=issue.creator_user_id,
+                assigned_group=issue.assigned_group,
+                creator_group=creator_groups[issue.issue_id]
+            )
+            for issue in original_issues
+            if issue.issue_id in creator_groups
+        ]
+        return updated_issues, failed_ids
+
+def apply_plan(
+    processor: BackfillProcessor,
+    config: Config,
+    plan_path: str,
+    resume: bool,
+    logger: ContextLogger
+) -> int:
+    """Run --apply-plan, journaling progress next to the plan so --resume can continue it"""
+    if not os.path.exists(plan_path):
+        logger.error("Plan file not found", path=plan_path)
+        return 1
+
+    if config.checkpoint_path:
+        # Cursors are byte offsets into this plan, so it gets its own journal
+        processor.checkpoint = CheckpointJournal(
+            f"{plan_path}.checkpoint.jsonl",
+            resume=resume,
+            sync_interval=config.checkpoint_sync_interval,
+            logger=logger
+        )
+        if resume:
+            logger.info(
+                "Resuming plan replay",
+                offset=processor.checkpoint.state.cursor,
+                completed=len(processor.checkpoint.state.completed_ids)
+            )
+
+    logger.info("Applying dry run plan", path=plan_path)
+    try:
+        result = processor.apply_plan(plan_path)
+    finally:
+        if processor.checkpoint is not None:
+            processor.checkpoint.close()
+
+    logger.info("Plan applied", result=str(result))
+    return 0 if result.failed_updates == 0 else 1
 
 def main():
     """Main execution function"""
     parser = argparse.ArgumentParser(description='Backfill DevRev issue creator groups')
-    parser.add_argument('--source', choices=['csv', 'snowflake'], default='csv',
+    parser.add_argument('--source', choices=['csv', 'parquet', 'snowflake'], default='csv',
                        help='Data source to use (default: csv)')
     parser.add_argument('--batch-size', type=int, default=100,
                        help='Number of issues to process in each batch (default: 100)')
     parser.add_argument('--dry-run', action='store_true',
                        help='Run without making any actual updates')
+    parser.add_argument('--plan-file', default=None,
+                       help='Where --dry-run writes its JSONL plan (default: DRY_RUN_PLAN_PATH)')
+    parser.add_argument('--apply-plan', metavar='FILE', default=None,
+                       help='Send only the updates recorded in a --dry-run plan, using the async client')
+    parser.add_argument('--resume', action='store_true',
+                       help='Skip issues recorded as completed in the checkpoint journal')
+    parser.add_argument('--concurrent-batches', type=int, default=None,
+                       help='Number of batches processed at once (default: MAX_IN_FLIGHT_BATCHES)')
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                       help='Send updates concurrently with the asyncio client')
+    parser.add_argument('--max-in-flight', type=int, default=None,
+                       help='Maximum concurrent API requests in --async mode (default: MAX_IN_FLIGHT_REQUESTS)')
+    parser.add_argument('--adaptive-concurrency', action='store_true',
+                       help='Adjust in-flight API requests with AIMD, capped by --max-in-flight')
+    parser.add_argument('--progress', choices=['auto', 'bar', 'log'], default=None,
+                       help='Progress display; log emits periodic log lines for non-TTY runs (default: PROGRESS_MODE)')
+    parser.add_argument('--metrics-port', type=int, default=None,
+                       help='Serve Prometheus metrics on this port during the run (default: METRICS_PORT, off)')
     parser.add_argument('--log-level', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
                        default='INFO', help='Set the logging level')
     args = parser.parse_args()
+    if args.apply_plan and args.dry_run:
+        parser.error("--apply-plan cannot be combined with --dry-run")
 
     try:
     
         config = Config()
         config.batch_size = args.batch_size
+        if args.max_in_flight is not None:
+            config.max_in_flight_requests = args.max_in_flight
+        if args.adaptive_concurrency:
+            config.adaptive_concurrency = True
+        if args.concurrent_batches is not None:
+            config.max_in_flight_batches = args.concurrent_batches
+        if args.progress is not None:
+            config.progress_mode = args.progress
+        if args.plan_file is not None:
+            config.dry_run_plan_path = args.plan_file
+        if args.metrics_port is not None:
+            config.metrics_port = args.metrics_port
         config.validate()
 
     
@@ -196,39 +776,79 @@ def main():
         processor = BackfillProcessor(
             config=config,
             dry_run=args.dry_run,
-            logger=logger
+            logger=logger,
+            # Replaying a plan is pure update I/O, so always run it at full concurrency
+            use_async=args.use_async or args.apply_plan is not None
         )
 
     
-        if not processor.initialize():
-            logger.error("System initialization failed")
-            return 1
+        if config.metrics_port:
+            processor.metrics.serve(config.metrics_port)
+
+        if args.apply_plan:
+            if not processor.initialize():
+                logger.error("System initialization failed")
+                return 1
+            return apply_plan(processor, config, args.apply_plan, args.resume, logger)
 
     
         if args.source == 'csv':
             data_source = CSVDataSource(config)
+        elif args.source == 'parquet':
+            data_source = ParquetDataSource(config)
         else:
             data_source = SnowflakeDataSource(config)
 
+        if not processor.initialize(data_source):
+            logger.error("System initialization failed")
+            return 1
+
     
         if not data_source.test_connection():
             logger.error(f"Failed to connect to {args.source} data source")
             return 1
 
     
-        logger.info("Fetching issues with missing creator group...")
-        issues = data_source.get_issues_missing_creator_group()
-        logger.info(f"Found {len(issues)} issues to process")
-
-        if not issues:
-            logger.info("No issues found needing updates")
-            return 0
-
-        
         if args.dry_run:
             logger.info("Running in DRY RUN mode - no actual updates will be made")
+        elif config.checkpoint_path:
+            # Opened only once checks pass so a failed start never truncates the journal
+            processor.checkpoint = CheckpointJournal(
+                config.checkpoint_path,
+                resume=args.resume,
+                sync_interval=config.checkpoint_sync_interval,
+                logger=logger
+            )
+            if args.resume:
+                logger.info(
+                    "Resuming from checkpoint",
+                    completed=len(processor.checkpoint.state.completed_ids)
+                )
+            # Sources that can start part-way (partitioned Snowflake) skip what the checkpoint covers
+            data_source.track_resume_positions(processor.checkpoint.state.positions)
+
+        total = None
+        if config.verify_mode == 'sample' and config.verify_updates and not args.dry_run:
+            # Sizes the verification sample; sources that can't count cheaply return None
+            total = data_source.count_issues_missing_creator_group()
+            if total is not None and processor.checkpoint is not None:
+                total = max(total - len(processor.checkpoint.state.completed_ids), 0)
 
-        result = processor.process_issues(issues)
+        # Stream issues straight into processing so updates start before the source is exhausted
+        logger.info("Streaming issues with missing creator group...")
+        try:
+            result = processor.process_issue_batches(
+                data_source.iter_issue_batches(config.batch_size),
+                total,
+                source=data_source
+            )
+        finally:
+            if processor.checkpoint is not None:
+                processor.checkpoint.close()
+
+        if result.total_processed == 0:
+            logger.info("No issues found needing updates")
+            return 0
 
     
         logger.info("Processing completed!", result=str(result))
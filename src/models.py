@@ -1,6 +1,19 @@
-from dataclasses import dataclass
-from typing import Optional, List
+from array import array
+from dataclasses import dataclass, fields
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
 
+def _slotted(cls):
+    """Rebuild a dataclass with __slots__, as dataclass(slots=True) does on Python 3.10+"""
+    field_names = tuple(f.name for f in fields(cls))
+    # Class-level defaults would clash with the slot descriptors; __init__ already has them
+    namespace = {
+        key: value for key, value in cls.__dict__.items()
+        if key not in field_names and key not in ('__dict__', '__weakref__')
+    }
+    namespace['__slots__'] = field_names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+@_slotted
 @dataclass
 class Issue:
     """Represents a DevRev issue/ticket with its properties"""
@@ -12,6 +25,7 @@ class Issue:
     def __str__(self) -> str:
         return f"Issue(id={self.issue_id}, creator={self.creator_user_id}, assigned_group={self.assigned_group})"
 
+@_slotted
 @dataclass
 class UserGroup:
     """Represents a user-group association in DevRev"""
@@ -22,6 +36,128 @@ class UserGroup:
     def __str__(self) -> str:
         return f"UserGroup(user={self.user_id}, group={self.group_id})"
 
+class DictionaryColumn:
+    """String column stored as array('I') codes into a list of its distinct values"""
+    __slots__ = ('values', 'codes', '_index')
+
+    def __init__(self, values: Iterable[Optional[str]] = ()):
+        self.values: List[Optional[str]] = []
+        self.codes = array('I')
+        self._index: Dict[Optional[str], int] = {}
+        for value in values:
+            self.append(value)
+
+    def _encode(self, value: Optional[str]) -> int:
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def append(self, value: Optional[str]) -> None:
+        self.codes.append(self._encode(value))
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, index: int) -> Optional[str]:
+        return self.values[self.codes[index]]
+
+    def __setitem__(self, index: int, value: Optional[str]) -> None:
+        self.codes[index] = self._encode(value)
+
+    def __iter__(self) -> Iterator[Optional[str]]:
+        values = self.values
+        return (values[code] for code in self.codes)
+
+class IssueBatch:
+    """Column-oriented batch of issues.
+
+    Holds one list of issue ids plus dictionary-encoded creator, assigned group
+    and creator group columns, so a batch costs a few bytes per row beyond its
+    ids instead of one Issue object per row. Indexing or iterating builds Issue
+    objects on demand; nothing keeps them.
+    """
+    __slots__ = ('issue_ids', 'creator_user_ids', 'assigned_groups', 'creator_groups')
+
+    def __init__(self):
+        self.issue_ids: List[str] = []
+        self.creator_user_ids = DictionaryColumn()
+        self.assigned_groups = DictionaryColumn()
+        self.creator_groups = DictionaryColumn()
+
+    @classmethod
+    def from_issues(cls, issues: Iterable[Issue]) -> 'IssueBatch':
+        batch = cls()
+        for issue in issues:
+            batch.append(issue.issue_id, issue.creator_user_id, issue.assigned_group, issue.creator_group)
+        return batch
+
+    @classmethod
+    def from_columns(
+        cls,
+        issue_ids: Sequence[str],
+        creator_user_ids: Iterable[str],
+        assigned_groups: Iterable[str],
+        creator_groups: Iterable[Optional[str]]
+    ) -> 'IssueBatch':
+        batch = cls()
+        batch.issue_ids = list(issue_ids)
+        batch.creator_user_ids = DictionaryColumn(creator_user_ids)
+        batch.assigned_groups = DictionaryColumn(assigned_groups)
+        batch.creator_groups = DictionaryColumn(creator_groups)
+        return batch
+
+    def append(
+        self,
+        issue_id: str,
+        creator_user_id: str,
+        assigned_group: str,
+        creator_group: Optional[str] = None
+    ) -> None:
+        self.issue_ids.append(issue_id)
+        self.creator_user_ids.append(creator_user_id)
+        self.assigned_groups.append(assigned_group)
+        self.creator_groups.append(creator_group)
+
+    def __len__(self) -> int:
+        return len(self.issue_ids)
+
+    def __getitem__(self, index: int) -> Issue:
+        return Issue(
+            issue_id=self.issue_ids[index],
+            creator_user_id=self.creator_user_ids[index],
+            assigned_group=self.assigned_groups[index],
+            creator_group=self.creator_groups[index]
+        )
+
+    def __iter__(self) -> Iterator[Issue]:
+        return (self[index] for index in range(len(self)))
+
+    def unique_creator_user_ids(self) -> List[str]:
+        """Distinct creators in this batch, read straight from the column dictionary"""
+        return list(self.creator_user_ids.values)
+
+    def take(self, indices: Iterable[int]) -> 'IssueBatch':
+        """A new batch holding the given rows, in the order given"""
+        batch = IssueBatch()
+        for index in indices:
+            batch.append(
+                self.issue_ids[index],
+                self.creator_user_ids[index],
+                self.assigned_groups[index],
+                self.creator_groups[index]
+            )
+        return batch
+
+    def split(self, size: int) -> Iterator['IssueBatch']:
+        """Yield consecutive batches of at most size rows"""
+        if len(self) <= size:
+            yield self
+            return
+        for start in range(0, len(self), size):
+            yield self.take(range(start, min(start + size, len(self))))
+
 @dataclass
 class ProcessingResult:
     """Tracks the results of batch processing operations"""
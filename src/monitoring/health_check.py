@@ -1,22 +1,45 @@
-from typing import Dict, Any, Optional
+import threading
+import time
+from typing import Dict, Any, Optional, Callable, Tuple
 from datetime import datetime
 import requests
 from core.logging import ContextLogger
 from config import Config
+from data_source import DataSource, SnowflakeDataSource
 
 class ServiceHealth:
-    def __init__(self, config: Config, logger: Optional[ContextLogger] = None):
+    """Probes the services a run depends on.
+
+    Probes run concurrently, each bounded by timeout seconds, and healthy
+    results are reused for cache_ttl seconds. Snowflake is only probed when
+    the run reads from a SnowflakeDataSource, through that source's own
+    connection.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        logger: Optional[ContextLogger] = None,
+        timeout: Optional[float] = None,
+        cache_ttl: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
         self.config = config
         self.logger = logger or ContextLogger(__name__)
+        self.timeout = timeout if timeout is not None else config.health_check_timeout
+        self.cache_ttl = cache_ttl if cache_ttl is not None else config.health_check_cache_ttl
         self.last_check: Optional[datetime] = None
         self.status: Dict[str, Any] = {}
+        self.data_source: Optional[DataSource] = None
+        self._clock = clock
+        self._cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
 
     def check_devrev_api(self) -> Dict[str, Any]:
         try:
             response = requests.get(
                 f"{self.config.devrev_base_url.rstrip('/')}/health",
                 headers={"Authorization": f"Bearer {self.config.devrev_api_token}"},
-                timeout=5
+                timeout=self.timeout
             )
             response.raise_for_status()
             return {"status": "healthy", "latency_ms": response.elapsed.total_seconds() * 1000}
@@ -25,6 +48,14 @@ class ServiceHealth:
 
     def check_snowflake(self) -> Dict[str, Any]:
         try:
+            if isinstance(self.data_source, SnowflakeDataSource):
+                # Reuse the source's lazy connection so the run doesn't log in twice
+                conn = self.data_source.connection
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT CURRENT_TIMESTAMP()")
+                    result = cursor.fetchone()
+                return {"status": "healthy", "timestamp": str(result[0])}
+
             from snowflake.connector import connect
             conn = connect(
                 account=self.config.snowflake_account,
@@ -32,7 +63,8 @@ class ServiceHealth:
                 password=self.config.snowflake_password,
                 warehouse=self.config.snowflake_warehouse,
                 database=self.config.snowflake_database,
-                schema=self.config.snowflake_schema
+                schema=self.config.snowflake_schema,
+                login_timeout=self.timeout
             )
             with conn.cursor() as cursor:
                 cursor.execute("SELECT CURRENT_TIMESTAMP()")
@@ -47,7 +79,7 @@ class ServiceHealth:
             response = requests.get(
                 f"{self.config.devrev_base_url.rstrip('/')}/rate_limit",
                 headers={"Authorization": f"Bearer {self.config.devrev_api_token}"},
-                timeout=5
+                timeout=self.timeout
             )
             response.raise_for_status()
             return {
@@ -58,29 +90,76 @@ class ServiceHealth:
         except Exception as e:
             return {"status": "unhealthy", "error": str(e)}
 
-    def check_all(self) -> Dict[str, Any]:
+    def required_probes(self) -> Dict[str, Callable[[], Dict[str, Any]]]:
+        """The probes this run depends on, given the data source it reads from"""
+        probes = {
+            "devrev_api": self.check_devrev_api,
+            "rate_limits": self.check_rate_limits
+        }
+        if isinstance(self.data_source, SnowflakeDataSource):
+            probes["snowflake"] = self.check_snowflake
+        return probes
+
+    def _run_probes(self, probes: Dict[str, Callable[[], Dict[str, Any]]]) -> Dict[str, Dict[str, Any]]:
+        """Run probes on daemon threads so one that hangs can't delay the others or block exit"""
+        results: Dict[str, Dict[str, Any]] = {}
+        threads = []
+        for name, probe in probes.items():
+            thread = threading.Thread(
+                target=lambda name=name, probe=probe: results.__setitem__(name, probe()),
+                name=f"health-{name}",
+                daemon=True
+            )
+            thread.start()
+            threads.append((name, thread))
+
+        deadline = self._clock() + self.timeout
+        for name, thread in threads:
+            thread.join(max(0.0, deadline - self._clock()))
+            if thread.is_alive():
+                results[name] = {"status": "unhealthy", "error": f"timed out after {self.timeout}s"}
+        return {name: results[name] for name in probes}
+
+    def check_all(self, data_source: Optional[DataSource] = None) -> Dict[str, Any]:
+        if data_source is not None:
+            self.data_source = data_source
         self.last_check = datetime.utcnow()
+        now = self._clock()
+
+        services: Dict[str, Dict[str, Any]] = {}
+        stale = {}
+        for name, probe in self.required_probes().items():
+            cached = self._cache.get(name)
+            if cached is not None and now - cached[0] < self.cache_ttl:
+                services[name] = cached[1]
+            else:
+                stale[name] = probe
+
+        for name, result in self._run_probes(stale).items():
+            services[name] = result
+            # Only healthy results are reused; a failing dependency is re-probed next time
+            if result["status"] == "healthy":
+                self._cache[name] = (now, result)
+            else:
+                self._cache.pop(name, None)
+
         self.status = {
             "timestamp": self.last_check.isoformat(),
-            "services": {
-                "devrev_api": self.check_devrev_api(),
-                "snowflake": self.check_snowflake(),
-                "rate_limits": self.check_rate_limits()
-            }
+            "services": services
         }
-        
+
         # Calculate overall health
         self.status["overall"] = all(
-            service["status"] == "healthy" 
+            service["status"] == "healthy"
             for service in self.status["services"].values()
         )
-        
+
         self.logger.info(
             "Health check completed",
             status=self.status
         )
-        
+
         return self.status
 
     def get_last_check(self) -> Optional[Dict[str, Any]]:
-        return self.status if self.last_check else None
\ No newline at end of file
+        return self.status if self.last_check else None
@@ -1,9 +1,70 @@
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, Any, Optional
-from prometheus_client import Counter, Gauge, Histogram
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 from core.logging import ContextLogger
 
+_METRIC_NAMES = (
+    'issues_processed', 'updates_success', 'updates_failed', 'processing_duration', 'api_calls_total',
+    'active_batches', 'rate_limit_wait_seconds', 'user_group_cache_hits', 'api_concurrency_limit',
+    'user_group_cache_misses', 'circuit_breaker_state', 'api_request_duration', 'batch_duration',
+    'issues_in_flight'
+)
+
+class _PendingMetric:
+    """Stands in for a Prometheus metric until metrics are first served or exported.
+
+    Counter increments and gauge values are kept per label set so they can be
+    carried over; histogram observations are dropped.
+    """
+
+    def __init__(self, values: Optional[Dict[Tuple, float]] = None, key: Tuple = ()):
+        self.values = {} if values is None else values
+        self.key = key
+
+    def labels(self, **labels: str) -> '_PendingMetric':
+        return _PendingMetric(self.values, tuple(sorted(labels.items())))
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.values[self.key] = self.values.get(self.key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.inc(-amount)
+
+    def set(self, value: float) -> None:
+        self.values[self.key] = value
+
+    def observe(self, value: float) -> None:
+        pass
+
+@lru_cache(maxsize=None)
+def _prometheus_metrics() -> Dict[str, Any]:
+    """Import prometheus_client and register the metrics on first use, once per process"""
+    from prometheus_client import Counter, Gauge, Histogram
+
+    return {
+        'issues_processed': Counter('issues_processed_total', 'Total number of issues processed'),
+        'updates_success': Counter('updates_success_total', 'Total number of successful updates'),
+        'updates_failed': Counter('updates_failed_total', 'Total number of failed updates'),
+        'processing_duration': Histogram('processing_duration_seconds', 'Time spent processing issues'),
+        'api_calls_total': Counter('api_calls_total', 'Total number of API calls made'),
+        'active_batches': Gauge('active_batches', 'Number of currently processing batches'),
+        'rate_limit_wait_seconds': Counter('rate_limit_wait_seconds_total', 'Time requests spent waiting on the API rate limiter'),
+        'user_group_cache_hits': Counter('user_group_cache_hits_total', 'User group lookups served from the on-disk cache'),
+        'api_concurrency_limit': Gauge('api_concurrency_limit', 'Current adaptive limit on in-flight API requests'),
+        'user_group_cache_misses': Counter('user_group_cache_misses_total', 'User group lookups that had to call the API'),
+        'circuit_breaker_state': Gauge('circuit_breaker_state', 'Circuit breaker state per endpoint (0 closed, 1 half-open, 2 open)', ['endpoint']),
+        'api_request_duration': Histogram(
+            'api_request_duration_seconds', 'DevRev API request latency', ['endpoint', 'status'],
+            buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+        ),
+        'batch_duration': Histogram(
+            'batch_duration_seconds', 'Wall-clock time per batch by stage', ['stage'],
+            buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+        ),
+        'issues_in_flight': Gauge('issues_in_flight', 'Issues read from the source whose batch has not completed')
+    }
+
 @dataclass
 class MetricsCollector:
     start_time: datetime = field(default_factory=datetime.utcnow)
@@ -13,17 +74,34 @@ class MetricsCollector:
     failed_updates: int = 0
     processing_time: float = 0.0
     api_calls: int = 0
+    rate_limit_wait_time: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
     
-    # Prometheus metrics
-    issues_processed = Counter('issues_processed_total', 'Total number of issues processed')
-    updates_success = Counter('updates_success_total', 'Total number of successful updates')
-    updates_failed = Counter('updates_failed_total', 'Total number of failed updates')
-    processing_duration = Histogram('processing_duration_seconds', 'Time spent processing issues')
-    api_calls_total = Counter('api_calls_total', 'Total number of API calls made')
-    active_batches = Gauge('active_batches', 'Number of currently processing batches')
+    CIRCUIT_STATE_VALUES = {'closed': 0, 'half_open': 1, 'open': 2}
 
     def __post_init__(self):
         self.logger = ContextLogger(__name__)
+        # Runs that never serve metrics never import prometheus_client
+        self._exporting = False
+        self.__dict__.update({name: _PendingMetric() for name in _METRIC_NAMES})
+
+    def _start_exporting(self) -> None:
+        """Swap in the process-wide Prometheus metrics, carrying over what was recorded so far"""
+        if self._exporting:
+            return
+        from prometheus_client import Counter, Gauge
+
+        for name, metric in _prometheus_metrics().items():
+            pending = self.__dict__[name]
+            for key, value in pending.values.items():
+                target = metric.labels(**dict(key)) if key else metric
+                if isinstance(metric, Gauge):
+                    target.set(value)
+                elif isinstance(metric, Counter) and value > 0:
+                    target.inc(value)
+            self.__dict__[name] = metric
+        self._exporting = True
 
     def record_process_start(self, total_issues: int) -> None:
         self.total_issues = total_issues
@@ -45,12 +123,54 @@ class MetricsCollector:
         self.api_calls += 1
         self.api_calls_total.inc()
 
+    def record_request(self, endpoint: str, status: str, seconds: float) -> None:
+        self.api_request_duration.labels(endpoint=endpoint, status=status).observe(seconds)
+
+    def record_batch_stage(self, stage: str, seconds: float) -> None:
+        self.batch_duration.labels(stage=stage).observe(seconds)
+
+    def record_issues_in_flight(self, count: int) -> None:
+        self.issues_in_flight.set(count)
+
+    def record_rate_limit_wait(self, seconds: float) -> None:
+        self.rate_limit_wait_time += seconds
+        self.rate_limit_wait_seconds.inc(seconds)
+
+    def record_cache_lookup(self, hits: int, misses: int) -> None:
+        self.cache_hits += hits
+        self.cache_misses += misses
+        self.user_group_cache_hits.inc(hits)
+        self.user_group_cache_misses.inc(misses)
+
+    def record_concurrency_limit(self, limit: int) -> None:
+        self.api_concurrency_limit.set(limit)
+
+    def record_circuit_state(self, endpoint: str, state: str) -> None:
+        self.circuit_breaker_state.labels(endpoint=endpoint).set(self.CIRCUIT_STATE_VALUES[state])
+        self.logger.warning("Circuit breaker state changed", endpoint=endpoint, state=state)
+
     def record_batch_start(self) -> None:
         self.active_batches.inc()
 
     def record_batch_complete(self) -> None:
         self.active_batches.dec()
 
+    def record_process_complete(self) -> None:
+        self.processing_duration.observe((datetime.utcnow() - self.start_time).total_seconds())
+
+    def serve(self, port: int) -> None:
+        """Expose all metrics for Prometheus scraping on a background HTTP server"""
+        self._start_exporting()
+        from prometheus_client import start_http_server
+        start_http_server(port)
+        self.logger.info("Metrics endpoint started", port=port)
+
+    def export(self) -> bytes:
+        """Render all metrics in the Prometheus text exposition format"""
+        self._start_exporting()
+        from prometheus_client import generate_latest
+        return generate_latest()
+
     def get_current_metrics(self) -> Dict[str, Any]:
         current_time = datetime.utcnow()
         processing_time = (current_time - self.start_time).total_seconds()
@@ -64,5 +184,8 @@ class MetricsCollector:
             "success_rate": f"{(self.successful_updates/self.processed_issues)*100:.2f}%" if self.processed_issues > 0 else "0%",
             "processing_time": f"{processing_time:.2f}s",
             "api_calls": self.api_calls,
+            "rate_limit_wait_time": f"{self.rate_limit_wait_time:.2f}s",
+            "user_group_cache_hits": self.cache_hits,
+            "user_group_cache_misses": self.cache_misses,
             "average_processing_time": f"{processing_time/self.processed_issues:.2f}s" if self.processed_issues > 0 else "0s"
         }
\ No newline at end of file
@@ -0,0 +1,130 @@
+import logging
+import mmap
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import Iterator, List, Tuple
+from models import IssueBatch
+from csv_scanner import Columns, read_header, record_boundary, scan_missing_rows
+
+READ_BLOCK_SIZE = 8 * 1024 * 1024
+# Per range; the rest are only counted so a bad export can't flood the log
+MAX_REPORTED_ERRORS = 10
+
+logger = logging.getLogger(__name__)
+
+def count_quotes(path: str, start: int, end: int) -> int:
+    """Number of '"' bytes in [start, end)"""
+    count = 0
+    with open(path, 'rb') as f:
+        f.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            block = f.read(min(READ_BLOCK_SIZE, remaining))
+            if not block:
+                break
+            count += block.count(b'"')
+            remaining -= len(block)
+    return count
+
+def parse_range(
+    path: str,
+    index: int,
+    nominal_start: int,
+    nominal_end: int,
+    start_in_quotes: bool,
+    end_in_quotes: bool,
+    file_size: int,
+    columns: Columns
+) -> Tuple[int, IssueBatch, List[str], int]:
+    """Scan the records of one nominal byte range, keeping rows with an empty creator_group.
+
+    Both ends are moved forward to the next record boundary, so neighbouring
+    ranges agree on who owns a record that straddles the split point. Runs in
+    a worker process and returns (index, batch, error samples, error count).
+    """
+    batch = IssueBatch()
+    errors: List[str] = []
+    error_count = 0
+
+    def on_error(message: str) -> None:
+        nonlocal error_count
+        error_count += 1
+        if len(errors) < MAX_REPORTED_ERRORS:
+            errors.append(message)
+
+    with open(path, 'rb') as f:
+        start = nominal_start if index == 0 else record_boundary(f, nominal_start, start_in_quotes)
+        end = file_size if nominal_end >= file_size else record_boundary(f, nominal_end, end_in_quotes)
+        if start < end:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                for issue_id, creator_user_id, assigned_group in scan_missing_rows(buffer, start, end, columns, on_error):
+                    batch.append(issue_id, creator_user_id, assigned_group)
+    return index, batch, errors, error_count
+
+def iter_csv_ranges(
+    path: str,
+    workers: int,
+    chunk_bytes: int,
+    preserve_order: bool = True
+) -> Iterator[IssueBatch]:
+    """Parse a CSV export on worker processes, one IssueBatch per byte range.
+
+    The file is cut into chunk_bytes ranges. A first parallel pass counts
+    quotes per range, which gives the quoting state at every split point, so
+    each worker can align its range to record boundaries even when quoted
+    fields contain newlines. At most 2 * workers ranges are parsed or waiting
+    to be consumed at a time. Batches are yielded in file order when
+    preserve_order is set, otherwise as soon as each range is parsed.
+    """
+    columns, header_end = read_header(path)
+    file_size = os.path.getsize(path)
+    starts = list(range(header_end, file_size, chunk_bytes))
+    ends = starts[1:] + [file_size]
+
+    # spawn, not fork: the parent may already be running client and health-check threads
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+        quote_counts = list(executor.map(count_quotes, [path] * len(starts), starts, ends))
+        in_quotes = []
+        parity = 0
+        for count in quote_counts:
+            in_quotes.append(bool(parity))
+            parity ^= count & 1
+        in_quotes.append(bool(parity))
+
+        pending = iter(range(len(starts)))
+        in_flight: "deque[Future]" = deque()
+
+        def submit_next() -> bool:
+            for index in pending:
+                in_flight.append(executor.submit(
+                    parse_range, path, index, starts[index], ends[index],
+                    in_quotes[index], in_quotes[index + 1], file_size, columns
+                ))
+                return True
+            return False
+
+        try:
+            while len(in_flight) < workers * 2 and submit_next():
+                pass
+
+            while in_flight:
+                if preserve_order:
+                    future = in_flight.popleft()
+                else:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    future = next(f for f in in_flight if f in done)
+                    in_flight.remove(future)
+
+                index, batch, errors, error_count = future.result()
+                submit_next()
+                for error in errors:
+                    logger.error(f"Error processing CSV {error}")
+                if error_count > len(errors):
+                    logger.error(f"{error_count - len(errors)} more unparseable records in CSV range {index}")
+                if len(batch):
+                    yield batch
+        finally:
+            for future in in_flight:
+                future.cancel()
@@ -1,4 +1,7 @@
-from typing import List, Callable, TypeVar, Generic, Optional
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from itertools import islice
+from typing import List, Callable, TypeVar, Generic, Optional, Iterable, Iterator, Sequence, Tuple
 from dataclasses import dataclass
 from core.logging import ContextLogger
 
@@ -7,8 +10,9 @@ R = TypeVar('R')
 
 @dataclass
 class BatchResult(Generic[T, R]):
-    input_items: List[T]
-    output_items: List[R]
+    # Lists, or whatever sequence type the batches were passed in as (e.g. IssueBatch)
+    input_items: Sequence[T]
+    output_items: Sequence[R]
     success: bool
     error: Optional[Exception] = None
 
@@ -17,10 +21,16 @@ class BatchProcessor(Generic[T, R]):
         self,
         batch_size: int,
         max_consecutive_failures: int,
-        logger: Optional[ContextLogger] = None
+        logger: Optional[ContextLogger] = None,
+        max_in_flight_batches: int = 1,
+        preserve_order: bool = True
     ):
+        if max_in_flight_batches <= 0:
+            raise ValueError("max_in_flight_batches must be positive")
         self.batch_size = batch_size
         self.max_consecutive_failures = max_consecutive_failures
+        self.max_in_flight_batches = max_in_flight_batches
+        self.preserve_order = preserve_order
         self.consecutive_failures = 0
         self.logger = logger or ContextLogger(__name__)
 
@@ -29,36 +39,117 @@ class BatchProcessor(Generic[T, R]):
         items: List[T],
         process_func: Callable[[List[T]], List[R]]
     ) -> List[BatchResult[T, R]]:
-        results = []
-        
-        for i in range(0, len(items), self.batch_size):
-            batch = items[i:i + self.batch_size]
+        return list(self.process_stream(items, process_func))
+
+    def process_stream(
+        self,
+        items: Iterable[T],
+        process_func: Callable[[List[T]], Sequence[R]]
+    ) -> Iterator[BatchResult[T, R]]:
+        """Lazily slice items into batches and yield each result as it completes"""
+        return self.process_batches(self.batches(items), process_func)
+
+    def process_batches(
+        self,
+        batches: Iterable[Sequence[T]],
+        process_func: Callable[[Sequence[T]], Sequence[R]]
+    ) -> Iterator[BatchResult[T, R]]:
+        """Process batches that are already built, such as columnar IssueBatches, without re-slicing them"""
+        if self.max_in_flight_batches > 1:
+            yield from self._process_concurrently(batches, process_func)
+            return
+
+        for batch_index, batch in enumerate(batches):
             try:
                 processed_items = process_func(batch)
-                results.append(BatchResult(
-                    input_items=batch,
-                    output_items=processed_items,
-                    success=True
-                ))
-                self.consecutive_failures = 0
-                
+                error = None
             except Exception as e:
-                self.consecutive_failures += 1
-                self.logger.error(
-                    "Batch processing failed",
-                    batch_index=i//self.batch_size,
-                    error=str(e)
-                )
-                results.append(BatchResult(
-                    input_items=batch,
-                    output_items=[],
-                    success=False,
-                    error=e
-                ))
-                
-                if self.consecutive_failures >= self.max_consecutive_failures:
-                    raise Exception(
-                        f"Max consecutive failures ({self.max_consecutive_failures}) reached"
-                    )
-                    
-        return results
\ No newline at end of file
+                processed_items, error = [], e
+            yield self._record_result(batch_index, batch, processed_items, error)
+
+    def _process_concurrently(
+        self,
+        batches: Iterable[Sequence[T]],
+        process_func: Callable[[Sequence[T]], Sequence[R]]
+    ) -> Iterator[BatchResult[T, R]]:
+        """Run up to max_in_flight_batches batches on a thread pool.
+
+        Results are yielded in input order when preserve_order is set, otherwise
+        as soon as each batch finishes. Consecutive failures are counted in the
+        order results are yielded.
+        """
+        batches = enumerate(batches)
+        in_flight: "deque[Tuple[int, Sequence[T], Future]]" = deque()
+
+        def submit_next() -> bool:
+            for batch_index, batch in batches:
+                in_flight.append((batch_index, batch, executor.submit(process_func, batch)))
+                return True
+            return False
+
+        with ThreadPoolExecutor(max_workers=self.max_in_flight_batches) as executor:
+            try:
+                while len(in_flight) < self.max_in_flight_batches and submit_next():
+                    pass
+
+                while in_flight:
+                    if self.preserve_order:
+                        # future.exception() below blocks until the oldest batch is done
+                        entry = in_flight.popleft()
+                    else:
+                        done, _ = wait([future for _, _, future in in_flight], return_when=FIRST_COMPLETED)
+                        entry = next(e for e in in_flight if e[2] in done)
+                        in_flight.remove(entry)
+
+                    batch_index, batch, future = entry
+                    error = future.exception()
+                    processed_items = future.result() if error is None else []
+                    result = self._record_result(batch_index, batch, processed_items, error)
+                    submit_next()
+                    yield result
+            finally:
+                # On abort (or an abandoned generator) drop batches that have not started
+                for _, _, future in in_flight:
+                    future.cancel()
+
+    def batches(self, items: Iterable[T]) -> Iterator[List[T]]:
+        """Slice items into lists of at most batch_size"""
+        iterator = iter(items)
+        while True:
+            batch = list(islice(iterator, self.batch_size))
+            if not batch:
+                return
+            yield batch
+
+    def _record_result(
+        self,
+        batch_index: int,
+        batch: Sequence[T],
+        processed_items: Sequence[R],
+        error: Optional[Exception]
+    ) -> BatchResult[T, R]:
+        """Build the batch result and enforce max_consecutive_failures"""
+        if error is None:
+            self.consecutive_failures = 0
+            return BatchResult(
+                input_items=batch,
+                output_items=processed_items,
+                success=True
+            )
+
+        self.consecutive_failures += 1
+        self.logger.error(
+            "Batch processing failed",
+            batch_index=batch_index,
+            error=str(error)
+        )
+        if self.consecutive_failures >= self.max_consecutive_failures:
+            raise Exception(
+                f"Max consecutive failures ({self.max_consecutive_failures}) reached"
+            )
+        return BatchResult(
+            input_items=batch,
+            output_items=[],
+            success=False,
+            error=error
+        )
@@ -0,0 +1,119 @@
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set
+from core.logging import ContextLogger
+
+@dataclass
+class CheckpointState:
+    completed_ids: Set[str] = field(default_factory=set)
+    cursor: Optional[str] = None
+    # Source positions (e.g. Snowflake partition keys) to restart reading after
+    positions: Optional[Dict[str, Any]] = None
+    batches: int = 0
+
+class CheckpointJournal:
+    """Append-only journal of completed issue ids, one JSON line per batch.
+
+    A record may also carry a cursor, a position in the input below which
+    everything succeeded; plan replay uses the plan byte offset. Backfill
+    records instead carry the data source's positions when they move. They
+    share a line with the ids that let them move, so they are exactly as
+    durable as those ids.
+
+    Each record is flushed to the OS as soon as it is written, so a crashed
+    process loses nothing; fsync is group-committed at most once per
+    sync_interval seconds so the journal never throttles the update rate.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        resume: bool = False,
+        sync_interval: float = 1.0,
+        logger: Optional[ContextLogger] = None
+    ):
+        self.path = path
+        self.sync_interval = sync_interval
+        self.logger = logger or ContextLogger(__name__)
+        self.state = self._load() if resume else CheckpointState()
+        self._file = open(path, 'a' if resume else 'w', encoding='utf-8')
+        self._last_sync = time.monotonic()
+
+    def _load(self) -> CheckpointState:
+        """Replay the journal, truncating a torn final record left by a crash"""
+        state = CheckpointState()
+        if not os.path.exists(self.path):
+            return state
+
+        valid_length = 0
+        with open(self.path, 'rb') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    if not line.endswith(b'\n'):
+                        raise ValueError("incomplete record")
+                except ValueError:
+                    self.logger.warning(
+                        "Discarding torn checkpoint record",
+                        path=self.path,
+                        offset=valid_length
+                    )
+                    break
+                state.completed_ids.update(record["ids"])
+                if record.get("cursor") is not None:
+                    state.cursor = record["cursor"]
+                if record.get("positions") is not None:
+                    state.positions = record["positions"]
+                state.batches += 1
+                valid_length += len(line)
+
+        if valid_length != os.path.getsize(self.path):
+            with open(self.path, 'r+b') as f:
+                f.truncate(valid_length)
+
+        self.logger.info(
+            "Loaded checkpoint",
+            path=self.path,
+            batches=state.batches,
+            completed=len(state.completed_ids),
+            cursor=state.cursor
+        )
+        return state
+
+    def is_completed(self, issue_id: str) -> bool:
+        return issue_id in self.state.completed_ids
+
+    def record_batch(
+        self,
+        issue_ids: List[str],
+        cursor: Optional[str] = None,
+        positions: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Append the ids finished by one batch and, optionally, the low-water cursor or source positions"""
+        record: Dict[str, Any] = {} if cursor is None else {"cursor": cursor}
+        if positions is not None:
+            record["positions"] = positions
+            self.state.positions = positions
+        record["ids"] = issue_ids
+        self._file.write(json.dumps(record, separators=(',', ':')) + '\n')
+        self._file.flush()
+        # completed_ids only holds what was loaded for resume, keeping memory flat
+        if cursor is not None:
+            self.state.cursor = cursor
+        self.state.batches += 1
+
+        if time.monotonic() - self._last_sync >= self.sync_interval:
+            self.sync()
+
+    def sync(self) -> None:
+        """Force every record written so far to stable storage"""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self.sync()
+            self._file.close()
@@ -1,19 +1,33 @@
-from typing import List, Optional, Any
-from dataclasses import dataclass
+import json
+import os
+import threading
+from typing import Dict, Optional, IO
 from core.logging import ContextLogger
 
-@dataclass
-class DryRunResult:
-    operation: str
-    target: str
-    params: dict
-    would_execute: bool
-    notes: Optional[str] = None
-
 class DryRunProcessor:
-    def __init__(self, logger: Optional[ContextLogger] = None):
+    """Records planned operations without keeping them in memory.
+
+    Each operation is appended as one compact JSON line to plan_path (if set)
+    and only counted here. The file is written as plan_path + '.tmp' and
+    renamed only when the run closes it as complete, so a plan that exists on
+    disk is always complete; a failed run leaves just the '.tmp' file. One in
+    every log_sample_every operations is logged.
+    """
+
+    def __init__(
+        self,
+        logger: Optional[ContextLogger] = None,
+        plan_path: Optional[str] = None,
+        log_sample_every: int = 1000
+    ):
         self.logger = logger or ContextLogger(__name__)
-        self.operations: List[DryRunResult] = []
+        self.plan_path = plan_path
+        self.log_sample_every = max(1, log_sample_every)
+        self.total_operations = 0
+        self.would_execute = 0
+        self.operations_by_type: Dict[str, int] = {}
+        self._plan_file: Optional[IO[str]] = None
+        self._lock = threading.Lock()
 
     def record_operation(
         self,
@@ -23,33 +37,63 @@ class DryRunProcessor:
         would_execute: bool = True,
         notes: Optional[str] = None
     ) -> None:
-        result = DryRunResult(
-            operation=operation,
-            target=target,
-            params=params,
-            would_execute=would_execute,
-            notes=notes
-        )
-        self.operations.append(result)
-        self.logger.info(
-            f"DRY RUN: Would {operation} {target}",
-            params=params,
-            would_execute=would_execute,
-            notes=notes
-        )
+        record = {"operation": operation, "target": target, "params": params}
+        if not would_execute:
+            record["would_execute"] = False
+        if notes:
+            record["notes"] = notes
+        line = json.dumps(record, separators=(',', ':')) + '\n'
+
+        with self._lock:
+            self.total_operations += 1
+            self.would_execute += would_execute
+            self.operations_by_type[operation] = self.operations_by_type.get(operation, 0) + 1
+            if self.plan_path:
+                if self._plan_file is None:
+                    # Opened on first use so a run that fails at startup leaves any old plan alone
+                    self._plan_file = open(self.plan_path + '.tmp', 'w', buffering=1024 * 1024)
+                self._plan_file.write(line)
+            sampled = (self.total_operations - 1) % self.log_sample_every == 0
+
+        if sampled:
+            self.logger.info(
+                f"DRY RUN: Would {operation} {target}",
+                params=params,
+                would_execute=would_execute,
+                notes=notes,
+                operations_so_far=self.total_operations
+            )
+
+    def close(self, complete: bool = True) -> None:
+        """Flush the plan file and, if the run completed, move it into place"""
+        with self._lock:
+            if not self.plan_path:
+                return
+            if not complete:
+                if self._plan_file is not None:
+                    self._plan_file.close()
+                    self._plan_file = None
+                    self.logger.warning(
+                        "Dry run did not complete; plan not published",
+                        partial_plan=self.plan_path + '.tmp',
+                        operations=self.total_operations
+                    )
+                return
+            if self._plan_file is None:
+                # Nothing planned: still replace any older plan so it can't be applied by mistake
+                self._plan_file = open(self.plan_path + '.tmp', 'w')
+            self._plan_file.flush()
+            os.fsync(self._plan_file.fileno())
+            self._plan_file.close()
+            self._plan_file = None
+            os.replace(self.plan_path + '.tmp', self.plan_path)
+        self.logger.info("Dry run plan written", path=self.plan_path, operations=self.total_operations)
 
     def get_summary(self) -> dict:
         return {
-            "total_operations": len(self.operations),
-            "operations_by_type": self._group_by_operation_type(),
-            "would_execute": len([op for op in self.operations if op.would_execute]),
-            "would_skip": len([op for op in self.operations if not op.would_execute])
+            "total_operations": self.total_operations,
+            "operations_by_type": dict(self.operations_by_type),
+            "would_execute": self.would_execute,
+            "would_skip": self.total_operations - self.would_execute,
+            "plan_path": self.plan_path
         }
-
-    def _group_by_operation_type(self) -> dict:
-        result = {}
-        for op in self.operations:
-            if op.operation not in result:
-                result[op.operation] = 0
-            result[op.operation] += 1
-        return result
\ No newline at end of file
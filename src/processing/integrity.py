@@ -1,4 +1,9 @@
-from typing import List, Dict, Any, Optional
+import csv
+import math
+import random
+import tempfile
+from statistics import NormalDist
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Set, Tuple
 from dataclasses import dataclass
 from models import Issue
 from core.logging import ContextLogger
@@ -9,15 +14,244 @@ class IntegrityCheckResult:
     mismatches: List[str]
     details: Dict[str, Any]
 
+@dataclass
+class StratumStats:
+    population: int = 0
+    sampled: int = 0
+    mismatched: int = 0
+
+def required_sample_size(confidence: float, error_bound: float, population: Optional[int] = None) -> int:
+    """Cochran sample size for a proportion at worst-case p=0.5, with finite population correction"""
+    z = NormalDist().inv_cdf(1 - (1 - confidence) / 2)
+    n0 = z * z * 0.25 / (error_bound * error_bound)
+    if population:
+        n0 = n0 / (1 + (n0 - 1) / population)
+    return math.ceil(n0)
+
+def wilson_interval(rate: float, n: int, confidence: float) -> Tuple[float, float]:
+    """Wilson score interval, which stays sensible when no mismatches were sampled"""
+    if n == 0:
+        return 0.0, 1.0
+    z = NormalDist().inv_cdf(1 - (1 - confidence) / 2)
+    denominator = 1 + z * z / n
+    center = (rate + z * z / (2 * n)) / denominator
+    half_width = z * math.sqrt(rate * (1 - rate) / n + z * z / (4 * n * n)) / denominator
+    return max(0.0, center - half_width), min(1.0, center + half_width)
+
 class DataIntegrityChecker:
-    def __init__(self, logger: Optional[ContextLogger] = None):
+    """Compares read-back issues with what was written.
+
+    In 'sample' mode only a sample of the updated issues is read back,
+    stratified by creator group: the first min_per_stratum issues of every
+    group are always checked so small groups are represented. When the total
+    is known the rest are Bernoulli-sampled per batch at a rate sized from
+    confidence and error_bound. Otherwise a uniform reservoir of the
+    infinite-population sample size is kept instead and read back through
+    take_reservoir() once every batch has been processed.
+
+    Updated issues that are not read back straight away are spilled to a
+    temporary file. The first sampled mismatch escalates to full
+    verification: every later batch is verified in full and the spilled
+    issues are handed back through take_spilled() to be read back too, so
+    no update goes unchecked once a mismatch has been seen.
+    """
+
+    def __init__(
+        self,
+        logger: Optional[ContextLogger] = None,
+        mode: str = "full",
+        confidence: float = 0.95,
+        error_bound: float = 0.01,
+        min_per_stratum: int = 5,
+        stratify: bool = True,
+        seed: Optional[int] = None
+    ):
+        if mode not in ("full", "sample"):
+            raise ValueError(f"Unknown verification mode: {mode}")
         self.logger = logger or ContextLogger(__name__)
+        self.mode = mode
+        self.confidence = confidence
+        self.error_bound = error_bound
+        self.sample_rate = 0.0
+        # Set by begin() when the total is unknown; the reservoir is filled by Algorithm R
+        self.reservoir_size: Optional[int] = None
+        self.reservoir: List[Issue] = []
+        self._offered = 0
+        self.min_per_stratum = min_per_stratum
+        self.stratify = stratify
+        self.escalated = False
+        self.strata: Dict[Optional[str], StratumStats] = {}
+        # Exact counts for batches verified in full after escalation
+        self.fully_verified = 0
+        self.full_mismatches = 0
+        self._rng = random.Random(seed)
+        # Updated issues not read back yet, as (issue_id, creator_user_id, assigned_group, creator_group) rows
+        self._spill = None
+        self._spill_writer = None
+        self._spilled = 0
+        # Reservoir issues already read back, which the spill still holds
+        self._reservoir_ids: Set[str] = set()
+
+    def begin(self, total: Optional[int]) -> None:
+        """Size the sample for a run of total issues, or fall back to a reservoir if it isn't known"""
+        if self.mode != "sample":
+            return
+        if total:
+            required = required_sample_size(self.confidence, self.error_bound, total)
+            self.sample_rate = min(1.0, required / total)
+            self.reservoir_size = None
+            self.logger.info(
+                "Sampling verification",
+                required_sample=required,
+                sample_rate=round(self.sample_rate, 5)
+            )
+        else:
+            self.reservoir_size = required_sample_size(self.confidence, self.error_bound)
+            self.logger.info(
+                "Sampling verification with unknown total; reading the sample back at the end of the run",
+                required_sample=self.reservoir_size
+            )
+
+    def select_for_verification(self, issues: List[Issue]) -> List[Issue]:
+        """Return the updated issues in this batch that should be read back"""
+        if self.mode == "full" or self.escalated:
+            return issues
+
+        selected = []
+        for issue in issues:
+            stats = self.strata.setdefault(self._stratum(issue), StratumStats())
+            stats.population += 1
+            if stats.population <= self.min_per_stratum:
+                selected.append(issue)
+                continue
+            if self.reservoir_size is not None:
+                self._offer(issue)
+            elif self._rng.random() < self.sample_rate:
+                selected.append(issue)
+                continue
+            self._spill_issue(issue)
+        return selected
+
+    def _spill_issue(self, issue: Issue) -> None:
+        if self._spill is None:
+            self._spill = tempfile.TemporaryFile('w+', newline='', prefix='verify-spill-')
+            self._spill_writer = csv.writer(self._spill)
+        self._spill_writer.writerow((issue.issue_id, issue.creator_user_id, issue.assigned_group, issue.creator_group or ''))
+        self._spilled += 1
+
+    def take_spilled(self, chunk_size: int) -> Iterator[List[Issue]]:
+        """After escalation, hand over every updated issue not read back yet in chunks, and forget them.
+
+        Reservoir issues not yet read back are included, so the reservoir is
+        emptied; those that take_reservoir() already handed out are skipped.
+        """
+        self.reservoir = []
+        if self._spill is None:
+            return
+        spill, self._spill = self._spill, None
+        self.logger.info("Re-verifying updates that were not sampled before the mismatch", issues=self._spilled)
+        self._spilled = 0
+        with spill:
+            spill.seek(0)
+            chunk = []
+            for issue_id, creator_user_id, assigned_group, creator_group in csv.reader(spill):
+                if issue_id in self._reservoir_ids:
+                    continue
+                chunk.append(Issue(issue_id, creator_user_id, assigned_group, creator_group or None))
+                if len(chunk) == chunk_size:
+                    yield chunk
+                    chunk = []
+            if chunk:
+                yield chunk
+
+    def close(self) -> None:
+        """Delete the spill file"""
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+
+    def _offer(self, issue: Issue) -> None:
+        self._offered += 1
+        if len(self.reservoir) < self.reservoir_size:
+            self.reservoir.append(issue)
+        else:
+            slot = self._rng.randrange(self._offered)
+            if slot < self.reservoir_size:
+                self.reservoir[slot] = issue
+
+    def take_reservoir(self) -> List[Issue]:
+        """Hand over the reservoir sample for read-back and empty it"""
+        reservoir, self.reservoir = self.reservoir, []
+        self._reservoir_ids.update(issue.issue_id for issue in reservoir)
+        return reservoir
+
+    def verify_batch(
+        self,
+        expected_issues: List[Issue],
+        fetched_issues: List[Issue],
+        unverified_ids: Iterable[str] = ()
+    ) -> IntegrityCheckResult:
+        """Verify creator groups and feed the outcome into the sampling estimate"""
+        unverified = set(unverified_ids)
+        result = self.verify_field_updates(expected_issues, fetched_issues, "creator_group", unverified)
+        if self.mode == "full":
+            return result
+
+        if self.escalated:
+            self.fully_verified += len(expected_issues) - len(unverified)
+            self.full_mismatches += len(result.mismatches)
+            return result
+
+        fetched_groups = {issue.issue_id: issue.creator_group for issue in fetched_issues}
+        for issue in expected_issues:
+            if issue.issue_id in unverified:
+                continue
+            stats = self.strata[self._stratum(issue)]
+            stats.sampled += 1
+            if fetched_groups.get(issue.issue_id, object()) != issue.creator_group:
+                stats.mismatched += 1
+
+        if not result.passed:
+            self.escalated = True
+            self.logger.warning(
+                "Sampled verification found mismatches, verifying every update in full",
+                mismatches=len(result.mismatches)
+            )
+        return result
+
+    def sampling_report(self) -> Dict[str, Any]:
+        """Estimated mismatch rate over the sampled phase, with a confidence interval"""
+        population = sum(s.population for s in self.strata.values())
+        sampled = sum(s.sampled for s in self.strata.values())
+        covered = [s for s in self.strata.values() if s.sampled]
+        covered_population = sum(s.population for s in covered)
+        # Stratified estimate: each group's rate weighted by its share of updated issues
+        rate = sum(
+            (s.population / covered_population) * (s.mismatched / s.sampled)
+            for s in covered
+        ) if covered_population else 0.0
+        low, high = wilson_interval(rate, sampled, self.confidence)
+        return {
+            "sampled_population": population,
+            "sampled": sampled,
+            "sample_mismatches": sum(s.mismatched for s in self.strata.values()),
+            "estimated_mismatch_rate": rate,
+            "confidence": self.confidence,
+            "interval": (low, high),
+            "escalated": self.escalated,
+            "fully_verified": self.fully_verified,
+            "full_mismatches": self.full_mismatches
+        }
+
+    def _stratum(self, issue: Issue) -> Optional[str]:
+        return issue.creator_group if self.stratify else None
 
     def verify_updates(
         self,
         original_issues: List[Issue],
         updated_issues: List[Issue]
     ) -> IntegrityCheckResult:
+        """Check that every original issue came back, matching by issue_id rather than position"""
         mismatches = []
         details = {
             "total_checked": len(original_issues),
@@ -30,11 +264,10 @@ class DataIntegrityChecker:
                 f"Count mismatch: {len(original_issues)} vs {len(updated_issues)}"
             )
 
-        for orig, updated in zip(original_issues, updated_issues):
-            if orig.issue_id != updated.issue_id:
-                mismatches.append(
-                    f"ID mismatch: {orig.issue_id} vs {updated.issue_id}"
-                )
+        updated_ids = {issue.issue_id for issue in updated_issues}
+        for orig in original_issues:
+            if orig.issue_id not in updated_ids:
+                mismatches.append(f"Missing updated issue: {orig.issue_id}")
                 details["mismatched"] += 1
             else:
                 details["matched"] += 1
@@ -51,18 +284,34 @@ class DataIntegrityChecker:
         self,
         original_issues: List[Issue],
         updated_issues: List[Issue],
-        field_name: str
+        field_name: str,
+        unverified_ids: Iterable[str] = ()
     ) -> IntegrityCheckResult:
+        """Hash-join both sides on issue_id and compare field_name.
+
+        Ids in unverified_ids (e.g. whose read-back failed) are counted but
+        not reported as mismatches.
+        """
         mismatches = []
         details = {
             "total_checked": len(original_issues),
             "field": field_name,
             "updates_verified": 0,
-            "updates_failed": 0
+            "updates_failed": 0,
+            "unverified": 0
         }
 
-        for orig, updated in zip(original_issues, updated_issues):
-            if getattr(orig, field_name) != getattr(updated, field_name):
+        updated_by_id = {issue.issue_id: issue for issue in updated_issues}
+        unverified = set(unverified_ids)
+        for orig in original_issues:
+            updated = updated_by_id.get(orig.issue_id)
+            if updated is None:
+                if orig.issue_id in unverified:
+                    details["unverified"] += 1
+                    continue
+                mismatches.append(f"Issue {orig.issue_id} not found when verifying {field_name}")
+                details["updates_failed"] += 1
+            elif getattr(orig, field_name) != getattr(updated, field_name):
                 mismatches.append(
                     f"Field {field_name} mismatch for issue {orig.issue_id}: "
                     f"{getattr(orig, field_name)} vs {getattr(updated, field_name)}"
@@ -75,4 +324,4 @@ class DataIntegrityChecker:
             passed=len(mismatches) == 0,
             mismatches=mismatches,
             details=details
-        )
\ No newline at end of file
+        )
@@ -0,0 +1,35 @@
+import json
+from dataclasses import dataclass
+from typing import Iterator
+
+@dataclass
+class PlanEntry:
+    issue_id: str
+    group_id: str
+    # Byte offset just past this entry's line; reading resumes from here
+    offset: int
+
+class PlanFormatError(ValueError):
+    """Raised when a dry-run plan line cannot be parsed"""
+    pass
+
+def read_plan(path: str, start_offset: int = 0) -> Iterator[PlanEntry]:
+    """Stream the creator group updates recorded by DryRunProcessor, starting at a byte offset"""
+    with open(path, 'rb') as f:
+        f.seek(start_offset)
+        offset = start_offset
+        for line in f:
+            line_start, offset = offset, offset + len(line)
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                if record["operation"] != "update" or not record.get("would_execute", True):
+                    continue
+                kind, _, issue_id = record["target"].partition("/")
+                if kind != "issue" or not issue_id:
+                    raise ValueError(f"unexpected target {record['target']!r}")
+                group_id = record["params"]["creator_group"]
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                raise PlanFormatError(f"Invalid plan entry at byte {line_start} of {path}: {e}") from e
+            yield PlanEntry(issue_id=issue_id, group_id=group_id, offset=offset)
@@ -1,7 +1,9 @@
+import sys
+import time
 from dataclasses import dataclass, field
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Callable
 from datetime import datetime
-from tqdm import tqdm
+from core.logging import ContextLogger
 
 @dataclass
 class ProcessingMetrics:
@@ -30,22 +32,117 @@ class ProcessingMetrics:
         }
 
 class ProgressTracker:
-    def __init__(self, total: int, desc: str = "Processing"):
-        self.progress_bar = tqdm(total=total, desc=desc)
-        self.metrics = ProcessingMetrics(total=total)
+    """Counts processed issues and renders progress at most refresh_rate times a second.
+
+    In bar mode a tqdm bar shows EWMA throughput, ETA and in-flight issues. In
+    log mode (the default when stderr is not a TTY) the same figures are
+    emitted as a structured log line every log_interval seconds instead.
+    """
+
+    def __init__(
+        self,
+        total: Optional[int],
+        desc: str = "Processing",
+        refresh_rate: float = 2.0,
+        mode: str = "auto",
+        log_interval: float = 30.0,
+        smoothing: float = 0.3,
+        logger: Optional[ContextLogger] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        if mode == "auto":
+            mode = "bar" if sys.stderr.isatty() else "log"
+        if mode not in ("bar", "log"):
+            raise ValueError(f"Unknown progress mode: {mode}")
+        self.mode = mode
+        self.desc = desc
+        self.refresh_interval = 1 / refresh_rate if refresh_rate > 0 else 0.0
+        self.log_interval = log_interval
+        self.smoothing = smoothing
+        self.logger = logger or ContextLogger(__name__)
+        self._clock = clock
+        # total may be unknown when consuming a streaming data source
+        self.metrics = ProcessingMetrics(total=total or 0)
+        self.in_flight = 0
+        self.throughput: Optional[float] = None
+        self.progress_bar = None
+        if mode == "bar":
+            # Headless runs never import tqdm
+            from tqdm import tqdm
+            self.progress_bar = tqdm(total=total, desc=desc)
+
+        now = clock()
+        self._next_render = now + self.refresh_interval
+        self._next_log = now + log_interval
+        self._last_sample_time = now
+        self._last_sample_count = 0
+        self._rendered = 0
+
+    def update(self, status: str, count: int = 1) -> None:
+        self.metrics.processed += count
 
-    def update(self, status: str) -> None:
-        self.metrics.processed += 1
-        
         if status == "success":
-            self.metrics.successful += 1
+            self.metrics.successful += count
         elif status == "failed":
-            self.metrics.failed += 1
+            self.metrics.failed += count
         elif status == "skipped":
-            self.metrics.skipped += 1
-            
-        self.progress_bar.update(1)
-        self.progress_bar.set_postfix(self.metrics.to_dict())
+            self.metrics.skipped += count
+
+        now = self._clock()
+        if now >= self._next_render:
+            self._render(now)
+
+    def set_in_flight(self, count: int) -> None:
+        self.in_flight = count
+
+    @property
+    def eta_seconds(self) -> Optional[float]:
+        remaining = self.metrics.total - self.metrics.processed
+        if not self.metrics.total or not self.throughput or remaining <= 0:
+            return None
+        return remaining / self.throughput
+
+    def _sample_throughput(self, now: float) -> None:
+        elapsed = now - self._last_sample_time
+        if elapsed <= 0:
+            return
+        rate = (self.metrics.processed - self._last_sample_count) / elapsed
+        if self.throughput is None:
+            self.throughput = rate
+        else:
+            self.throughput += self.smoothing * (rate - self.throughput)
+        self._last_sample_time = now
+        self._last_sample_count = self.metrics.processed
+
+    def _render(self, now: float, force: bool = False) -> None:
+        self._next_render = now + self.refresh_interval
+        self._sample_throughput(now)
+
+        if self.progress_bar is not None:
+            self.progress_bar.update(self.metrics.processed - self._rendered)
+            self._rendered = self.metrics.processed
+            eta = self.eta_seconds
+            self.progress_bar.set_postfix({
+                "rate": f"{self.throughput or 0.0:.1f}/s",
+                "eta": f"{eta:.0f}s" if eta is not None else "?",
+                "in_flight": self.in_flight,
+                "failed": self.metrics.failed
+            })
+        elif force or now >= self._next_log:
+            self._next_log = now + self.log_interval
+            self.logger.info(
+                self.desc,
+                processed=self.metrics.processed,
+                total=self.metrics.total or None,
+                successful=self.metrics.successful,
+                failed=self.metrics.failed,
+                skipped=self.metrics.skipped,
+                issues_per_sec=round(self.throughput or 0.0, 1),
+                eta_seconds=round(self.eta_seconds) if self.eta_seconds is not None else None,
+                in_flight=self.in_flight
+            )
 
     def close(self) -> None:
-        self.progress_bar.close()
\ No newline at end of file
+        self._render(self._clock(), force=True)
+        if self.progress_bar is not None:
+            self.progress_bar.close()
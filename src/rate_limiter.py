@@ -0,0 +1,218 @@
+import asyncio
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Mapping, Optional, Set, Tuple
+
+# x-ratelimit-reset values above this are treated as epoch timestamps rather than deltas
+_EPOCH_THRESHOLD = 1_000_000_000
+# Slack for refills that land a hair short of a whole token after sleeping the estimated delay
+_EPSILON = 1e-9
+
+def _parse_float(value: Optional[str]) -> Optional[float]:
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given either in seconds or as an HTTP date"""
+    if value is None:
+        return None
+    seconds = _parse_float(value)
+    if seconds is not None:
+        return max(seconds, 0.0)
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+class TokenBucketRateLimiter:
+    """Thread-safe token bucket shared by every request a client makes.
+
+    The refill rate starts at a configured value and is re-derived from the
+    x-ratelimit-* headers of each response, so requests are paced slightly
+    under the server quota instead of discovering it through 429s.
+
+    The bucket never lends tokens ahead of the refill. A caller that finds it
+    empty takes a ticket and sleeps for roughly as many refills as there are
+    tickets ahead of it, then checks again at whatever the rate is by then,
+    so a rate change reprices every waiter instead of only new callers. No
+    single sleep exceeds max_wait_step.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        safety_factor: float = 0.9,
+        min_rate: float = 0.1,
+        default_backoff: float = 1.0,
+        min_reset_window: float = 0.25,
+        min_window_remaining: float = 10,
+        max_wait_step: float = 0.25,
+        on_wait: Optional[Callable[[float], None]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self.safety_factor = safety_factor
+        self.min_rate = min_rate
+        self.default_backoff = default_backoff
+        self.min_reset_window = min_reset_window
+        self.min_window_remaining = min_window_remaining
+        self.max_wait_step = max_wait_step
+        self.on_wait = on_wait
+        self.total_wait_seconds = 0.0
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        # May lie in the future while the bucket is blocked by the server
+        self._updated = clock()
+        # Waiting callers hold tickets in [_serving, _next_ticket); _left holds those that
+        # got a token out of turn or gave up, until _serving moves past them
+        self._serving = 0
+        self._next_ticket = 0
+        self._left: Set[int] = set()
+        # When the server window the current rate was derived from resets, and the fastest rate seen in it
+        self._window_end: Optional[float] = None
+        self._window_rate = 0.0
+
+    def _refill(self, now: float) -> None:
+        if self._window_end is not None and now >= self._window_end:
+            # Pace the next window like the start of the last one rather than its tail
+            self._add_tokens(self._window_end)
+            self.rate = max(self.rate, self._window_rate)
+            self._window_end = None
+        self._add_tokens(now)
+
+    def _add_tokens(self, now: float) -> None:
+        if now > self._updated:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+    def _leave(self, ticket: int) -> None:
+        """Drop a ticket from the queue (lock must be held)"""
+        self._left.add(ticket)
+        while self._serving in self._left:
+            self._left.remove(self._serving)
+            self._serving += 1
+
+    def try_acquire(self, ticket: Optional[int] = None) -> Tuple[float, Optional[int]]:
+        """Take a token if the caller may have one now.
+
+        Returns (0.0, None) once a token is taken. Otherwise returns how long to
+        sleep before calling again and the ticket to call with, which keeps the
+        caller's place behind the ones that started waiting earlier.
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            ahead = (self._next_ticket if ticket is None else ticket) - self._serving
+            if self._updated <= now and self._tokens >= ahead + 1 - _EPSILON:
+                self._tokens -= 1
+                if ticket is not None:
+                    self._leave(ticket)
+                return 0.0, None
+            if ticket is None:
+                ticket = self._next_ticket
+                self._next_ticket += 1
+            delay = max(self._updated - now, 0.0) + max(ahead + 1 - self._tokens, 0.0) / self.rate
+            return min(max(delay, _EPSILON), self.max_wait_step), ticket
+
+    def abandon(self, ticket: int) -> None:
+        """Give up a ticket without taking a token, e.g. when the waiting caller is cancelled"""
+        with self._lock:
+            self._leave(ticket)
+
+    def _record_wait(self, waited: float) -> None:
+        if waited > 0:
+            with self._lock:
+                self.total_wait_seconds += waited
+            if self.on_wait is not None:
+                self.on_wait(waited)
+
+    def acquire(self) -> float:
+        """Block until a request may be sent; returns the time spent waiting"""
+        waited = 0.0
+        delay, ticket = self.try_acquire()
+        try:
+            while ticket is not None:
+                self._sleep(delay)
+                waited += delay
+                delay, ticket = self.try_acquire(ticket)
+        finally:
+            if ticket is not None:
+                self.abandon(ticket)
+        self._record_wait(waited)
+        return waited
+
+    async def acquire_async(self) -> float:
+        """Asyncio variant of acquire()"""
+        waited = 0.0
+        delay, ticket = self.try_acquire()
+        try:
+            while ticket is not None:
+                await asyncio.sleep(delay)
+                waited += delay
+                delay, ticket = self.try_acquire(ticket)
+        finally:
+            if ticket is not None:
+                self.abandon(ticket)
+        self._record_wait(waited)
+        return waited
+
+    def _block_for(self, seconds: float) -> None:
+        """Stop handing out tokens until `seconds` from now (lock must be held)"""
+        until = self._clock() + seconds
+        if until > self._updated:
+            self._tokens = min(self._tokens, 0.0)
+            self._updated = until
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """Re-derive the refill rate from x-ratelimit-remaining/reset response headers.
+
+        Windows that reset within min_reset_window seconds or have fewer than
+        min_window_remaining requests left don't change the rate: a handful of
+        requests over a fraction of a second says nothing about the next window
+        and would throttle the client far below the quota. If those last
+        requests run out early, remaining=0 blocks the bucket until the reset.
+        Once a window resets, the rate goes back up to the fastest one derived
+        during it.
+        """
+        remaining = _parse_float(headers.get('x-ratelimit-remaining'))
+        reset = _parse_float(headers.get('x-ratelimit-reset'))
+        if remaining is None or reset is None:
+            return
+
+        reset_in = reset - time.time() if reset > _EPOCH_THRESHOLD else reset
+        reset_in = max(reset_in, 0.0)
+
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            if remaining <= 0:
+                self._block_for(reset_in)
+            elif reset_in >= self.min_reset_window and remaining >= self.min_window_remaining:
+                # Spread what is left of the window evenly over the time left in it
+                self.rate = max(self.min_rate, remaining / reset_in * self.safety_factor)
+                window_end = now + reset_in
+                if self._window_end is None or window_end > self._window_end + self.min_reset_window:
+                    self._window_rate = self.rate
+                else:
+                    self._window_rate = max(self._window_rate, self.rate)
+                self._window_end = window_end
+
+    def penalize(self, retry_after: Optional[str] = None) -> None:
+        """Back off after a 429, honoring Retry-After when the server provides it"""
+        delay = parse_retry_after(retry_after)
+        with self._lock:
+            self._refill(self._clock())
+            if delay is None:
+                delay = self.default_backoff
+                self.rate = max(self.min_rate, self.rate / 2)
+            self._block_for(delay)
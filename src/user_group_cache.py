@@ -0,0 +1,147 @@
+import logging
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Stay well below SQLite's bound-parameter limit
+_QUERY_CHUNK_SIZE = 500
+
+class UserGroupCache:
+    """Persistent user -> group cache backed by a local SQLite file.
+
+    Entries are keyed by namespace (the API base URL) as well as user id, so
+    a file filled against one DevRev environment never answers for another.
+    Users without any group are stored as negative entries (group_id NULL)
+    with their own, usually shorter, TTL. Once the cache grows past
+    max_entries the least recently used entries are evicted.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        namespace: str,
+        ttl_seconds: float,
+        negative_ttl_seconds: float,
+        max_entries: int,
+        on_lookup: Optional[Callable[[int, int], None]] = None,
+        clock: Callable[[], float] = time.time
+    ):
+        self.path = path
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.max_entries = max_entries
+        self.on_lookup = on_lookup
+        self.hits = 0
+        self.misses = 0
+        self.logger = logging.getLogger(__name__)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(user_groups)")]
+        if columns and 'namespace' not in columns:
+            # Written before entries were namespaced; there is no telling which environment they came from
+            self.logger.info(f"Discarding user group cache {path} without a namespace column")
+            self._conn.execute("DROP TABLE user_groups")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS user_groups (
+                namespace TEXT NOT NULL,
+                user_id TEXT NOT NULL,
+                group_id TEXT,
+                expires_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (namespace, user_id)
+            )
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_user_groups_last_access ON user_groups (last_access)"
+        )
+        self._conn.commit()
+        # Kept up to date by put_many and _evict so the size bound never needs a full-table COUNT
+        (self._count,) = self._conn.execute("SELECT COUNT(*) FROM user_groups").fetchone()
+
+    def get_many(self, user_ids: List[str]) -> Tuple[Dict[str, Optional[str]], List[str]]:
+        """Return (cached user -> group or None, ids that must be fetched)"""
+        now = self._clock()
+        found: Dict[str, Optional[str]] = {}
+
+        with self._lock:
+            for i in range(0, len(user_ids), _QUERY_CHUNK_SIZE):
+                chunk = user_ids[i:i + _QUERY_CHUNK_SIZE]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT user_id, group_id FROM user_groups "
+                    f"WHERE namespace = ? AND user_id IN ({placeholders}) AND expires_at > ?",
+                    (self.namespace, *chunk, now)
+                ).fetchall()
+                found.update(rows)
+                if rows:
+                    hit_ids = [row[0] for row in rows]
+                    self._conn.execute(
+                        f"UPDATE user_groups SET last_access = ? "
+                        f"WHERE namespace = ? AND user_id IN ({','.join('?' * len(hit_ids))})",
+                        (now, self.namespace, *hit_ids)
+                    )
+            self._conn.commit()
+
+        misses = [user_id for user_id in user_ids if user_id not in found]
+        self.hits += len(found)
+        self.misses += len(misses)
+        if self.on_lookup is not None:
+            self.on_lookup(len(found), len(misses))
+        return found, misses
+
+    def put_many(self, entries: Dict[str, Optional[str]]) -> None:
+        """Store user -> group mappings; None records a user with no group"""
+        if not entries:
+            return
+        now = self._clock()
+        rows = [
+            (
+                self.namespace,
+                user_id,
+                group_id,
+                now + (self.ttl_seconds if group_id is not None else self.negative_ttl_seconds),
+                now
+            )
+            for user_id, group_id in entries.items()
+        ]
+        user_ids = list(entries)
+        with self._lock:
+            # Replacing an entry doesn't grow the table, so only count the ids not stored yet
+            for i in range(0, len(user_ids), _QUERY_CHUNK_SIZE):
+                chunk = user_ids[i:i + _QUERY_CHUNK_SIZE]
+                (existing,) = self._conn.execute(
+                    f"SELECT COUNT(*) FROM user_groups "
+                    f"WHERE namespace = ? AND user_id IN ({','.join('?' * len(chunk))})",
+                    (self.namespace, *chunk)
+                ).fetchone()
+                self._count += len(chunk) - existing
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO user_groups (namespace, user_id, group_id, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries, then least recently used ones beyond max_entries (lock held)"""
+        if self._count <= self.max_entries:
+            return
+        self._count -= self._conn.execute("DELETE FROM user_groups WHERE expires_at <= ?", (now,)).rowcount
+        overflow = self._count - self.max_entries
+        if overflow > 0:
+            self._count -= self._conn.execute(
+                "DELETE FROM user_groups WHERE rowid IN "
+                "(SELECT rowid FROM user_groups ORDER BY last_access LIMIT ?)",
+                (overflow,)
+            ).rowcount
+            self.logger.debug(f"Evicted {overflow} least recently used user group entries")
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,48 @@
+from src.adaptive_concurrency import AIMDConcurrencyController
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+def test_aimd_grows_additively_while_healthy():
+    """Test that healthy requests raise the limit by about one per round trip"""
+    changes = []
+    controller = AIMDConcurrencyController(initial_limit=4, max_limit=100, on_change=changes.append)
+
+    for _ in range(4 + 5 + 6):
+        controller.record(0.05)
+
+    # Roughly +1 per limit's worth of successes, never jumping by more than one
+    assert 6 <= controller.limit <= 7
+    assert changes == list(range(5, controller.limit + 1))
+
+def test_aimd_backs_off_once_per_round_trip():
+    """Test that a burst of 429s halves the limit once, then again a round trip later"""
+    clock = FakeClock()
+    controller = AIMDConcurrencyController(initial_limit=40, clock=clock)
+    controller.record(0.1)
+
+    for _ in range(10):
+        controller.record(0.1, throttled=True)
+    assert controller.limit == 20
+
+    clock.now += 0.2
+    controller.record(0.1, success=False)
+    assert controller.limit == 10
+
+def test_aimd_backs_off_on_latency_inflation():
+    """Test that latency well above the baseline shrinks the limit"""
+    clock = FakeClock()
+    controller = AIMDConcurrencyController(initial_limit=32, smoothing=0.5, clock=clock)
+    for _ in range(5):
+        controller.record(0.05)
+    limit = controller.limit
+
+    for _ in range(5):
+        clock.now += 1
+        controller.record(1.0)
+
+    assert controller.limit < limit / 2
@@ -0,0 +1,70 @@
+import asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from src.config import Config
+from src.async_devrev_client import AsyncDevRevClient
+
+def test_async_client_bounds_in_flight_updates():
+    """Test that concurrent updates never exceed the configured in-flight limit"""
+
+    state = {"in_flight": 0, "peak": 0, "updated": []}
+
+    async def works_update(request):
+        body = await request.json()
+        state["in_flight"] += 1
+        state["peak"] = max(state["peak"], state["in_flight"])
+        await asyncio.sleep(0.01)
+        state["in_flight"] -= 1
+        state["updated"].append(body["id"])
+        if body["id"] == "ISSUE-missing":
+            return web.json_response({"error": "not found"}, status=404)
+        return web.json_response({"work": {"id": body["id"]}})
+
+    async def run():
+        app = web.Application()
+        app.router.add_post("/works.update", works_update)
+        async with TestServer(app) as server:
+            config = Config()
+            config.devrev_base_url = str(server.make_url("/"))
+            async with AsyncDevRevClient(config, max_in_flight=4) as client:
+                updates = [(f"ISSUE-{i}", "GROUP-A") for i in range(20)]
+                updates.append(("ISSUE-missing", "GROUP-A"))
+                return await client.update_issues_creator_group(updates)
+
+    results = asyncio.run(run())
+
+    assert results == [True] * 20 + [False]
+    assert len(state["updated"]) == 21
+    assert 1 < state["peak"] <= 4
+
+def test_truncated_body_reports_probe_outcome():
+    """Test that a half-open probe whose body is cut off re-opens the breaker instead of wedging it"""
+
+    async def truncated(reader, writer):
+        await reader.readuntil(b"\r\n\r\n")
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\nContent-Length: 1000\r\n\r\n{\"work\"")
+        await writer.drain()
+        writer.close()
+
+    async def run():
+        server = await asyncio.start_server(truncated, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        config = Config()
+        config.devrev_base_url = f"http://127.0.0.1:{port}/"
+        config.circuit_failure_threshold = 1
+        config.circuit_recovery_timeout = 0
+        try:
+            async with AsyncDevRevClient(config) as client:
+                breaker = client.circuit_breakers.get("works.update")
+                outcomes = [await client.update_issue_creator_group("ISSUE-1", "GROUP-A") for _ in range(3)]
+                return outcomes, breaker
+        finally:
+            server.close()
+            await server.wait_closed()
+
+    outcomes, breaker = asyncio.run(run())
+
+    # Every attempt went out as a probe and failed; none was rejected by a wedged breaker
+    assert outcomes == [False] * 3
+    assert breaker.state == "open" and breaker.consecutive_failures == 3
+    assert breaker._probes_in_flight == 0
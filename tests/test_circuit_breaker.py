@@ -0,0 +1,83 @@
+from src.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+def test_breaker_opens_after_consecutive_failures():
+    """Test that the breaker opens at the threshold and a success resets the count"""
+    changes = []
+    breaker = CircuitBreaker('works.update', failure_threshold=3,
+                             on_state_change=lambda name, state: changes.append((name, state)))
+
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.allow_request()
+
+    breaker.record_failure()
+    assert not breaker.allow_request()
+    assert changes == [('works.update', 'open')]
+
+def test_breaker_half_open_limits_probes_and_closes_on_success():
+    """Test that only half_open_max_calls probes go out and a good probe closes it"""
+    clock = FakeClock()
+    breaker = CircuitBreaker('works.update', failure_threshold=1, recovery_timeout=5,
+                             half_open_max_calls=2, clock=clock)
+    breaker.record_failure()
+
+    clock.now = 4.9
+    assert not breaker.allow_request()
+    assert abs(breaker.retry_after() - 0.1) < 1e-9
+
+    clock.now = 5.0
+    assert [breaker.allow_request() for _ in range(3)] == [True, True, False]
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert breaker.retry_after() == 0.5
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow_request()
+    assert breaker.retry_after() == 0
+
+def test_breaker_failed_probe_reopens():
+    """Test that a failed probe re-opens the breaker for another recovery timeout"""
+    clock = FakeClock()
+    breaker = CircuitBreaker('works.update', failure_threshold=2, recovery_timeout=5, clock=clock)
+    breaker.record_failure()
+    breaker.record_failure()
+
+    clock.now = 5
+    assert breaker.allow_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    clock.now = 9
+    assert not breaker.allow_request()
+    clock.now = 10
+    assert breaker.allow_request()
+
+def test_straggler_success_does_not_close_open_breaker():
+    """Test that a response to a request sent before opening is ignored"""
+    breaker = CircuitBreaker('works.update', failure_threshold=1)
+    breaker.record_failure()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.OPEN
+
+def test_registry_keeps_one_breaker_per_endpoint():
+    """Test that endpoints trip independently and report their state"""
+    changes = []
+    registry = CircuitBreakerRegistry(failure_threshold=1,
+                                      on_state_change=lambda name, state: changes.append((name, state)))
+
+    registry.get('works.update').record_failure()
+
+    assert registry.get('works.update') is registry.get('works.update')
+    assert registry.get('users.list').allow_request()
+    assert registry.states() == {'works.update': 'open', 'users.list': 'closed'}
+    assert changes == [('works.update', 'open')]
@@ -1,6 +1,9 @@
+import gzip
 import pytest
 from src.config import Config
-from src.data_source import CSVDataSource, SnowflakeDataSource, DataSourceError
+from src.data_source import CSVDataSource, ParquetDataSource, SnowflakeDataSource, DataSourceError, QueryError
+from src.csv_scanner import read_header, scan_missing_rows
+from src.compressed_input import iter_record_blocks
 
 def test_csv_data_source():
     """Test CSV data source functionality"""
@@ -25,6 +28,295 @@ def test_csv_data_source():
     assert len(issues) == 1  # Should only get the issue with missing creator_group
     assert issues[0].issue_id == "ISSUE-1"
 
+def test_csv_data_source_streaming(tmp_path):
+    """Test that CSV issues are yielded lazily and chunked"""
+
+    config = Config()
+    config.csv_input_path = str(tmp_path / "issues.csv")
+
+    with open(config.csv_input_path, 'w') as f:
+        f.write("issue_id,creator_user_id,assigned_group,creator_group\n")
+        for i in range(5):
+            f.write(f"ISSUE-{i},USER-{i},GROUP-A,\n")
+        f.write("ISSUE-5,USER-5,GROUP-B,GROUP-C\n")
+
+    csv_source = CSVDataSource(config)
+
+    stream = csv_source.iter_issues_missing_creator_group()
+    assert not isinstance(stream, list)
+    assert next(stream).issue_id == "ISSUE-0"
+
+    chunks = list(csv_source.iter_issue_chunks(2))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert [issue.issue_id for chunk in chunks for issue in chunk] == [f"ISSUE-{i}" for i in range(5)]
+
+    batches = list(csv_source.iter_issue_batches(2))
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [issue_id for batch in batches for issue_id in batch.issue_ids] == [f"ISSUE-{i}" for i in range(5)]
+    assert batches[0].assigned_groups.values == ["GROUP-A"]
+    # Counting would mean a full pass before the first update, so CSV leaves it to the reservoir
+    assert csv_source.count_issues_missing_creator_group() is None
+
+def test_csv_mmap_scanner_matches_dictreader(tmp_path):
+    """Test that the byte-level pre-filter keeps exactly the rows DictReader keeps"""
+
+    config = Config()
+    config.csv_input_path = str(tmp_path / "issues.csv")
+    with open(config.csv_input_path, 'w', newline='') as f:
+        f.write("issue_id,creator_user_id,assigned_group,creator_group\r\n")
+        f.write("ISSUE-1,USER-1,GROUP-A,\r\n")
+        f.write("ISSUE-2,USER-2,GROUP-A,GROUP-B\r\n")
+        f.write("ISSUE-3, USER-3 ,GROUP-A, NULL \r\n")
+        f.write("ISSUE-4,USER-4,GROUP-A,None\r\n")
+        f.write("\r\n")
+        f.write("ISSUE-5,USER-5,GROUP-A\r\n")  # creator_group column left off
+        f.write('ISSUE-6,USER-6,"GROUP, with comma",""\r\n')
+        f.write('ISSUE-7,USER-7,GROUP-A,"GROUP-\r\nB"\r\n')
+        f.write("ISSUE-8,USER-8,GROUP-A,nonempty\r\n")
+
+    rows = {}
+    for parser in ("dictreader", "mmap"):
+        config.csv_parser = parser
+        rows[parser] = [
+            (issue.issue_id, issue.creator_user_id, issue.assigned_group)
+            for issue in CSVDataSource(config).iter_issues_missing_creator_group()
+        ]
+
+    assert rows["mmap"] == rows["dictreader"] == [
+        ("ISSUE-1", "USER-1", "GROUP-A"),
+        ("ISSUE-3", "USER-3", "GROUP-A"),
+        ("ISSUE-4", "USER-4", "GROUP-A"),
+        ("ISSUE-5", "USER-5", "GROUP-A"),
+        ("ISSUE-6", "USER-6", "GROUP, with comma")
+    ]
+
+    # Tiny blocks send the unquoted records down the raw-bytes path and the rest through csv.reader
+    columns, header_end = read_header(config.csv_input_path)
+    with open(config.csv_input_path, 'rb') as f:
+        buffer = f.read()
+    scanned = list(scan_missing_rows(buffer, header_end, len(buffer), columns, block_size=1))
+    assert scanned == rows["dictreader"]
+
+@pytest.mark.parametrize("preserve_order", [True, False])
+def test_csv_parallel_byte_ranges(tmp_path, preserve_order):
+    """Test that worker processes parse record-aligned ranges, including quoted newlines"""
+
+    config = Config()
+    config.csv_input_path = str(tmp_path / "issues.csv")
+    with open(config.csv_input_path, 'w', newline='') as f:
+        f.write("issue_id,title,creator_user_id,assigned_group,creator_group\n")
+        for i in range(200):
+            # Split points land inside multi-line quoted fields that look like records
+            title = f'"line\nISSUE-X,""t"",USER-X,GROUP-X,\n{i}"' if i % 3 == 0 else "plain"
+            creator_group = "" if i % 2 == 0 else "GROUP-C"
+            f.write(f"ISSUE-{i},{title},USER-{i % 7},GROUP-A,{creator_group}\n")
+
+    expected = [issue.issue_id for issue in CSVDataSource(config).iter_issues_missing_creator_group()]
+    assert expected == [f"ISSUE-{i}" for i in range(0, 200, 2)]
+
+    config.csv_workers = 2
+    config.csv_chunk_bytes = 97
+    config.csv_preserve_order = preserve_order
+    batches = list(CSVDataSource(config).iter_issue_batches(10))
+    issue_ids = [issue_id for batch in batches for issue_id in batch.issue_ids]
+
+    assert issue_ids == expected if preserve_order else sorted(issue_ids) == sorted(expected)
+    assert all(len(batch) <= 10 for batch in batches)
+    assert {issue.creator_user_id for batch in batches for issue in batch} == {f"USER-{i}" for i in range(7)}
+
+@pytest.mark.parametrize("compression,filename", [
+    ("gzip", "issues.csv.gz"),
+    ("gzip", "issues.csv"),  # detected from the magic bytes
+    ("zstd", "issues.csv.zst")
+])
+@pytest.mark.parametrize("parser", ["mmap", "dictreader"])
+def test_csv_compressed_input(tmp_path, compression, filename, parser):
+    """Test that compressed exports are streamed without decompressing to disk"""
+    lines = ["issue_id,title,creator_user_id,assigned_group,creator_group\n"]
+    for i in range(50):
+        title = f'"multi\nline ""{i}"""' if i % 5 == 0 else f"title {i}"
+        lines.append(f"ISSUE-{i},{title},USER-{i},GROUP-A,{'' if i % 2 == 0 else 'GROUP-B'}\n")
+    data = "".join(lines).encode()
+
+    path = tmp_path / filename
+    if compression == "gzip":
+        path.write_bytes(gzip.compress(data))
+    else:
+        zstandard = pytest.importorskip("zstandard")
+        path.write_bytes(zstandard.ZstdCompressor().compress(data))
+
+    config = Config()
+    config.csv_input_path = str(path)
+    config.csv_parser = parser
+    csv_source = CSVDataSource(config)
+
+    assert csv_source.test_connection() is True
+    assert [issue.issue_id for issue in csv_source.iter_issues_missing_creator_group()] == [
+        f"ISSUE-{i}" for i in range(0, 50, 2)
+    ]
+
+def test_record_blocks_do_not_split_quoted_newlines():
+    """Test that stream blocks only end on newlines outside quoted fields"""
+    data = b'a,b\n1,"x\ny"\n2,"""q""\n\nz"\n3,c\n'
+    chunks = [data[i:i + 3] for i in range(0, len(data), 3)]
+
+    blocks = list(iter_record_blocks(chunks))
+
+    assert b"".join(blocks) == data
+    assert all(block.count(b'"') % 2 == 0 and block.endswith(b"\n") for block in blocks)
+
+def test_record_blocks_carry_quote_parity_across_chunks():
+    """Test that a quoted field spanning many chunks is joined once instead of rescanned per chunk"""
+    data = b'a,b\n1,"' + b'x\n' * 20000 + b'"\n2,c\n'
+    chunks = [data[i:i + 1024] for i in range(0, len(data), 1024)]
+
+    blocks = list(iter_record_blocks(chunks))
+
+    assert b"".join(blocks) == data
+    assert len(blocks) == 2 and blocks[0] == b'a,b\n'
+    assert blocks[1].startswith(b'1,"x\n') and blocks[1].endswith(b'"\n2,c\n')
+
+def test_snowflake_arrow_batches():
+    """Test that Arrow result batches are turned into issue chunks column-wise"""
+    pa = pytest.importorskip("pyarrow")
+
+    class FakeCursor:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            return False
+
+        def execute(self, query):
+            self.query = query
+
+        def fetch_arrow_batches(self):
+            yield pa.table({
+                "ISSUE_ID": [1, 2],
+                "CREATOR_USER_ID": ["USER-1", "USER-2"],
+                "ASSIGNED_GROUP": ["GROUP-A", None],
+                "CREATOR_GROUP": pa.array([None, None], type=pa.string())
+            })
+            yield pa.table({
+                "ISSUE_ID": [3],
+                "CREATOR_USER_ID": ["USER-3"],
+                "ASSIGNED_GROUP": ["GROUP-B"],
+                "CREATOR_GROUP": pa.array([None], type=pa.string())
+            })
+
+    class FakeConnection:
+        def cursor(self):
+            return FakeCursor()
+
+        def close(self):
+            pass
+
+    config = Config()
+    config.snowflake_arrow_batches = True
+    snowflake_source = SnowflakeDataSource(config)
+    snowflake_source._connection = FakeConnection()
+
+    chunks = list(snowflake_source.iter_arrow_issue_chunks())
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert chunks[0][0].issue_id == "1"
+    assert chunks[0][1].assigned_group is None
+    assert [issue.issue_id for issue in snowflake_source.iter_issues_missing_creator_group()] == ["1", "2", "3"]
+    assert [batch.issue_ids for batch in snowflake_source.iter_issue_batches(1)] == [["1"], ["2"], ["3"]]
+
+class FakePartitionedConnection:
+    """Evaluates PARTITION_PAGE_QUERY parameters over in-memory rows"""
+
+    def __init__(self, rows, fail_partition=None):
+        self.rows = rows
+        self.fail_partition = fail_partition
+
+    def cursor(self):
+        connection = self
+
+        class Cursor:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *args):
+                return False
+
+            def execute(self, query, params):
+                if params['partition'] == connection.fail_partition and params['last_key'] is not None:
+                    raise RuntimeError("warehouse went away")
+                matching = sorted(
+                    row for row in connection.rows
+                    if row[0] % params['partitions'] == params['partition']
+                    and (params['last_key'] is None or row[0] > params['last_key'])
+                )
+                self.result = matching[:params['page_size']]
+
+            def fetchall(self):
+                return self.result
+
+        return Cursor()
+
+    def close(self):
+        pass
+
+def test_snowflake_partitioned_keyset_extraction():
+    """Test that partitions are paged by key and together cover every row once"""
+    rows = [(i, f"USER-{i}", "GROUP-A", None) for i in range(1, 51)]
+    config = Config()
+    config.snowflake_page_size = 4
+    snowflake_source = SnowflakeDataSource(config)
+    snowflake_source._connection = FakePartitionedConnection(rows)
+
+    issues = list(snowflake_source.iter_partitioned_issues(3))
+    assert sorted(int(issue.issue_id) for issue in issues) == list(range(1, 51))
+    assert snowflake_source.partition_positions == {0: 48, 1: 49, 2: 50}
+
+    restarted = list(snowflake_source.iter_partitioned_issues(3, start_keys={0: 30, 1: 49, 2: 50}))
+    assert sorted(int(issue.issue_id) for issue in restarted) == [33, 36, 39, 42, 45, 48]
+
+def test_snowflake_partition_positions_wait_for_acknowledgement():
+    """Test that a partition only moves past pages whose issues, and earlier pages, are all acknowledged"""
+    rows = [(i, f"USER-{i}", "GROUP-A", None) for i in range(1, 13)]
+    config = Config()
+    config.snowflake_partitions = 2
+    config.snowflake_page_size = 2
+    snowflake_source = SnowflakeDataSource(config)
+    snowflake_source._connection = FakePartitionedConnection(rows)
+
+    assert snowflake_source.track_resume_positions() is True
+    assert len(list(snowflake_source.iter_issues_missing_creator_group())) == 12
+    # Everything was handed out, but nothing is finished yet
+    assert snowflake_source.resume_positions() is None
+
+    snowflake_source.acknowledge(["2", "4", "6"])
+    snowflake_source.acknowledge(["1", "3", "7", "9", "11"])
+    assert snowflake_source.resume_positions() == {"partitions": 2, "keys": {"0": 4, "1": 3}}
+    # "5" never finished, so partition 1 stays behind it however far its later pages got
+    snowflake_source.acknowledge(["8", "10", "12"])
+    positions = snowflake_source.resume_positions()
+    assert positions == {"partitions": 2, "keys": {"0": 12, "1": 3}}
+
+    resumed = SnowflakeDataSource(config)
+    resumed._connection = FakePartitionedConnection(rows)
+    resumed.track_resume_positions(positions)
+    assert sorted(int(issue.issue_id) for issue in resumed.iter_issues_missing_creator_group()) == [5, 7, 9, 11]
+
+    config.snowflake_partitions = 3
+    mismatched = SnowflakeDataSource(config)
+    mismatched._connection = FakePartitionedConnection(rows)
+    mismatched.track_resume_positions(positions)
+    assert len(list(mismatched.iter_issues_missing_creator_group())) == 12
+
+def test_snowflake_partition_failure_reports_restart_key():
+    """Test that a failing partition surfaces the key to restart it from"""
+    rows = [(i, f"USER-{i}", "GROUP-A", None) for i in range(1, 21)]
+    config = Config()
+    config.snowflake_page_size = 2
+    snowflake_source = SnowflakeDataSource(config)
+    snowflake_source._connection = FakePartitionedConnection(rows, fail_partition=1)
+
+    with pytest.raises(QueryError, match="partition 1 failed after key 3"):
+        list(snowflake_source.iter_partitioned_issues(2))
+
 def test_snowflake_data_source():
     """Test Snowflake data source functionality"""
     
@@ -52,6 +344,45 @@ def test_snowflake_data_source():
     except DataSourceError as e:
         pytest.fail(f"Snowflake test failed: {str(e)}")
 
+def test_parquet_skips_populated_row_groups(tmp_path):
+    """Test that row groups without missing creator groups are skipped and the rest streamed in batches"""
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    (tmp_path / "exports").mkdir()
+    # Row groups of 2: [missing, missing], [set, set], [set, ''], [set, set], [set, blank], ['NULL', set]
+    pq.write_table(pa.table({
+        "issue_id": list(range(1, 13)),
+        "title": ["unused"] * 12,
+        "creator_user_id": [f"USER-{i}" for i in range(12)],
+        "assigned_group": ["GROUP-A"] * 12,
+        "creator_group": [None, None, "G", "G", "G", "", "G", "G", "G", " ", "NULL", "G"]
+    }), tmp_path / "exports" / "part-0.parquet", row_group_size=2)
+    # Second file has string ids and no creator_group column at all
+    pq.write_table(pa.table({
+        "issue_id": ["ISSUE-9"],
+        "creator_user_id": ["USER-9"],
+        "assigned_group": ["GROUP-B"]
+    }), tmp_path / "exports" / "part-1.parquet")
+
+    config = Config()
+    config.parquet_input_path = str(tmp_path / "exports")
+    parquet_source = ParquetDataSource(config)
+
+    assert parquet_source.test_connection() is True
+    batches = list(parquet_source.iter_issue_batches(2))
+
+    # Blank and 'NULL' groups count as missing, as they do in CSV input
+    assert [batch.issue_ids for batch in batches] == [["1", "2"], ["6", "10"], ["11", "ISSUE-9"]]
+    assert batches[2][1].assigned_group == "GROUP-B"
+    assert parquet_source.row_groups_skipped == 2
+    assert parquet_source.row_groups_read == 5
+    # Row group statistics can't tell blank or 'NULL' groups apart from set ones
+    assert parquet_source.count_issues_missing_creator_group() is None
+
+    config.parquet_input_path = str(tmp_path / "exports" / "part-1.parquet")
+    assert ParquetDataSource(config).count_issues_missing_creator_group() == 1
+
 if __name__ == "__main__":
 
     from src.config import Config
@@ -82,4 +413,4 @@ if __name__ == "__main__":
             issues = snowflake_source.get_issues_missing_creator_group()
             print(f"Found {len(issues)} issues with missing creator group in Snowflake")
         else:
-            print("Snowflake connection failed")
\ No newline at end of file
+            print("Snowflake connection failed")
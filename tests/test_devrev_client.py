@@ -0,0 +1,127 @@
+import pytest
+from src.config import Config
+from src.devrev_client import DevRevClient, DevRevAPIError, UserLookupError
+from src.user_group_cache import UserGroupCache
+
+@pytest.fixture
+def client(monkeypatch):
+    config = Config()
+    config.user_group_cache_path = ''
+    config.user_lookup_chunk_size = 2
+    config.user_lookup_workers = 3
+    client = DevRevClient(config)
+    monkeypatch.setattr(DevRevClient._fetch_user_chunk.retry, 'sleep', lambda seconds: None)
+    return client
+
+def users_response(ids):
+    return {'users': [{'id': user_id, 'group_refs': [f"GROUP-{user_id}"]} for user_id in ids]}
+
+def test_get_user_groups_chunks_and_retries_failed_chunk(client, monkeypatch):
+    """Test that ids are paged into chunks and only the failing chunk is retried"""
+    calls = []
+
+    def fake_request(method, endpoint, json):
+        calls.append(tuple(json['ids']))
+        if json['ids'] == ['U3', 'U4'] and calls.count(('U3', 'U4')) == 1:
+            raise DevRevAPIError("HTTP 503", 503)
+        return users_response(json['ids'])
+
+    monkeypatch.setattr(client, '_make_request', fake_request)
+
+    user_groups = client.get_user_groups(['U1', 'U2', 'U3', 'U4', 'U5'])
+
+    assert sorted(ug.user_id for ug in user_groups) == ['U1', 'U2', 'U3', 'U4', 'U5']
+    assert sorted(calls) == [('U1', 'U2'), ('U3', 'U4'), ('U3', 'U4'), ('U5',)]
+
+def test_chunk_that_keeps_failing_retryably_is_reported_failed(client, monkeypatch):
+    """Test that exhausting retries on a 5xx marks the chunk failed instead of escaping"""
+
+    def fake_request(method, endpoint, json):
+        if 'U1' in json['ids']:
+            raise DevRevAPIError("HTTP 503", 503)
+        return users_response(json['ids'])
+
+    monkeypatch.setattr(client, '_make_request', fake_request)
+
+    with pytest.raises(UserLookupError) as exc_info:
+        client.get_user_groups(['U1', 'U2', 'U3'])
+
+    assert exc_info.value.failed_user_ids == ['U1', 'U2']
+
+def test_get_user_groups_returns_partial_results_on_failure(client, monkeypatch):
+    """Test that a permanently failing chunk doesn't discard the resolved ones"""
+
+    def fake_request(method, endpoint, json):
+        if 'U1' in json['ids']:
+            raise DevRevAPIError("HTTP 400", 400)
+        return users_response(json['ids'])
+
+    monkeypatch.setattr(client, '_make_request', fake_request)
+
+    with pytest.raises(UserLookupError) as exc_info:
+        client.get_user_groups(['U1', 'U2', 'U3'])
+
+    assert exc_info.value.failed_user_ids == ['U1', 'U2']
+    assert [ug.user_id for ug in exc_info.value.user_groups] == ['U3']
+
+def test_get_user_groups_uses_cache(client, monkeypatch, tmp_path):
+    """Test that cached and negatively cached users skip the API on the next lookup"""
+    calls = []
+
+    def fake_request(method, endpoint, json):
+        calls.append(tuple(json['ids']))
+        return {'users': [{'id': 'U1', 'group_refs': ['GROUP-A']}, {'id': 'U2', 'group_refs': []}]}
+
+    monkeypatch.setattr(client, '_make_request', fake_request)
+    client.user_group_cache = UserGroupCache(
+        str(tmp_path / "cache.sqlite"), namespace="https://api.devrev.ai/internal",
+        ttl_seconds=60, negative_ttl_seconds=60, max_entries=10
+    )
+
+    first = client.get_user_groups(['U1', 'U2'])
+    second = client.get_user_groups(['U1', 'U2'])
+
+    assert [(ug.user_id, ug.group_id) for ug in first] == [('U1', 'GROUP-A')]
+    assert [(ug.user_id, ug.group_id) for ug in second] == [('U1', 'GROUP-A')]
+    assert len(calls) == 1
+    assert (client.user_group_cache.hits, client.user_group_cache.misses) == (2, 2)
+
+def test_open_circuit_fails_fast_without_calling_api(client, monkeypatch):
+    """Test that repeated 5xx responses open the breaker and later calls skip the API"""
+    import requests
+    from unittest.mock import MagicMock
+    from src.devrev_client import CircuitOpenError
+
+    response = requests.Response()
+    response.status_code = 503
+    request = MagicMock(return_value=response)
+    monkeypatch.setattr(client.session, 'request', request)
+
+    for _ in range(client.config.circuit_failure_threshold):
+        with pytest.raises(DevRevAPIError):
+            client._make_request('POST', 'works.update', json={})
+
+    with pytest.raises(CircuitOpenError):
+        client.update_issue_creator_group('ISSUE-1', 'GROUP-1')
+    assert request.call_count == client.config.circuit_failure_threshold
+
+def test_get_issue_creator_groups_reads_back_in_chunks(client, monkeypatch):
+    """Test that works are read back in parallel chunks and failed chunks are reported"""
+    client.config.verify_chunk_size = 2
+    monkeypatch.setattr(DevRevClient._fetch_work_chunk.retry, 'sleep', lambda seconds: None)
+
+    def fake_request(method, endpoint, json):
+        assert endpoint == 'works.list'
+        if 'ISSUE-3' in json['ids']:
+            raise DevRevAPIError("HTTP 400", 400)
+        return {'works': [
+            {'id': issue_id, 'creator_group': {'id': f"GROUP-{issue_id}"} if issue_id != 'ISSUE-2' else None}
+            for issue_id in json['ids']
+        ]}
+
+    monkeypatch.setattr(client, '_make_request', fake_request)
+
+    creator_groups, failed = client.get_issue_creator_groups(['ISSUE-1', 'ISSUE-2', 'ISSUE-3', 'ISSUE-4', 'ISSUE-5'])
+
+    assert creator_groups == {'ISSUE-1': 'GROUP-ISSUE-1', 'ISSUE-2': None, 'ISSUE-5': 'GROUP-ISSUE-5'}
+    assert sorted(failed) == ['ISSUE-3', 'ISSUE-4']
@@ -0,0 +1,65 @@
+import time
+from unittest.mock import MagicMock
+from src.config import Config
+from src.monitoring.health_check import ServiceHealth
+# The module's own references, so isinstance checks see the same classes
+from src.monitoring.health_check import SnowflakeDataSource
+from src.data_source import CSVDataSource
+
+def healthy():
+    return {"status": "healthy"}
+
+def make_health(monkeypatch, **kwargs):
+    health = ServiceHealth(Config(), **kwargs)
+    calls = []
+
+    def probe(name, delay=0.0):
+        def run():
+            calls.append(name)
+            time.sleep(delay)
+            return healthy()
+        return run
+
+    monkeypatch.setattr(health, 'check_devrev_api', probe('devrev_api', 0.2))
+    monkeypatch.setattr(health, 'check_rate_limits', probe('rate_limits', 0.2))
+    monkeypatch.setattr(health, 'check_snowflake', probe('snowflake', 0.2))
+    return health, calls
+
+def test_csv_run_skips_snowflake_and_probes_concurrently(monkeypatch):
+    """Test that a CSV run never probes Snowflake and probes overlap"""
+    health, calls = make_health(monkeypatch)
+
+    start = time.monotonic()
+    status = health.check_all(CSVDataSource(Config()))
+
+    assert time.monotonic() - start < 0.35
+    assert status["overall"]
+    assert sorted(calls) == ['devrev_api', 'rate_limits']
+
+def test_slow_probe_times_out_and_healthy_results_are_cached(monkeypatch):
+    """Test that a hung probe is reported unhealthy and healthy ones aren't re-run"""
+    health, calls = make_health(monkeypatch, timeout=0.1, cache_ttl=60)
+    monkeypatch.setattr(health, 'check_devrev_api', healthy)
+
+    status = health.check_all()
+    assert not status["overall"]
+    assert status["services"]["rate_limits"]["error"] == "timed out after 0.1s"
+
+    monkeypatch.setattr(health, 'check_devrev_api', lambda: {"status": "unhealthy"})
+    monkeypatch.setattr(health, 'check_rate_limits', healthy)
+    status = health.check_all()
+    assert status["services"]["devrev_api"]["status"] == "healthy"
+    assert status["overall"]
+
+def test_snowflake_probe_reuses_source_connection():
+    """Test that the Snowflake probe runs on the data source's connection"""
+    source = SnowflakeDataSource(Config())
+    cursor = MagicMock()
+    cursor.__enter__.return_value.fetchone.return_value = ("2024-01-01",)
+    source._connection = MagicMock(cursor=MagicMock(return_value=cursor))
+
+    health = ServiceHealth(Config())
+    health.data_source = source
+
+    assert health.check_snowflake() == {"status": "healthy", "timestamp": "2024-01-01"}
+    assert 'snowflake' in health.required_probes()
@@ -0,0 +1,197 @@
+import asyncio
+import threading
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from src.config import Config
+from src.main import BackfillProcessor
+# The class main checks batches against, which is models.IssueBatch rather than src.models.IssueBatch
+from src.main import IssueBatch
+from src.models import Issue
+from src.data_source import SnowflakeDataSource
+from src.processing.checkpoint import CheckpointJournal
+from tests.test_data_source import FakePartitionedConnection
+
+class FlakyDevRevServer:
+    """works.update answers the first `failures` calls with 503, then succeeds; works.list reads back what stuck"""
+
+    def __init__(self, failures: int, lost=(), rejected=()):
+        self.failures = failures
+        # Updates answered with a 404, which the client reports as failed without retrying
+        self.rejected = set(rejected)
+        # Updates acknowledged with a 200 that never take effect
+        self.lost = set(lost)
+        self.update_calls = 0
+        self.updated = {}
+        self._loop = asyncio.new_event_loop()
+        self._server = None
+
+    async def users_list(self, request):
+        body = await request.json()
+        return web.json_response({'users': [{'id': user_id, 'group_refs': ['GROUP-A']} for user_id in body['ids']]})
+
+    async def works_update(self, request):
+        body = await request.json()
+        self.update_calls += 1
+        if self.update_calls <= self.failures:
+            return web.json_response({'message': 'unavailable'}, status=503)
+        if body['id'] in self.rejected:
+            return web.json_response({'message': 'not found'}, status=404)
+        if body['id'] not in self.lost:
+            self.updated[body['id']] = body['creator_group']['id']
+        return web.json_response({'work': {'id': body['id']}})
+
+    async def works_list(self, request):
+        body = await request.json()
+        return web.json_response({'works': [
+            {'id': issue_id, 'creator_group': {'id': self.updated[issue_id]} if issue_id in self.updated else None}
+            for issue_id in body['ids']
+        ]})
+
+    def __enter__(self) -> str:
+        app = web.Application()
+        app.router.add_post('/users.list', self.users_list)
+        app.router.add_post('/works.update', self.works_update)
+        app.router.add_post('/works.list', self.works_list)
+        self._server = TestServer(app)
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+        asyncio.run_coroutine_threadsafe(self._server.start_server(), self._loop).result()
+        return str(self._server.make_url('/'))
+
+    def __exit__(self, *exc) -> None:
+        asyncio.run_coroutine_threadsafe(self._server.close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+@pytest.mark.parametrize('use_async', [False, True])
+def test_transient_5xx_burst_recovers_instead_of_aborting(use_async):
+    """Test that batches wait out an open breaker rather than counting its rejections as batch failures"""
+    server = FlakyDevRevServer(failures=5)
+    with server as base_url:
+        config = Config()
+        config.devrev_base_url = base_url
+        config.user_group_cache_path = ''
+        config.verify_updates = False
+        config.batch_size = 4
+        config.max_batch_failures = 2
+        config.circuit_failure_threshold = 2
+        config.circuit_recovery_timeout = 0.1
+        config.api_rate_limit = 1000
+        config.api_rate_burst = 1000
+        processor = BackfillProcessor(config, use_async=use_async)
+
+        issues = [Issue(f"ISSUE-{i}", f"USER-{i % 3}", "SUPPORT") for i in range(12)]
+        result = processor.process_issues(issues)
+
+    assert result.total_processed == 12
+    # Only the requests that actually got a 503 failed; everything after the probe went through
+    assert server.update_calls == 12
+    assert len(server.updated) == 7
+    assert processor.circuit_breakers.states()['works.update'] == 'closed'
+
+def test_dry_run_that_fails_midway_does_not_publish_plan(tmp_path):
+    """Test that a source error during a dry run leaves no plan that --apply-plan could pick up"""
+    plan_path = tmp_path / "plan.jsonl"
+
+    def batches():
+        yield [Issue(f"ISSUE-{i}", "USER-1", "SUPPORT") for i in range(4)]
+        raise ValueError("invalid start byte")
+
+    with FlakyDevRevServer(failures=0) as base_url:
+        config = Config()
+        config.devrev_base_url = base_url
+        config.user_group_cache_path = ''
+        config.dry_run_plan_path = str(plan_path)
+        processor = BackfillProcessor(config, dry_run=True)
+
+        with pytest.raises(ValueError):
+            processor.process_issue_batches(batches())
+
+    assert not plan_path.exists()
+    assert len((tmp_path / "plan.jsonl.tmp").read_text().splitlines()) == 4
+
+@pytest.mark.parametrize('dry_run', [False, True])
+def test_columnar_batches_are_processed_without_building_issues(monkeypatch, tmp_path, dry_run):
+    """Test that the update path reads IssueBatch columns instead of materializing an Issue per row"""
+    def no_rows(self, index):
+        raise AssertionError("IssueBatch row materialized on the update path")
+
+    with FlakyDevRevServer(failures=0) as base_url:
+        config = Config()
+        config.devrev_base_url = base_url
+        config.user_group_cache_path = ''
+        config.dry_run_plan_path = str(tmp_path / "plan.jsonl")
+        processor = BackfillProcessor(config, dry_run=dry_run, use_async=not dry_run)
+        batch = IssueBatch.from_issues(Issue(f"ISSUE-{i}", f"USER-{i % 2}", "SUPPORT") for i in range(4))
+        monkeypatch.setattr(IssueBatch, '__getitem__', no_rows)
+
+        try:
+            processed = processor._run_batch(batch, {'USER-0': 'GROUP-A', 'USER-1': None})
+        finally:
+            processor.dry_run_processor.close(complete=False)
+            processor.close()
+
+    assert processed.issue_ids == ["ISSUE-0", "ISSUE-2"]
+    assert list(processed.creator_groups) == ([None, None] if dry_run else ["GROUP-A", "GROUP-A"])
+
+def test_sample_mismatch_re_verifies_updates_that_were_not_sampled():
+    """Test that escalation reads back the earlier unsampled updates, not just the later batches"""
+    server = FlakyDevRevServer(failures=0, lost=["ISSUE-0", "ISSUE-2"])
+    with server as base_url:
+        config = Config()
+        config.devrev_base_url = base_url
+        config.user_group_cache_path = ''
+        config.verify_mode = 'sample'
+        config.verify_error_bound = 0.3
+        config.verify_min_per_group = 1
+        config.max_in_flight_batches = 1
+        processor = BackfillProcessor(config)
+
+        issues = [Issue(f"ISSUE-{i}", "USER-1", "SUPPORT") for i in range(40)]
+        # No total, so the sample is a reservoir that would only be read back at the end
+        processor.process_issue_batches(issues[i:i + 4] for i in range(0, 40, 4))
+
+    report = processor.integrity_checker.sampling_report()
+    assert report["escalated"]
+    # ISSUE-0 was sampled and escalated; ISSUE-1..3 were re-verified along with every later update
+    assert report["fully_verified"] == 39
+    assert report["full_mismatches"] == 1
+
+def test_resume_restarts_snowflake_partitions_after_their_journaled_keys(tmp_path):
+    """Test that --resume reads partitioned Snowflake input only from each partition's last finished key"""
+    rows = [(i, f"USER-{i % 3}", "SUPPORT", None) for i in range(1, 13)]
+    path = str(tmp_path / "checkpoint.jsonl")
+
+    def run(server, resume):
+        with server as base_url:
+            config = Config()
+            config.devrev_base_url = base_url
+            config.user_group_cache_path = ''
+            config.verify_updates = False
+            config.snowflake_partitions = 2
+            config.snowflake_page_size = 2
+            source = SnowflakeDataSource(config)
+            source._connection = FakePartitionedConnection(rows)
+            checkpoint = CheckpointJournal(path, resume=resume)
+            source.track_resume_positions(checkpoint.state.positions)
+            processor = BackfillProcessor(config, checkpoint=checkpoint)
+            try:
+                return processor.process_issue_batches(source.iter_issue_batches(4), source=source)
+            finally:
+                checkpoint.close()
+
+    first = FlakyDevRevServer(failures=0, rejected=["5"])
+    run(first, resume=False)
+    assert len(first.updated) == 11
+    # Partition 1 holds at the page before the failed issue 5; partition 0 finished
+    journal = CheckpointJournal(path, resume=True)
+    assert journal.state.positions == {"partitions": 2, "keys": {"0": 12, "1": 3}}
+    journal.close()
+
+    second = FlakyDevRevServer(failures=0)
+    result = run(second, resume=True)
+    # Only partition 1 after key 3 was read again; 7, 9 and 11 were skipped as completed
+    assert second.update_calls == 1 and list(second.updated) == ["5"]
+    assert result.skipped_updates == 3
+    journal = CheckpointJournal(path, resume=True)
+    assert journal.state.positions == {"partitions": 2, "keys": {"0": 12, "1": 11}}
+    journal.close()
@@ -0,0 +1,45 @@
+from prometheus_client import REGISTRY
+from src.monitoring.metrics import MetricsCollector
+
+def sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+def test_request_latency_is_labelled_by_endpoint_and_status():
+    """Test that API latencies land in per-endpoint, per-status histograms"""
+    metrics = MetricsCollector()
+    metrics.export()
+    before = sample('api_request_duration_seconds_count', endpoint='works.update', status='200')
+
+    metrics.record_request('works.update', '200', 0.02)
+    metrics.record_request('works.update', '200', 0.2)
+    metrics.record_request('works.update', '503', 1.5)
+
+    assert sample('api_request_duration_seconds_count', endpoint='works.update', status='200') == before + 2
+    assert sample('api_request_duration_seconds_bucket', endpoint='works.update', status='503', le='1.0') == 0
+    assert sample('api_request_duration_seconds_bucket', endpoint='works.update', status='503', le='2.5') >= 1
+
+def test_batch_stage_and_queue_depth():
+    """Test that batch stages are observed separately and queue depth is a gauge"""
+    metrics = MetricsCollector()
+    metrics.export()
+    before = sample('batch_duration_seconds_sum', stage='user_lookup')
+
+    metrics.record_batch_stage('user_lookup', 0.5)
+    metrics.record_issues_in_flight(250)
+
+    assert sample('batch_duration_seconds_sum', stage='user_lookup') == before + 0.5
+    assert sample('issues_in_flight') == 250
+
+def test_values_recorded_before_export_are_carried_over():
+    """Test that counters and gauges recorded before the first export show up in it"""
+    metrics = MetricsCollector()
+    before = sample('api_calls_total')
+
+    metrics.record_api_call()
+    metrics.record_api_call()
+    metrics.record_circuit_state('works.update', 'open')
+    metrics.record_request('works.update', '200', 0.02)
+
+    assert b'api_calls_total' in metrics.export()
+    assert sample('api_calls_total') == before + 2
+    assert sample('circuit_breaker_state', endpoint='works.update') == 2
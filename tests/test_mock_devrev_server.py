@@ -0,0 +1,27 @@
+import asyncio
+from aiohttp.test_utils import TestServer, TestClient
+from benchmarks.mock_devrev_server import MockDevRevServer, MockServerConfig
+
+def test_mock_server_rate_limits_and_updates():
+    """Test that the mock server reports quota headers and throttles past the limit"""
+    server = MockDevRevServer(MockServerConfig(latency='fixed:0', rate_limit=3, rate_window=60))
+
+    async def run():
+        async with TestClient(TestServer(server.build_app())) as client:
+            users = await client.post('/users.list', json={'ids': ['USER-1']})
+            body = await users.json()
+            assert users.headers['x-ratelimit-remaining'] == '2'
+            assert body['users'][0]['id'] == 'USER-1'
+
+            update = await client.post('/works.update', json={'id': 'ISSUE-1', 'creator_group': {'id': 'GROUP-1'}})
+            assert update.status == 200
+            works = await (await client.post('/works.list', json={'ids': ['ISSUE-1']})).json()
+            assert works['works'] == [{'id': 'ISSUE-1', 'creator_group': {'id': 'GROUP-1'}}]
+
+            throttled = await client.post('/works.update', json={'id': 'ISSUE-2', 'creator_group': {'id': 'GROUP-1'}})
+            assert throttled.status == 429
+            assert float(throttled.headers['Retry-After']) > 0
+
+    asyncio.run(run())
+    assert server.updated == {'ISSUE-1': 'GROUP-1'}
+    assert server.stats['throttled'] == 1
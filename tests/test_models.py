@@ -0,0 +1,39 @@
+import pickle
+from src.models import Issue, IssueBatch, UserGroup
+
+def test_issue_and_user_group_are_slotted():
+    """Test that the row models carry no per-instance __dict__"""
+    issue = Issue(issue_id="ISSUE-1", creator_user_id="USER-1", assigned_group="GROUP-A")
+    assert not hasattr(issue, "__dict__")
+    assert issue.creator_group is None
+    assert pickle.loads(pickle.dumps(issue)) == issue
+    assert not hasattr(UserGroup(user_id="USER-1", group_id="GROUP-A"), "__dict__")
+
+def test_issue_batch_dictionary_encodes_columns():
+    """Test that repeated creators and groups are stored once per batch"""
+    batch = IssueBatch()
+    for i in range(6):
+        batch.append(f"ISSUE-{i}", f"USER-{i % 2}", "GROUP-A")
+
+    assert len(batch) == 6
+    assert batch.creator_user_ids.values == ["USER-0", "USER-1"]
+    assert batch.assigned_groups.values == ["GROUP-A"]
+    assert list(batch.creator_user_ids.codes) == [0, 1, 0, 1, 0, 1]
+    assert sorted(batch.unique_creator_user_ids()) == ["USER-0", "USER-1"]
+    assert batch[-1] == Issue("ISSUE-5", "USER-1", "GROUP-A")
+    assert [issue.issue_id for issue in batch] == [f"ISSUE-{i}" for i in range(6)]
+
+def test_issue_batch_take_and_split():
+    """Test that taking and splitting rows keeps each row's values"""
+    issues = [Issue(f"ISSUE-{i}", f"USER-{i % 3}", "GROUP-A") for i in range(5)]
+    batch = IssueBatch.from_issues(issues)
+
+    taken = batch.take([4, 1])
+    taken.creator_groups[0] = "GROUP-B"
+    assert list(taken) == [
+        Issue("ISSUE-4", "USER-1", "GROUP-A", "GROUP-B"),
+        Issue("ISSUE-1", "USER-1", "GROUP-A")
+    ]
+    assert batch[4].creator_group is None
+    assert [len(part) for part in batch.split(2)] == [2, 2, 1]
+    assert [issue for part in batch.split(2) for issue in part] == issues
@@ -0,0 +1,66 @@
+import threading
+import time
+import pytest
+from src.processing.batch import BatchProcessor
+
+def test_process_stream_sequential_batches():
+    """Test that a stream is sliced lazily into batch_size batches"""
+    processor = BatchProcessor(batch_size=2, max_consecutive_failures=3)
+
+    results = list(processor.process_stream(iter(range(5)), lambda batch: [x * 10 for x in batch]))
+
+    assert [r.input_items for r in results] == [[0, 1], [2, 3], [4]]
+    assert [r.output_items for r in results] == [[0, 10], [20, 30], [40]]
+
+def test_process_batches_keeps_prebuilt_batches():
+    """Test that prebuilt batches are passed through whole rather than re-sliced"""
+    processor = BatchProcessor(batch_size=2, max_consecutive_failures=3, max_in_flight_batches=2)
+    batches = [(1, 2, 3), (4,)]
+
+    results = list(processor.process_batches(iter(batches), lambda batch: batch[:1]))
+
+    assert [r.input_items for r in results] == batches
+    assert [r.input_items is b for r, b in zip(results, batches)] == [True, True]
+    assert [r.output_items for r in results] == [(1,), (4,)]
+
+def test_concurrent_batches_overlap_and_preserve_order():
+    """Test that batches run concurrently while results keep input order"""
+    lock = threading.Lock()
+    state = {"active": 0, "peak": 0}
+
+    def slow(batch):
+        with lock:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        # Earlier batches finish last to exercise reordering
+        time.sleep(0.05 - batch[0] * 0.005)
+        with lock:
+            state["active"] -= 1
+        return batch
+
+    processor = BatchProcessor(batch_size=1, max_consecutive_failures=3, max_in_flight_batches=4)
+    results = list(processor.process_stream(range(8), slow))
+
+    assert [r.input_items[0] for r in results] == list(range(8))
+    assert state["peak"] > 1
+
+def test_concurrent_batches_abort_on_consecutive_failures():
+    """Test that max_consecutive_failures still aborts in concurrent mode"""
+
+    def failing(batch):
+        if batch[0] >= 2:
+            raise ValueError("boom")
+        return batch
+
+    processor = BatchProcessor(
+        batch_size=1,
+        max_consecutive_failures=2,
+        max_in_flight_batches=3,
+        preserve_order=False
+    )
+    seen = []
+    with pytest.raises(Exception, match="Max consecutive failures"):
+        for result in processor.process_stream(range(100), failing):
+            seen.append(result)
+
+    assert len(seen) < 100
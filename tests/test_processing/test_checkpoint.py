@@ -0,0 +1,56 @@
+from src.processing.checkpoint import CheckpointJournal
+
+def test_checkpoint_resume_restores_completed_ids(tmp_path):
+    """Test that a reopened journal knows every completed id and the last cursor"""
+    path = str(tmp_path / "checkpoint.jsonl")
+
+    journal = CheckpointJournal(path, sync_interval=60)
+    journal.record_batch(["ISSUE-1", "ISSUE-2"], cursor="ISSUE-2")
+    journal.record_batch(["ISSUE-4"], cursor="ISSUE-4")
+    journal.record_batch(["ISSUE-5"])
+    journal.close()
+
+    resumed = CheckpointJournal(path, resume=True)
+    assert resumed.is_completed("ISSUE-1")
+    assert not resumed.is_completed("ISSUE-3")
+    assert resumed.is_completed("ISSUE-5")
+    assert resumed.state.cursor == "ISSUE-4"
+    assert resumed.state.batches == 3
+    resumed.close()
+
+def test_checkpoint_resume_restores_latest_source_positions(tmp_path):
+    """Test that the positions recorded last survive a reopen, however many records follow them"""
+    path = str(tmp_path / "checkpoint.jsonl")
+
+    journal = CheckpointJournal(path, sync_interval=60)
+    journal.record_batch(["1", "2"], positions={"partitions": 2, "keys": {"0": 2}})
+    journal.record_batch(["3"], positions={"partitions": 2, "keys": {"0": 2, "1": 3}})
+    journal.record_batch(["5"])
+    journal.close()
+
+    resumed = CheckpointJournal(path, resume=True)
+    assert resumed.state.positions == {"partitions": 2, "keys": {"0": 2, "1": 3}}
+    assert resumed.state.cursor is None
+    resumed.close()
+
+def test_checkpoint_discards_torn_record(tmp_path):
+    """Test that a partially written final record is truncated before appending"""
+    path = tmp_path / "checkpoint.jsonl"
+    path.write_text('{"cursor":"ISSUE-1","ids":["ISSUE-1"]}\n{"cursor":"ISSUE-2","ids":["ISS')
+
+    journal = CheckpointJournal(str(path), resume=True)
+    assert journal.state.completed_ids == {"ISSUE-1"}
+    journal.record_batch(["ISSUE-2"], cursor="ISSUE-2")
+    journal.close()
+
+    assert CheckpointJournal(str(path), resume=True).state.completed_ids == {"ISSUE-1", "ISSUE-2"}
+
+def test_checkpoint_without_resume_starts_fresh(tmp_path):
+    """Test that opening without resume discards the previous journal"""
+    path = tmp_path / "checkpoint.jsonl"
+    path.write_text('{"cursor":"ISSUE-1","ids":["ISSUE-1"]}\n')
+
+    journal = CheckpointJournal(str(path))
+    journal.close()
+
+    assert path.read_text() == ""
@@ -0,0 +1,71 @@
+import json
+from src.processing.dry_run import DryRunProcessor
+
+class RecordingLogger:
+    def __init__(self):
+        self.messages = []
+
+    def info(self, message, **kwargs):
+        self.messages.append(message)
+
+    warning = info
+
+def test_operations_stream_to_plan_file_with_counters(tmp_path):
+    """Test that operations are written as JSONL and summarised without being kept"""
+    plan_path = str(tmp_path / "plan.jsonl")
+    processor = DryRunProcessor(RecordingLogger(), plan_path=plan_path)
+
+    processor.record_operation("update", "issue/ISSUE-1", {"creator_group": "GROUP-1"})
+    processor.record_operation("update", "issue/ISSUE-2", {"creator_group": "GROUP-2"}, would_execute=False)
+    assert not (tmp_path / "plan.jsonl").exists()
+    processor.close()
+
+    with open(plan_path) as f:
+        records = [json.loads(line) for line in f]
+    assert records == [
+        {"operation": "update", "target": "issue/ISSUE-1", "params": {"creator_group": "GROUP-1"}},
+        {"operation": "update", "target": "issue/ISSUE-2", "params": {"creator_group": "GROUP-2"},
+         "would_execute": False}
+    ]
+    assert processor.get_summary() == {
+        "total_operations": 2,
+        "operations_by_type": {"update": 2},
+        "would_execute": 1,
+        "would_skip": 1,
+        "plan_path": plan_path
+    }
+
+def test_log_output_is_sampled():
+    """Test that only one in log_sample_every operations is logged"""
+    logger = RecordingLogger()
+    processor = DryRunProcessor(logger, log_sample_every=100)
+
+    for i in range(250):
+        processor.record_operation("update", f"issue/ISSUE-{i}", {"creator_group": "GROUP-1"})
+
+    assert logger.messages == [
+        "DRY RUN: Would update issue/ISSUE-0",
+        "DRY RUN: Would update issue/ISSUE-100",
+        "DRY RUN: Would update issue/ISSUE-200"
+    ]
+
+def test_empty_run_replaces_stale_plan(tmp_path):
+    """Test that a dry run with nothing to do doesn't leave an older plan behind"""
+    plan_path = tmp_path / "plan.jsonl"
+    plan_path.write_text('{"operation":"update"}\n')
+
+    DryRunProcessor(RecordingLogger(), plan_path=str(plan_path)).close()
+
+    assert plan_path.read_text() == ""
+
+def test_incomplete_run_does_not_publish_plan(tmp_path):
+    """Test that a run closed as incomplete leaves the previous plan and only a .tmp file"""
+    plan_path = tmp_path / "plan.jsonl"
+    plan_path.write_text('{"operation":"update","target":"issue/OLD"}\n')
+    processor = DryRunProcessor(RecordingLogger(), plan_path=str(plan_path))
+
+    processor.record_operation("update", "issue/ISSUE-1", {"creator_group": "GROUP-1"})
+    processor.close(complete=False)
+
+    assert plan_path.read_text() == '{"operation":"update","target":"issue/OLD"}\n'
+    assert "issue/ISSUE-1" in (tmp_path / "plan.jsonl.tmp").read_text()
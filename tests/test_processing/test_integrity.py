@@ -0,0 +1,109 @@
+from src.models import Issue
+from src.processing.integrity import DataIntegrityChecker
+
+def issue(issue_id, group):
+    return Issue(issue_id=issue_id, creator_user_id="USER-1", assigned_group="GROUP-A", creator_group=group)
+
+def test_field_verification_joins_on_issue_id():
+    """Test that read-back results are matched by id regardless of order"""
+    checker = DataIntegrityChecker()
+    expected = [issue("ISSUE-1", "GROUP-1"), issue("ISSUE-2", "GROUP-2"), issue("ISSUE-3", "GROUP-3")]
+    fetched = [issue("ISSUE-3", "GROUP-3"), issue("ISSUE-1", "GROUP-1"), issue("ISSUE-2", "GROUP-2")]
+
+    result = checker.verify_field_updates(expected, fetched, "creator_group")
+
+    assert result.passed
+    assert result.details["updates_verified"] == 3
+
+def test_field_verification_reports_wrong_and_missing_but_not_unverified():
+    """Test that wrong values and missing issues fail while unread ids are only counted"""
+    checker = DataIntegrityChecker()
+    expected = [issue("ISSUE-1", "GROUP-1"), issue("ISSUE-2", "GROUP-2"),
+                issue("ISSUE-3", "GROUP-3"), issue("ISSUE-4", "GROUP-4")]
+    fetched = [issue("ISSUE-2", None), issue("ISSUE-1", "GROUP-1")]
+
+    result = checker.verify_field_updates(expected, fetched, "creator_group", unverified_ids=["ISSUE-4"])
+
+    assert not result.passed
+    assert result.mismatches == [
+        "Field creator_group mismatch for issue ISSUE-2: GROUP-2 vs None",
+        "Issue ISSUE-3 not found when verifying creator_group"
+    ]
+    assert result.details["unverified"] == 1
+
+def test_required_sample_size():
+    """Test Cochran sizing with and without a finite population"""
+    from src.processing.integrity import required_sample_size
+
+    assert required_sample_size(0.95, 0.01) == 9604
+    assert required_sample_size(0.95, 0.05, population=1000) == 278
+
+def test_sampling_is_stratified_and_reports_interval():
+    """Test that every group is represented and a clean sample yields a tight interval"""
+    checker = DataIntegrityChecker(mode="sample", error_bound=0.05, min_per_stratum=3, seed=1)
+    checker.begin(10000)
+    batch = [issue(f"ISSUE-{i}", "GROUP-BIG" if i % 100 else "GROUP-SMALL") for i in range(10000)]
+
+    selected = checker.select_for_verification(batch)
+    checker.verify_batch(selected, selected)
+    report = checker.sampling_report()
+
+    assert 300 < len(selected) < 450
+    assert checker.strata["GROUP-SMALL"].sampled >= 3
+    assert report["estimated_mismatch_rate"] == 0.0
+    assert report["interval"][0] == 0.0 and report["interval"][1] < 0.02
+    assert not report["escalated"]
+
+def test_sample_mismatch_escalates_to_full_verification():
+    """Test that a mismatch in the sample switches later batches to full verification"""
+    checker = DataIntegrityChecker(mode="sample", min_per_stratum=1, seed=1)
+    first = [issue("ISSUE-1", "GROUP-1"), issue("ISSUE-2", "GROUP-1")]
+
+    selected = checker.select_for_verification(first)
+    assert [i.issue_id for i in selected] == ["ISSUE-1"]
+    result = checker.verify_batch(selected, [issue("ISSUE-1", None)])
+
+    assert not result.passed and checker.escalated
+    # The unsampled ISSUE-2 is handed back for re-verification, once
+    assert [[i.issue_id for i in chunk] for chunk in checker.take_spilled(10)] == [["ISSUE-2"]]
+    assert list(checker.take_spilled(10)) == []
+    second = [issue("ISSUE-3", "GROUP-1"), issue("ISSUE-4", "GROUP-2")]
+    assert checker.select_for_verification(second) == second
+    checker.verify_batch(second, second)
+    report = checker.sampling_report()
+    assert report["estimated_mismatch_rate"] == 1.0
+    assert report["fully_verified"] == 2 and report["full_mismatches"] == 0
+
+def test_unknown_total_samples_a_reservoir_for_the_end_of_the_run():
+    """Test that without a total the sample is a fixed-size reservoir drawn from every batch"""
+    checker = DataIntegrityChecker(mode="sample", error_bound=0.1, min_per_stratum=1, seed=1)
+    checker.begin(None)
+    assert checker.reservoir_size == 97
+
+    selected = []
+    for start in range(0, 1000, 100):
+        batch = [issue(f"ISSUE-{i}", "GROUP-1") for i in range(start, start + 100)]
+        selected += checker.select_for_verification(batch)
+    reservoir = checker.take_reservoir()
+
+    assert [i.issue_id for i in selected] == ["ISSUE-0"]
+    assert len(reservoir) == 97 and checker.take_reservoir() == []
+    # Later batches are represented, not just the first ones seen
+    assert max(int(i.issue_id.split("-")[1]) for i in reservoir) > 900
+    checker.verify_batch(selected + reservoir, selected + reservoir)
+    assert checker.sampling_report()["sampled"] == 98
+
+def test_reservoir_escalation_skips_issues_already_read_back():
+    """Test that a mismatch in the end-of-run reservoir re-verifies only the rest of the updates"""
+    checker = DataIntegrityChecker(mode="sample", error_bound=0.3, min_per_stratum=0, seed=1)
+    checker.begin(None)
+    checker.select_for_verification([issue(f"ISSUE-{i}", "GROUP-1") for i in range(30)])
+
+    reservoir = checker.take_reservoir()
+    checker.verify_batch(reservoir, [])
+    assert checker.escalated
+
+    spilled = [i.issue_id for chunk in checker.take_spilled(7) for i in chunk]
+    assert len(reservoir) == 11 and len(spilled) == 19
+    assert not set(spilled) & {i.issue_id for i in reservoir}
+    checker.close()
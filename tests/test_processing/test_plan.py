@@ -0,0 +1,28 @@
+import pytest
+from src.processing.plan import read_plan, PlanFormatError
+
+PLAN = (
+    '{"operation":"update","target":"issue/ISSUE-1","params":{"creator_group":"GROUP-1"}}\n'
+    '{"operation":"update","target":"issue/ISSUE-2","params":{"creator_group":"GROUP-2"},"would_execute":false}\n'
+    '{"operation":"update","target":"issue/ISSUE-3","params":{"creator_group":"GROUP-3"}}\n'
+)
+
+def test_read_plan_yields_updates_with_resume_offsets(tmp_path):
+    """Test that entries carry the offset to resume after them and skipped ones are dropped"""
+    path = tmp_path / "plan.jsonl"
+    path.write_text(PLAN)
+
+    entries = list(read_plan(str(path)))
+
+    assert [(e.issue_id, e.group_id) for e in entries] == [("ISSUE-1", "GROUP-1"), ("ISSUE-3", "GROUP-3")]
+    assert entries[-1].offset == len(PLAN)
+    resumed = list(read_plan(str(path), entries[0].offset))
+    assert [e.issue_id for e in resumed] == ["ISSUE-3"]
+
+def test_read_plan_reports_bad_line_offset(tmp_path):
+    """Test that a malformed entry fails with its byte offset"""
+    path = tmp_path / "plan.jsonl"
+    path.write_text(PLAN.splitlines(keepends=True)[0] + '{"operation":"update","target":"user/U1"}\n')
+
+    with pytest.raises(PlanFormatError, match="byte 85 "):
+        list(read_plan(str(path)))
@@ -0,0 +1,58 @@
+from src.processing.progress import ProgressTracker
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+class RecordingLogger:
+    def __init__(self):
+        self.records = []
+
+    def info(self, message, **kwargs):
+        self.records.append((message, kwargs))
+
+def test_log_mode_emits_periodic_lines_with_rate_and_eta():
+    """Test that headless mode logs at most once per interval with EWMA rate and ETA"""
+    clock = FakeClock()
+    logger = RecordingLogger()
+    tracker = ProgressTracker(1000, "Processing issues", refresh_rate=1, mode="log",
+                              log_interval=10, smoothing=1.0, logger=logger, clock=clock)
+
+    for second in range(1, 11):
+        clock.now = second
+        tracker.set_in_flight(20)
+        tracker.update("success", count=50)
+    assert len(logger.records) == 1
+
+    message, fields = logger.records[0]
+    assert message == "Processing issues"
+    assert fields["processed"] == 500
+    assert fields["issues_per_sec"] == 50.0
+    assert fields["eta_seconds"] == 10
+    assert fields["in_flight"] == 20
+
+    clock.now = 10.5
+    tracker.update("failed", count=10)
+    tracker.close()
+    assert len(logger.records) == 2
+    assert logger.records[1][1]["failed"] == 10
+
+def test_updates_between_refreshes_do_not_render():
+    """Test that per-item updates inside one refresh interval only count"""
+    clock = FakeClock()
+    logger = RecordingLogger()
+    tracker = ProgressTracker(None, refresh_rate=2, mode="log", log_interval=0,
+                              logger=logger, clock=clock)
+
+    for _ in range(1000):
+        tracker.update("success")
+    assert logger.records == []
+
+    clock.now = 0.5
+    tracker.update("success")
+    assert len(logger.records) == 1
+    assert logger.records[0][1]["processed"] == 1001
+    assert logger.records[0][1]["eta_seconds"] is None
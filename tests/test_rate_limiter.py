@@ -0,0 +1,118 @@
+import heapq
+import math
+from src.rate_limiter import TokenBucketRateLimiter, parse_retry_after
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+def test_token_bucket_paces_after_burst():
+    """Test that requests beyond the burst are spaced at the refill rate"""
+    clock = FakeClock()
+    waits = []
+    limiter = TokenBucketRateLimiter(rate=10, capacity=2, on_wait=waits.append, clock=clock, sleep=clock.sleep)
+
+    assert limiter.acquire() == 0
+    assert limiter.acquire() == 0
+    assert abs(limiter.acquire() - 0.1) < 1e-6
+    assert abs(limiter.acquire() - 0.1) < 1e-6
+    assert abs(clock.now - 0.2) < 1e-6
+    assert abs(limiter.total_wait_seconds - 0.2) < 1e-6
+    assert len(waits) == 2
+
+def test_token_bucket_queues_waiters_one_refill_apart():
+    """Test that callers arriving at an empty bucket are told to wait in turn, without borrowing tokens"""
+    clock = FakeClock()
+    limiter = TokenBucketRateLimiter(rate=10, capacity=1, max_wait_step=5, clock=clock)
+
+    assert limiter.try_acquire() == (0.0, None)
+    delays = [limiter.try_acquire() for _ in range(3)]
+    assert [ticket for _, ticket in delays] == [0, 1, 2]
+    assert [round(delay, 6) for delay, _ in delays] == [0.1, 0.2, 0.3]
+
+    clock.now = 0.1
+    assert limiter.try_acquire(0) == (0.0, None)
+
+    # The rate drops while the others sleep: they are repriced on waking instead of sending early
+    limiter.rate = 1
+    delay, ticket = limiter.try_acquire(1)
+    assert ticket == 1 and abs(delay - 1.0) < 1e-6
+
+    limiter.abandon(1)
+    delay, ticket = limiter.try_acquire(2)
+    assert ticket == 2 and abs(delay - 1.0) < 1e-6
+
+def test_token_bucket_adapts_to_headers():
+    """Test that rate follows x-ratelimit headers and blocks when the quota is spent"""
+    clock = FakeClock()
+    limiter = TokenBucketRateLimiter(rate=10, capacity=1, safety_factor=0.5, clock=clock, sleep=clock.sleep)
+
+    limiter.update_from_headers({'x-ratelimit-remaining': '100', 'x-ratelimit-reset': '10'})
+    assert limiter.rate == 5
+
+    # Too close to the reset to say anything about the next window
+    limiter.update_from_headers({'x-ratelimit-remaining': '1', 'x-ratelimit-reset': '0.836'})
+    limiter.update_from_headers({'x-ratelimit-remaining': '50', 'x-ratelimit-reset': '0.1'})
+    assert limiter.rate == 5
+
+    limiter.update_from_headers({'x-ratelimit-remaining': '0', 'x-ratelimit-reset': '3'})
+    assert limiter.acquire() >= 3
+
+def test_token_bucket_honors_retry_after():
+    """Test that a 429 with Retry-After blocks the bucket for that long"""
+    clock = FakeClock()
+    limiter = TokenBucketRateLimiter(rate=100, capacity=100, clock=clock, sleep=clock.sleep)
+
+    limiter.penalize('2')
+    assert 2 <= limiter.acquire() < 2.1
+    assert parse_retry_after('not a date') is None
+
+def test_token_bucket_keeps_pace_across_window_resets():
+    """Test that callers bursting above a 300/s server quota stay near it across window resets"""
+    clock = FakeClock()
+    quota, window, latency, duration = 300, 1.0, 0.02, 5.0
+    limiter = TokenBucketRateLimiter(rate=10000, capacity=10000, clock=clock)
+    # (time, caller, ticket or response headers)
+    events = [(0.0, caller, None) for caller in range(100)]
+    heapq.heapify(events)
+    sent = [0] * int(duration / window)
+    throttled = [0] * int(duration / window)
+    started = {}
+
+    while events:
+        clock.now, caller, pending = heapq.heappop(events)
+        if clock.now >= duration:
+            continue
+        if isinstance(pending, dict):
+            limiter.update_from_headers(pending)
+            if 'Retry-After' in pending:
+                limiter.penalize(pending['Retry-After'])
+            heapq.heappush(events, (clock.now, caller, None))
+            continue
+
+        started.setdefault(caller, clock.now)
+        delay, ticket = limiter.try_acquire(pending)
+        if ticket is not None:
+            heapq.heappush(events, (clock.now + delay, caller, ticket))
+            continue
+
+        assert clock.now - started.pop(caller) < 2 * window
+        index = math.floor(clock.now / window)
+        reset = f"{(index + 1) * window - clock.now:.3f}"
+        if sent[index] >= quota:
+            throttled[index] += 1
+            headers = {'x-ratelimit-remaining': '0', 'x-ratelimit-reset': reset, 'Retry-After': reset}
+        else:
+            sent[index] += 1
+            headers = {'x-ratelimit-remaining': str(quota - sent[index]), 'x-ratelimit-reset': reset}
+        heapq.heappush(events, (clock.now + latency, caller, headers))
+
+    # Only the opening burst overshoots; every window after it is used at least 90%
+    assert sum(throttled[1:]) == 0
+    assert min(sent) >= 0.9 * quota
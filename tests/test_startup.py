@@ -0,0 +1,39 @@
+import os
+import subprocess
+import sys
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), '..', 'src')
+HEAVY_MODULES = ('snowflake.connector', 'prometheus_client', 'tqdm', 'aiohttp', 'pyarrow')
+# Generous for slow CI machines; cold start was ~0.7s before lazy imports and ~0.2s after
+STARTUP_BUDGET_SECONDS = float(os.getenv('STARTUP_BUDGET_SECONDS', '0.5'))
+
+def run_python(*args):
+    env = {**os.environ, 'PYTHONPATH': os.pathsep.join(sys.path)}
+    return subprocess.run(
+        [sys.executable, *args], cwd=SRC_DIR, env=env,
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=True
+    )
+
+def test_main_does_not_import_heavy_dependencies():
+    """Test that importing main leaves Snowflake, Prometheus, tqdm and aiohttp unloaded"""
+    result = run_python('-c', f"import sys, main; print([m for m in {HEAVY_MODULES!r} if m in sys.modules])")
+    assert result.stdout.strip() == '[]'
+
+def test_recording_metrics_without_serving_them_does_not_import_prometheus():
+    """Test that a run without a metrics endpoint never loads prometheus_client"""
+    result = run_python('-c', (
+        "import sys; from monitoring.metrics import MetricsCollector; m = MetricsCollector(); "
+        "m.record_api_call(); m.record_request('works.update', '200', 0.1); m.record_batch_start(); "
+        "print('prometheus_client' in sys.modules)"
+    ))
+    assert result.stdout.strip() == 'False'
+
+def test_help_cold_start_within_budget():
+    """Test that `main.py --help` starts within the budget (best of three runs)"""
+    timings = []
+    for _ in range(3):
+        start = time.perf_counter()
+        run_python('main.py', '--help')
+        timings.append(time.perf_counter() - start)
+    assert min(timings) < STARTUP_BUDGET_SECONDS, f"cold start took {min(timings):.3f}s"
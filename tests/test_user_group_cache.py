@@ -0,0 +1,78 @@
+from src.user_group_cache import UserGroupCache
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+def make_cache(tmp_path, clock, max_entries=10, namespace="https://api.devrev.ai/internal"):
+    return UserGroupCache(
+        str(tmp_path / "cache.sqlite"),
+        namespace=namespace,
+        ttl_seconds=100,
+        negative_ttl_seconds=10,
+        max_entries=max_entries,
+        clock=clock
+    )
+
+def test_cache_persists_and_expires(tmp_path):
+    """Test positive and negative entries survive reopening and expire on their own TTLs"""
+    clock = FakeClock()
+    cache = make_cache(tmp_path, clock)
+    cache.put_many({'U1': 'GROUP-A', 'U2': None})
+    cache.close()
+
+    cache = make_cache(tmp_path, clock)
+    found, misses = cache.get_many(['U1', 'U2', 'U3'])
+    assert found == {'U1': 'GROUP-A', 'U2': None}
+    assert misses == ['U3']
+
+    clock.now += 50
+    found, misses = cache.get_many(['U1', 'U2'])
+    assert found == {'U1': 'GROUP-A'}
+    assert misses == ['U2']
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    """Test that the size bound evicts the entries read least recently"""
+    clock = FakeClock()
+    lookups = []
+    cache = make_cache(tmp_path, clock, max_entries=2)
+    cache.on_lookup = lambda hits, misses: lookups.append((hits, misses))
+
+    cache.put_many({'U1': 'GROUP-A'})
+    clock.now += 1
+    cache.put_many({'U2': 'GROUP-B'})
+    clock.now += 1
+    cache.get_many(['U1'])
+    clock.now += 1
+    cache.put_many({'U3': 'GROUP-C'})
+
+    found, misses = cache.get_many(['U1', 'U2', 'U3'])
+    assert found == {'U1': 'GROUP-A', 'U3': 'GROUP-C'}
+    assert misses == ['U2']
+    assert lookups == [(1, 0), (2, 1)]
+
+def test_cache_keeps_environments_apart(tmp_path):
+    """Test that entries cached against one base URL are not served to another"""
+    clock = FakeClock()
+    staging = make_cache(tmp_path, clock, max_entries=3, namespace="https://api.staging.devrev.ai/internal")
+    staging.put_many({'U1': 'STAGING-GROUP', 'U2': 'STAGING-GROUP'})
+    staging.close()
+
+    production = make_cache(tmp_path, clock, max_entries=3)
+    found, misses = production.get_many(['U1'])
+    assert found == {} and misses == ['U1']
+
+    production.put_many({'U1': 'PROD-GROUP'})
+    production.put_many({'U1': 'PROD-GROUP'})
+    clock.now += 1
+    production.put_many({'U3': 'PROD-GROUP'})
+    # Four entries across both environments: the least recently used staging one goes
+    assert production.get_many(['U1', 'U3']) == ({'U1': 'PROD-GROUP', 'U3': 'PROD-GROUP'}, [])
+    production.close()
+
+    staging = make_cache(tmp_path, clock, max_entries=3, namespace="https://api.staging.devrev.ai/internal")
+    found, _ = staging.get_many(['U1', 'U2'])
+    assert len(found) == 1 and set(found.values()) == {'STAGING-GROUP'}